@@ -0,0 +1,78 @@
+// Browser-source countdown. The app sends a `snapshot` when the stream
+// connects and then only the fields that changed (`delta`), so rendering
+// happens here instead of capturing the Qt overlay window.
+(function () {
+    "use strict";
+
+    var state = {};
+    var labels = {};
+    var lowSeconds = 3;
+    var alertTimeout = null;
+
+    var overlay = document.getElementById("overlay");
+    var title = document.getElementById("title");
+    var timer = document.getElementById("timer");
+    var bar = document.getElementById("bar");
+    var statusLabel = document.getElementById("status");
+
+    function setText(element, text) {
+        if (element.textContent !== text) {
+            element.textContent = text;
+        }
+    }
+
+    function render() {
+        var running = state.running && !state.paused;
+        var low = state.running && state.remaining <= lowSeconds;
+
+        overlay.classList.toggle("running", running);
+        overlay.classList.toggle("paused", !!state.paused);
+        overlay.classList.toggle("stopped", !state.running);
+        overlay.classList.toggle("low", low);
+
+        setText(title, labels.title || "");
+        setText(timer, String(state.remaining));
+        setText(statusLabel, (state.paused ? labels.paused : (state.running ? labels.running : labels.stopped)) || "");
+
+        if (state.paused) {
+            // Hold the bar where the animation got to
+            bar.style.width = window.getComputedStyle(bar).width;
+            return;
+        }
+        // While running the bar heads for where it will be at the next tick
+        var remaining = running ? Math.max(0, state.remaining - 1) : state.remaining;
+        var fraction = state.interval > 0 ? remaining / state.interval : 0;
+        bar.style.width = (fraction * 100).toFixed(2) + "%";
+    }
+
+    function flashAlert() {
+        overlay.classList.add("alert");
+        clearTimeout(alertTimeout);
+        alertTimeout = setTimeout(function () {
+            overlay.classList.remove("alert");
+        }, 1000);
+    }
+
+    // EventSource reconnects on its own and the app answers with a fresh snapshot
+    var source = new EventSource("/overlay/events");
+
+    source.addEventListener("snapshot", function (event) {
+        var data = JSON.parse(event.data);
+        labels = data.labels;
+        lowSeconds = data.low_seconds;
+        delete data.labels;
+        delete data.low_seconds;
+        state = data;
+        render();
+    });
+
+    source.addEventListener("delta", function (event) {
+        var delta = JSON.parse(event.data);
+        for (var key in delta) {
+            state[key] = delta[key];
+        }
+        render();
+    });
+
+    source.addEventListener("alert", flashAlert);
+})();
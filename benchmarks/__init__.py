@@ -0,0 +1,3 @@
+"""
+AoE4 Villager Reminder - Benchmarks
+"""
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Benchmark: alert-to-playback latency of the villager sound.
+
+Compares the previous path, which re-opened and re-decoded the WAV through
+`pygame.mixer.music` on every alert, with SoundBank playing a pre-decoded
+buffer on a reserved channel. Latency is the time from the alert call until
+the mixer has accepted the sound.
+
+Usage:
+    python benchmarks/bench_alert_latency.py [alerts]
+"""
+
+import sys
+import os
+import statistics
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import pygame
+
+from src.services.sound_bank import SoundBank
+
+SOUND_FILE = os.path.join(os.path.dirname(__file__), '..', 'assets', 'sounds', 'villager.wav')
+
+
+def legacy_play():
+    """The alert path as it was before SoundBank."""
+    if os.path.exists(SOUND_FILE):
+        pygame.mixer.music.load(SOUND_FILE)
+        pygame.mixer.music.set_volume(0.7)
+        pygame.mixer.music.play()
+
+
+def measure(fn, alerts: int):
+    """Return (median, p95, max) latency in microseconds."""
+    samples = []
+    for _ in range(alerts):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1e6)
+    samples.sort()
+    return statistics.median(samples), samples[int(len(samples) * 0.95) - 1], samples[-1]
+
+
+def main():
+    alerts = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    pygame.mixer.init()
+    
+    bank = SoundBank()
+    bank.register("alert", os.path.abspath(SOUND_FILE))
+    preload_start = time.perf_counter()
+    bank.preload()
+    preload_ms = (time.perf_counter() - preload_start) * 1000
+    
+    legacy = measure(legacy_play, alerts)
+    pygame.mixer.music.stop()
+    banked = measure(lambda: bank.play("alert", 0.7), alerts)
+    
+    print("=" * 60)
+    print(f"Alert sound latency ({alerts} alerts, driver: {os.environ.get('SDL_AUDIODRIVER', 'default')})")
+    print("=" * 60)
+    print(f"{'':24}{'median':>10}{'p95':>10}{'max':>10}  (us)")
+    print(f"{'music.load per alert':24}{legacy[0]:10.1f}{legacy[1]:10.1f}{legacy[2]:10.1f}")
+    print(f"{'SoundBank (in memory)':24}{banked[0]:10.1f}{banked[1]:10.1f}{banked[2]:10.1f}")
+    print(f"Median speedup:          {legacy[0] / banked[0]:10.1f}x")
+    print(f"One-time decode:         {preload_ms:10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
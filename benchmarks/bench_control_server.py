@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Server-Sent Events fan-out of timer ticks to many subscribers.
+
+Connects 1, 10 and 100 local event-stream clients to a `ControlServer` and
+publishes ticks, timing the publish call (CPU time) and counting JSON
+encodings per event. "shared" is the server's own path, one encoded payload
+written to every socket; "per client" encodes the event again for each
+subscriber, as a naive per-connection handler would. Clients are drained
+between ticks so socket buffers never fill up. Also compares the bytes a
+browser-source overlay receives per tick from the delta stream with a full
+state event.
+
+Usage:
+    python benchmarks/bench_control_server.py [ticks]
+"""
+
+import sys
+import os
+import socket
+import statistics
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+os.environ.setdefault("APPDATA", tempfile.mkdtemp())
+
+from PyQt6.QtCore import QCoreApplication
+
+from src.services.control_server import ControlServer, STREAM_EVENTS, encode_event
+from src.services.game_detector import GameDetector
+from src.services.timer_service import TimerService
+
+
+def connect_clients(app, server, count: int):
+    clients = []
+    for _ in range(count):
+        sock = socket.create_connection(("127.0.0.1", server.port))
+        sock.sendall(f"GET /events HTTP/1.1\r\nHost: 127.0.0.1:{server.port}\r\n\r\n".encode())
+        sock.setblocking(False)
+        clients.append(sock)
+        while server.subscriber_count < len(clients):
+            app.processEvents()
+    return clients
+
+
+def drain(clients):
+    for sock in clients:
+        try:
+            while sock.recv(65536):
+                pass
+        except BlockingIOError:
+            pass
+
+
+def publish_per_client(server, event: str, data):
+    for subscriber in server._streams[STREAM_EVENTS]:
+        subscriber.write(encode_event(event, data))
+
+
+def measure(app, server, clients, ticks: int, shared: bool):
+    samples = []
+    encodings = server.serialize_count
+    for i in range(ticks):
+        data = {"remaining": 25 - i % 25}
+        start = time.process_time()
+        if shared:
+            server.publish("tick", data)
+        else:
+            publish_per_client(server, "tick", data)
+        samples.append((time.process_time() - start) * 1_000_000)
+        app.processEvents()
+        drain(clients)
+    per_event = (server.serialize_count - encodings) / ticks if shared else len(clients)
+    return statistics.mean(samples), per_event
+
+
+def main():
+    ticks = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    app = QCoreApplication(sys.argv[:1])
+    timer_service = TimerService()
+    game_detector = GameDetector()
+    server = ControlServer(timer_service, game_detector, lambda command: None)
+    server.start(0)
+    
+    print("=" * 60)
+    print(f"SSE tick fan-out ({ticks} ticks, mean publish CPU time)")
+    print("=" * 60)
+    print(f"{'subscribers':>11}{'shared':>14}{'per client':>14}{'encodes/event':>16}")
+    clients = []
+    for count in (1, 10, 100):
+        clients += connect_clients(app, server, count - len(clients))
+        shared_us, shared_encodes = measure(app, server, clients, ticks, shared=True)
+        naive_us, naive_encodes = measure(app, server, clients, ticks, shared=False)
+        print(f"{count:>11}{shared_us:11.1f} µs{naive_us:11.1f} µs{shared_encodes:>9.0f} vs {naive_encodes:.0f}")
+    
+    full = encode_event("state", server.state())
+    delta = encode_event("delta", {"remaining": 24})
+    print()
+    print(f"Overlay bytes per tick: {len(delta)} (delta) vs {len(full)} (full state)")
+    
+    for sock in clients:
+        sock.close()
+    server.stop()
+    game_detector.shutdown()
+
+
+if __name__ == "__main__":
+    main()
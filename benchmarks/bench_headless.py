@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Benchmark: headless mode against the GUI build.
+
+Each run launches a fresh interpreter that builds either `MainWindow`
+(shown, under a QApplication) or `HeadlessApp` (under a QCoreApplication),
+runs the event loop until it is idle and reports the time from interpreter
+start to that point, the construction time of the app object, the resident
+memory once idle and whether QtWidgets was loaded.
+
+Usage:
+    python benchmarks/bench_headless.py [runs]
+"""
+
+import sys
+import os
+import json
+import statistics
+import subprocess
+import tempfile
+import time
+
+ROOT = os.path.join(os.path.dirname(__file__), '..')
+
+
+def child(mode: str):
+    """Measure one startup inside this process and print JSON results."""
+    start = time.perf_counter()
+    sys.path.insert(0, ROOT)
+    
+    from PyQt6.QtCore import QTimer
+    
+    if mode == "gui":
+        from PyQt6.QtWidgets import QApplication
+        app = QApplication(sys.argv[:1])
+        from src.ui.main_window import MainWindow
+        build_start = time.perf_counter()
+        target = MainWindow()
+        target.show()
+        shutdown = target._quit_app
+    else:
+        from PyQt6.QtCore import QCoreApplication
+        app = QCoreApplication(sys.argv[:1])
+        from src.headless import HeadlessApp
+        build_start = time.perf_counter()
+        target = HeadlessApp()
+        shutdown = target.shutdown
+    build_ms = (time.perf_counter() - build_start) * 1000
+    
+    results = {}
+    
+    def idle():
+        results["ready_ms"] = (time.perf_counter() - start) * 1000
+        app.quit()
+    
+    QTimer.singleShot(0, idle)
+    app.exec()
+    
+    import psutil
+    results["build_ms"] = build_ms
+    results["rss_mb"] = psutil.Process().memory_info().rss / (1024 * 1024)
+    results["qtwidgets"] = "PyQt6.QtWidgets" in sys.modules
+    shutdown()
+    print(json.dumps(results))
+
+
+def run(mode: str, runs: int):
+    env = dict(os.environ)
+    env.setdefault("SDL_AUDIODRIVER", "dummy")
+    with tempfile.TemporaryDirectory() as app_data:
+        # Keep config/statistics of the benchmark out of the user's profile
+        env["APPDATA"] = app_data
+        env["HOME"] = app_data
+        samples = []
+        for _ in range(runs):
+            output = subprocess.run([sys.executable, __file__, "--child", mode], env=env,
+                                    capture_output=True, text=True, check=True).stdout
+            samples.append(json.loads(output.strip().splitlines()[-1]))
+    return samples
+
+
+def main():
+    if len(sys.argv) > 2 and sys.argv[1] == "--child":
+        child(sys.argv[2])
+        return
+    
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    results = {mode: run(mode, runs) for mode in ("gui", "headless")}
+    
+    print("=" * 60)
+    print(f"Headless vs GUI benchmark (median of {runs} runs)")
+    print("=" * 60)
+    print(f"{'':12}{'ready':>12}{'build':>12}{'RSS':>13}{'QtWidgets':>11}")
+    for mode, samples in results.items():
+        ready = statistics.median(s["ready_ms"] for s in samples)
+        build = statistics.median(s["build_ms"] for s in samples)
+        rss = statistics.median(s["rss_mb"] for s in samples)
+        widgets = "loaded" if samples[0]["qtwidgets"] else "no"
+        print(f"{mode:12}{ready:9.1f} ms{build:9.1f} ms{rss:10.1f} MB{widgets:>11}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-tick frame cost of the in-game overlay.
+
+Drives the stylesheet overlay (`OverlayWidget`) and the custom-painted one
+(`PaintedOverlayWidget`) through countdowns, timing `update_timer` plus the
+event processing that polishes and paints the result, and counting paint
+events and repainted pixels per tick.
+
+Usage:
+    python benchmarks/bench_overlay_frame.py [ticks]
+"""
+
+import sys
+import os
+import statistics
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+os.environ.setdefault("APPDATA", tempfile.mkdtemp())
+
+from PyQt6.QtCore import QEvent, QObject
+from PyQt6.QtWidgets import QApplication
+
+from src.ui.overlay_widget import OverlayWidget
+from src.ui.painted_overlay import PaintedOverlayWidget
+
+
+class PaintCounter(QObject):
+    """Counts paint events and repainted area for a widget and its children."""
+    
+    def __init__(self, root):
+        super().__init__()
+        self._root = root
+        self.events = 0
+        self.pixels = 0
+    
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Type.Paint and (obj is self._root or self._root.isAncestorOf(obj)):
+            self.events += 1
+            self.pixels += event.rect().width() * event.rect().height()
+        return False
+
+
+def measure(app, overlay_class, ticks: int):
+    overlay = overlay_class()
+    overlay.set_running(True)
+    overlay.show()
+    for _ in range(5):
+        app.processEvents()
+    
+    counter = PaintCounter(overlay)
+    app.installEventFilter(counter)
+    samples = []
+    for i in range(ticks):
+        seconds = 25 - i % 25
+        start = time.perf_counter()
+        overlay.update_timer(seconds)
+        app.processEvents()
+        samples.append((time.perf_counter() - start) * 1e6)
+    app.removeEventFilter(counter)
+    overlay.close()
+    
+    samples.sort()
+    return {
+        "median_us": statistics.median(samples),
+        "p95_us": samples[int(len(samples) * 0.95)],
+        "paints": counter.events / ticks,
+        "pixels": counter.pixels / ticks,
+    }
+
+
+def main():
+    ticks = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    
+    print("=" * 60)
+    print(f"Overlay frame cost per timer tick ({ticks} ticks)")
+    print("=" * 60)
+    print(f"{'renderer':<12}{'median us':>11}{'p95 us':>10}{'paints':>9}{'pixels':>10}")
+    for label, overlay_class in (("stylesheet", OverlayWidget), ("painted", PaintedOverlayWidget)):
+        result = measure(app, overlay_class, ticks)
+        print(f"{label:<12}{result['median_us']:>11.1f}{result['p95_us']:>10.1f}"
+              f"{result['paints']:>9.1f}{result['pixels']:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
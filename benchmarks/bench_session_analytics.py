@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Benchmark: session analytics over large histories.
+
+Builds an SQLite statistics store with tens of thousands of sessions and
+times the vectorised analytics (cold, i.e. after `stats_updated`, and
+cached) against the same statistics computed with plain Python loops.
+
+Usage:
+    python benchmarks/bench_session_analytics.py [sessions]
+"""
+
+import sys
+import os
+import random
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from PyQt6.QtCore import QCoreApplication
+
+from src.services.session_analytics import SessionAnalytics, SessionColumns, COLUMN_ALERTS_PER_MINUTE
+from src.services.stats_tracker import StatsTracker
+from src.services.stats_store import SqliteStatsStore
+from src.utils.constants import STATS_BACKEND_SQLITE, STATS_DB_FILE
+
+
+def synthetic_history(count: int):
+    rng = random.Random(count)
+    start = datetime(2015, 1, 1, 18, 0, 0)
+    history = []
+    for _ in range(count):
+        start += timedelta(hours=rng.choice((2, 3, 5, 20, 26, 50)))
+        duration = rng.uniform(600, 3600)
+        history.append({
+            "date": start.isoformat(),
+            "duration_seconds": duration,
+            "alerts": int(duration / 60 * rng.uniform(0.8, 2.5)),
+        })
+    return history
+
+
+def python_analytics(history):
+    """The same statistics with per-session Python loops."""
+    rates = [s["alerts"] / (s["duration_seconds"] / 60) for s in history]
+    ordered = sorted(rates)
+    percentiles = [ordered[int(p / 100 * (len(ordered) - 1))] for p in (25, 50, 75, 90)]
+    
+    rolling, window = [], 10
+    for i in range(len(rates)):
+        chunk = rates[max(0, i - window + 1):i + 1]
+        rolling.append(sum(chunk) / len(chunk))
+    
+    heatmap = [[0] * 24 for _ in range(7)]
+    days = set()
+    xs = []
+    for s in history:
+        when = datetime.fromisoformat(s["date"])
+        heatmap[when.weekday()][when.hour] += 1
+        days.add(when.date().toordinal())
+        xs.append(when.timestamp() / 86400)
+    
+    longest = run = 0
+    previous = None
+    for day in sorted(days):
+        run = run + 1 if previous is not None and day == previous + 1 else 1
+        longest = max(longest, run)
+        previous = day
+    
+    x_mean, y_mean = statistics.fmean(xs), statistics.fmean(rates)
+    slope = sum((x - x_mean) * (y - y_mean) for x, y in zip(xs, rates)) / sum((x - x_mean) ** 2 for x in xs)
+    return percentiles, rolling, heatmap, longest, slope
+
+
+def run_all(analytics: SessionAnalytics):
+    analytics.summary()
+    analytics.percentiles()
+    analytics.rolling_average(COLUMN_ALERTS_PER_MINUTE, 10)
+    analytics.heatmap()
+
+
+def measure(fn, repeat: int) -> float:
+    """Return mean milliseconds per call."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        history = synthetic_history(count)
+        store = SqliteStatsStore(os.path.join(tmp, STATS_DB_FILE))
+        store.import_json_stats({"session_history": history})
+        store.close()
+        
+        tracker = StatsTracker(stats_path=os.path.join(tmp, "statistics.json"), backend=STATS_BACKEND_SQLITE)
+        analytics = SessionAnalytics(tracker)
+        
+        def cold():
+            tracker.stats_updated.emit()
+            run_all(analytics)
+        
+        loaded = tracker.get_session_history()
+        python_ms = measure(lambda: python_analytics(loaded), 3)
+        load_ms = measure(lambda: SessionColumns.from_rows(tracker.store.session_rows()), 5)
+        cold_ms = measure(cold, 5)
+        run_all(analytics)
+        cached_ms = measure(lambda: run_all(analytics), 1000)
+        tracker.close()
+    
+    print("=" * 60)
+    print(f"Session analytics benchmark ({count} sessions, ms)")
+    print("=" * 60)
+    print(f"{'Python loops (history in memory)':<40}{python_ms:>10.2f}")
+    print(f"{'NumPy, after stats_updated':<40}{cold_ms:>10.2f}")
+    print(f"{'  of which loading history':<40}{load_ms:>10.2f}")
+    print(f"{'Cached (tab switch)':<40}{cached_ms:>10.4f}")
+    del app
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Benchmark: timer/detector/stats pipeline on a virtual clock.
+
+Replays hours of matches through SimulationDriver and reports simulation
+speed and how the cost per simulated hour grows with session history.
+
+Usage:
+    python benchmarks/bench_simulation.py [matches]
+"""
+
+import sys
+import os
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from PyQt6.QtCore import QCoreApplication
+
+from src.services.simulation import SimulationDriver, generate_match_script
+from src.services.stats_tracker import StatsTracker
+from src.utils.clock import VirtualClock
+
+
+def run(matches: int, with_stats: bool):
+    clock = VirtualClock()
+    with tempfile.TemporaryDirectory() as tmp:
+        stats = None
+        if with_stats:
+            stats = StatsTracker(stats_path=os.path.join(tmp, "statistics.json"), clock=clock)
+        driver = SimulationDriver(clock, stats_tracker=stats)
+        return driver.run(generate_match_script(matches, seed=1))
+
+
+def main():
+    app = QCoreApplication.instance() or QCoreApplication([])
+    matches = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    
+    print("=" * 60)
+    print(f"Simulation benchmark ({matches} matches)")
+    print("=" * 60)
+    print(f"{'pipeline':<26}{'sim hours':>10}{'wall s':>10}{'speedup':>12}{'alerts':>10}")
+    for label, with_stats in (("timer + detector", False), ("timer + detector + stats", True)):
+        report = run(matches, with_stats)
+        print(f"{label:<26}{report.simulated_seconds / 3600:>10.1f}{report.wall_seconds:>10.3f}"
+              f"{report.speedup:>11.0f}x{report.alerts:>10}")
+    
+    print("\nScaling with session history (stats enabled):")
+    print(f"{'matches':>10}{'wall s':>10}{'ms per sim hour':>18}")
+    for count in (10, 50, 100, 200):
+        report = run(count, True)
+        per_hour = report.wall_seconds * 1000 / (report.simulated_seconds / 3600)
+        print(f"{count:>10}{report.wall_seconds:>10.3f}{per_hour:>18.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Benchmark: application startup to first paint of MainWindow.
+
+Each run launches a fresh interpreter so import costs are included. The
+"eager" variant imports pygame and opens the mixer before building the
+window, as NotificationService used to at import time; "deferred" is the
+current startup, where audio loads on a worker after the window is shown.
+For the current startup it also reports the cold-start milliseconds of
+each `MainWindow.__init__` phase and what the settings tab, statistics tab
+and overlay cost when they are first opened (they are no longer built
+before the first paint).
+
+Usage:
+    python benchmarks/bench_startup.py [runs]
+"""
+
+import sys
+import os
+import json
+import statistics
+import subprocess
+import tempfile
+import time
+
+ROOT = os.path.join(os.path.dirname(__file__), '..')
+
+
+def child(mode: str):
+    """Measure one startup inside this process and print JSON timings."""
+    start = time.perf_counter()
+    sys.path.insert(0, ROOT)
+    
+    from PyQt6.QtCore import QEvent, QObject, QTimer
+    from PyQt6.QtWidgets import QApplication
+    
+    app = QApplication(sys.argv[:1])
+    if mode == "eager":
+        import pygame
+        pygame.mixer.init()
+    
+    import_start = time.perf_counter()
+    from src.ui.main_window import MainWindow
+    import_ms = (time.perf_counter() - import_start) * 1000
+    
+    window = MainWindow()
+    timings = {}
+    
+    class FirstPaint(QObject):
+        def eventFilter(self, obj, event):
+            if event.type() == QEvent.Type.Paint and "first_paint_ms" not in timings:
+                timings["first_paint_ms"] = (time.perf_counter() - start) * 1000
+                QTimer.singleShot(0, app.quit)
+            return False
+    
+    paint_filter = FirstPaint()
+    window.installEventFilter(paint_filter)
+    window.show()
+    app.exec()
+    
+    timings["import_ms"] = import_ms
+    timings["phases"] = window.startup_timings
+    on_demand = {}
+    for name, build in (("settings tab", lambda: window.settings_panel),
+                        ("statistics tab", lambda: window.stats_panel),
+                        ("overlay", lambda: window.overlay)):
+        build_start = time.perf_counter()
+        build()
+        on_demand[name] = (time.perf_counter() - build_start) * 1000
+    timings["on_demand"] = on_demand
+    window._quit_app()
+    print(json.dumps(timings))
+
+
+def run(mode: str, runs: int):
+    env = dict(os.environ)
+    with tempfile.TemporaryDirectory() as app_data:
+        # Keep config/statistics of the benchmark out of the user's profile
+        env["APPDATA"] = app_data
+        env["HOME"] = app_data
+        samples = []
+        for _ in range(runs):
+            output = subprocess.run([sys.executable, __file__, "--child", mode], env=env,
+                                    capture_output=True, text=True, check=True).stdout
+            samples.append(json.loads(output.strip().splitlines()[-1]))
+    return samples
+
+
+def median_of(samples, *keys):
+    values = []
+    for sample in samples:
+        for key in keys:
+            sample = sample[key]
+        values.append(sample)
+    return statistics.median(values)
+
+
+def main():
+    if len(sys.argv) > 2 and sys.argv[1] == "--child":
+        child(sys.argv[2])
+        return
+    
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    eager = run("eager", runs)
+    deferred = run("deferred", runs)
+    eager_paint, eager_import = median_of(eager, "first_paint_ms"), median_of(eager, "import_ms")
+    deferred_paint, deferred_import = median_of(deferred, "first_paint_ms"), median_of(deferred, "import_ms")
+    
+    print("=" * 60)
+    print(f"Startup benchmark (median of {runs} runs)")
+    print("=" * 60)
+    print(f"{'':28}{'first paint':>14}{'UI import':>12}")
+    print(f"{'Eager pygame mixer init':28}{eager_paint:11.1f} ms{eager_import:9.1f} ms")
+    print(f"{'Deferred (worker) init':28}{deferred_paint:11.1f} ms{deferred_import:9.1f} ms")
+    print(f"Time to first paint saved:  {eager_paint - deferred_paint:11.1f} ms")
+    
+    print()
+    print("MainWindow.__init__ phases (deferred)")
+    for phase in deferred[0]["phases"]:
+        print(f"  {phase:26}{median_of(deferred, 'phases', phase):11.1f} ms")
+    print("Built on first use, after the first paint")
+    for name in deferred[0]["on_demand"]:
+        print(f"  {name:26}{median_of(deferred, 'on_demand', name):11.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Benchmark: date-range statistics over multi-year histories.
+
+Compares summing the daily statistics dict for each query (how range stats
+were computed before) and an SQLite SUM over the indexed daily table with
+DailyRollup's prefix sums, for spans from a week to the whole history.
+
+Usage:
+    python benchmarks/bench_stats_rollup.py [repeat]
+"""
+
+import sys
+import os
+import random
+import tempfile
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.services.stats_rollup import DailyRollup
+from src.services.stats_store import SqliteStatsStore
+
+
+def synthetic_daily(years: int):
+    rng = random.Random(years)
+    end = date(2025, 1, 1)
+    daily = {}
+    for i in range(years * 365):
+        day = end - timedelta(days=i)
+        if rng.random() < 0.8:
+            sessions = rng.randrange(1, 6)
+            daily[day.isoformat()] = {
+                "alerts": sessions * rng.randrange(40, 90),
+                "time_seconds": sessions * rng.uniform(900, 2700),
+                "sessions": sessions,
+            }
+    return end, daily
+
+
+def dict_scan(daily, start, end):
+    """Range sum as a scan over the daily dict."""
+    first, last = start.isoformat(), end.isoformat()
+    alerts = time_seconds = sessions = 0
+    for day, stats in daily.items():
+        if first <= day <= last:
+            alerts += stats["alerts"]
+            time_seconds += stats["time_seconds"]
+            sessions += stats["sessions"]
+    return {"alerts": alerts, "time_seconds": time_seconds, "sessions": sessions}
+
+
+def measure(fn, repeat: int) -> float:
+    """Return mean microseconds per call."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    
+    print("=" * 60)
+    print(f"Range statistics benchmark (mean of {repeat} queries, us)")
+    print("=" * 60)
+    print(f"{'history':>8}{'span':>8}{'dict scan':>12}{'SQLite SUM':>12}{'rollup':>10}")
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        for years in (1, 5, 20):
+            end, daily = synthetic_daily(years)
+            rollup = DailyRollup(daily.items())
+            store = SqliteStatsStore(os.path.join(tmp, f"stats{years}.db"))
+            store.import_json_stats({"daily_stats": daily})
+            
+            for label, days in (("week", 7), ("month", 30), ("year", 365), ("all", years * 365)):
+                start = end - timedelta(days=days - 1)
+                expected = dict_scan(daily, start, end)
+                got = rollup.range(start, end)
+                assert got["alerts"] == expected["alerts"] and got["sessions"] == expected["sessions"]
+                
+                scan_us = measure(lambda: dict_scan(daily, start, end), repeat)
+                sql_us = measure(lambda: store.range_stats(start, end), repeat)
+                rollup_us = measure(lambda: rollup.range(start, end), repeat)
+                print(f"{years:>7}y{label:>8}{scan_us:>12.1f}{sql_us:>12.1f}{rollup_us:>10.2f}")
+            store.close()
+
+
+if __name__ == "__main__":
+    main()
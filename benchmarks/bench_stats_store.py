@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Benchmark: statistics queries on the JSON and SQLite backends.
+
+Builds a synthetic history of N sessions (default 100k) spread over three
+years, loads it into a JSON-backed StatsTracker and migrates it into the
+SQLite backend, then times day, week and arbitrary range queries plus the
+per-event write cost of each backend.
+
+Usage:
+    python benchmarks/bench_stats_store.py [sessions]
+"""
+
+import sys
+import os
+import json
+import random
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from PyQt6.QtCore import QCoreApplication
+
+from src.services.stats_tracker import StatsTracker
+from src.utils.clock import VirtualClock
+from src.utils.constants import STATS_BACKEND_JSON, STATS_BACKEND_SQLITE
+
+DAYS = 3 * 365
+
+
+def synthetic_stats(sessions: int, start: datetime):
+    """JSON statistics document with `sessions` sessions of full history."""
+    rng = random.Random(0)
+    history = []
+    daily = {}
+    per_day = sessions / DAYS
+    for i in range(sessions):
+        begin = start + timedelta(days=i / per_day)
+        duration = rng.uniform(900, 2700)
+        alerts = int(duration // 25)
+        history.append({"date": begin.isoformat(), "duration_seconds": duration, "alerts": alerts})
+        day = daily.setdefault((begin + timedelta(seconds=duration)).date().isoformat(),
+                               {"alerts": 0, "time_seconds": 0, "sessions": 0})
+        day["alerts"] += alerts
+        day["time_seconds"] += duration
+        day["sessions"] += 1
+    return {
+        "total_alerts": sum(s["alerts"] for s in history),
+        "total_sessions": sessions,
+        "total_game_time_seconds": sum(s["duration_seconds"] for s in history),
+        "daily_stats": daily,
+        "session_history": history,
+    }
+
+
+def measure(fn, repeat: int) -> float:
+    """Return mean microseconds per call."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def main():
+    app = QCoreApplication.instance() or QCoreApplication([])
+    sessions = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    origin = datetime(2022, 1, 1, 18, 0, 0)
+    clock = VirtualClock(start=origin + timedelta(days=DAYS))
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        stats_path = os.path.join(tmp, "statistics.json")
+        with open(stats_path, 'w', encoding='utf-8') as f:
+            json.dump(synthetic_stats(sessions, origin), f)
+        
+        json_tracker = StatsTracker(stats_path=stats_path, clock=clock, backend=STATS_BACKEND_JSON)
+        migrate_start = time.perf_counter()
+        sqlite_tracker = StatsTracker(stats_path=stats_path, clock=clock, backend=STATS_BACKEND_SQLITE)
+        migrate_s = time.perf_counter() - migrate_start
+        
+        range_start, range_end = date(2023, 3, 1), date(2023, 5, 31)
+        window = (datetime(2023, 3, 1), datetime(2023, 4, 1))
+        queries = [
+            ("today", lambda t: t.get_today_stats()),
+            ("last 7 days", lambda t: t.get_weekly_stats()),
+            ("3-month range", lambda t: t.get_range_stats(range_start, range_end)),
+            ("sessions in a month", lambda t: t.get_session_history(*window)),
+            ("last 10 sessions", lambda t: t.get_session_history(limit=10)),
+        ]
+        
+        print("=" * 60)
+        print(f"Statistics backends ({sessions} sessions over {DAYS} days)")
+        print("=" * 60)
+        print(f"JSON -> SQLite migration: {migrate_s:8.2f} s")
+        print(f"SQLite database size:     {os.path.getsize(sqlite_tracker.store.path) / 1e6:8.1f} MB")
+        print(f"\n{'query (us per call)':<24}{'JSON':>12}{'SQLite':>12}")
+        for label, query in queries:
+            assert query(json_tracker) == query(sqlite_tracker), label
+            print(f"{label:<24}{measure(lambda: query(json_tracker), 50):>12.1f}"
+                  f"{measure(lambda: query(sqlite_tracker), 50):>12.1f}")
+        
+        print(f"\n{'write (us per event)':<24}{'JSON':>12}{'SQLite':>12}")
+        for tracker in (json_tracker, sqlite_tracker):
+            tracker.start_session()
+        alert_costs = [measure(t.record_alert, 200) for t in (json_tracker, sqlite_tracker)]
+        print(f"{'record_alert':<24}{alert_costs[0]:>12.1f}{alert_costs[1]:>12.1f}")
+        end_costs = []
+        for tracker in (json_tracker, sqlite_tracker):
+            start = time.perf_counter()
+            tracker.end_session()
+            end_costs.append((time.perf_counter() - start) * 1e6)
+        print(f"{'end_session':<24}{end_costs[0]:>12.1f}{end_costs[1]:>12.1f}")
+        
+        json_tracker.close()
+        sqlite_tracker.close()
+
+
+if __name__ == "__main__":
+    main()
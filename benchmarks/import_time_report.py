@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Import-time report for the main window.
+
+Runs `python -X importtime -c "import src.ui.main_window"` in fresh
+interpreters, takes the median self and cumulative time of every module and
+prints the slowest ones as a Markdown table. Modules loaded while the
+interpreter starts up (`site` and anything a `.pth` hook pulls in, e.g.
+certifi) are left out, so only what the app itself imports is counted.
+Dependencies that should only load on first use (requests, psutil, pygame,
+numpy, sqlite3, the control server, the painted overlay) are listed
+separately so a regression is obvious.
+
+Usage:
+    python benchmarks/import_time_report.py [runs] [--output FILE]
+"""
+
+import sys
+import os
+import statistics
+import subprocess
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+TARGET = "src.ui.main_window"
+LAZY_MODULES = ("requests", "psutil", "pygame", "numpy", "sqlite3",
+                "src.services.control_server", "src.ui.painted_overlay")
+TOP = 25
+
+
+def parse_importtime(stderr: str) -> Dict[str, Tuple[int, int]]:
+    """
+    Map module name to (self us, cumulative us) from `-X importtime` output.
+    
+    Lines come in completion order, so every top-level entry before the
+    first `src` one (and its children) belongs to interpreter startup.
+    """
+    modules = {}
+    in_target = False
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        modules[name.strip()] = (int(self_us), int(cumulative_us))
+        # Top-level entries have a single space before the name
+        if not in_target and not name.startswith("  "):
+            if name.strip().split(".")[0] == TARGET.split(".")[0]:
+                in_target = True
+            else:
+                modules.clear()
+    return modules
+
+
+def sample(runs: int) -> List[Dict[str, Tuple[int, int]]]:
+    env = dict(os.environ)
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    samples = []
+    for _ in range(runs):
+        result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {TARGET}"],
+                                cwd=ROOT, env=env, capture_output=True, text=True, check=True)
+        samples.append(parse_importtime(result.stderr))
+    return samples
+
+
+def report(samples: List[Dict[str, Tuple[int, int]]]) -> str:
+    self_times, cumulative_times = defaultdict(list), defaultdict(list)
+    for modules in samples:
+        for name, (self_us, cumulative_us) in modules.items():
+            self_times[name].append(self_us)
+            cumulative_times[name].append(cumulative_us)
+    rows = sorted(((name, statistics.median(self_times[name]) / 1000, statistics.median(times) / 1000)
+                   for name, times in cumulative_times.items()), key=lambda row: -row[2])
+    
+    lines = [
+        f"# Import-time report: `import {TARGET}`",
+        "",
+        f"Median of {len(samples)} cold interpreter runs, generated by `benchmarks/import_time_report.py`.",
+        "",
+        f"**Total: {statistics.median(m[TARGET][1] for m in samples) / 1000:.1f} ms**",
+        "",
+        "| Module | Self (ms) | Cumulative (ms) |",
+        "|---|---:|---:|",
+    ]
+    lines += [f"| `{name}` | {self_ms:.1f} | {cumulative_ms:.1f} |" for name, self_ms, cumulative_ms in rows[:TOP]]
+    lines += ["", "## Deferred dependencies", "", "| Module | Imported at startup |", "|---|---|"]
+    lines += [f"| `{name}` | {'**yes**' if name in samples[0] else 'no'} |" for name in LAZY_MODULES]
+    return "\n".join(lines) + "\n"
+
+
+def main():
+    args = sys.argv[1:]
+    output = None
+    if "--output" in args:
+        index = args.index("--output")
+        output = args[index + 1]
+        del args[index:index + 2]
+    runs = int(args[0]) if args else 7
+    
+    text = report(sample(runs))
+    if output:
+        with open(output, "w", encoding="utf-8") as f:
+            f.write(text)
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
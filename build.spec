@@ -27,6 +27,7 @@ a = Analysis(
     binaries=[],
     datas=[
         ('assets/sounds', 'assets/sounds'),
+        ('assets/obs', 'assets/obs'),
         ('src/locales', 'src/locales'),
     ],
     hiddenimports=[
@@ -36,6 +37,7 @@ a = Analysis(
         'PyQt6.QtCore',
         'PyQt6.QtGui',
         'PyQt6.QtWidgets',
+        'PyQt6.QtNetwork',
         'PyQt6.sip',
     ],
     hookspath=[],
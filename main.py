@@ -6,18 +6,62 @@ A desktop application to remind you to produce villagers in Age of Empires 4.
 
 import sys
 import os
+import signal
 
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-from PyQt6.QtWidgets import QApplication
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QIcon
-from src.ui.main_window import MainWindow
-from src.utils.constants import APP_NAME
+from src.utils.constants import APP_NAME, HEADLESS_SIGNAL_POLL_MS
+from src.utils.single_instance import SingleInstance, command_from_args, COMMAND_QUIT, COMMAND_SHOW
+
+
+def run_headless(instance: SingleInstance, command: str) -> int:
+    """Run detector, timer and sound alerts under a QCoreApplication, without any widgets."""
+    from PyQt6.QtCore import QCoreApplication, QTimer
+    from src.headless import HeadlessApp
+    
+    app = QCoreApplication(sys.argv)
+    app.setApplicationName(APP_NAME)
+    
+    if not instance.listen():
+        instance.send_to_running(command)
+        return 0
+    
+    headless = HeadlessApp()
+    app.aboutToQuit.connect(headless.shutdown)
+    if command != COMMAND_SHOW:
+        headless.handle_command(command)
+    instance.command_received.connect(headless.handle_command)
+    
+    # Ctrl+C and SIGTERM quit cleanly; Python only runs signal handlers when it
+    # gets control back from the Qt event loop, which the timer guarantees
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(sig, lambda *_: app.quit())
+    wakeup = QTimer()
+    wakeup.timeout.connect(lambda: None)
+    wakeup.start(HEADLESS_SIGNAL_POLL_MS)
+    
+    return app.exec()
 
 
 def main():
+    command = command_from_args(sys.argv)
+    instance = SingleInstance()
+    # Already running (e.g. hidden in the tray): hand over the request and leave
+    # before any of the UI is imported
+    if instance.send_to_running(command):
+        sys.exit(0)
+    if command == COMMAND_QUIT:
+        # Nothing to quit
+        sys.exit(0)
+    
+    if "--headless" in sys.argv[1:]:
+        sys.exit(run_headless(instance, command))
+    
+    from PyQt6.QtWidgets import QApplication
+    from PyQt6.QtCore import Qt
+    from PyQt6.QtGui import QIcon
+    
     # High DPI support
     QApplication.setHighDpiScaleFactorRoundingPolicy(
         Qt.HighDpiScaleFactorRoundingPolicy.PassThrough
@@ -27,14 +71,24 @@ def main():
     app.setApplicationName(APP_NAME)
     app.setQuitOnLastWindowClosed(False)  # Keep running in tray
     
+    if not instance.listen():
+        # Lost a simultaneous launch to another instance
+        instance.send_to_running(command)
+        sys.exit(0)
+    
     # Set application icon
     icon_path = os.path.join(os.path.dirname(__file__), 'app_icon.png')
     if os.path.exists(icon_path):
         app.setWindowIcon(QIcon(icon_path))
     
+    from src.ui.main_window import MainWindow
+    
     # Create and show main window
     window = MainWindow()
     window.show()
+    if command != COMMAND_SHOW:
+        window.handle_command(command)
+    instance.command_received.connect(window.handle_command)
     
     sys.exit(app.exec())
 
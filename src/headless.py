@@ -0,0 +1,150 @@
+import time
+from typing import TYPE_CHECKING, Dict, Optional
+from PyQt6.QtCore import QCoreApplication, QObject
+
+from .services.game_detector import GameDetector
+from .services.timer_service import TimerService
+from .services.notification import NotificationService
+from .services.stats_tracker import StatsTracker
+from .utils.config import Config
+from .utils.single_instance import COMMAND_PAUSE, COMMAND_QUIT, COMMAND_SHOW, COMMAND_START, COMMAND_STOP
+
+if TYPE_CHECKING:
+    from .services.control_server import ControlServer
+
+
+class HeadlessApp(QObject):
+    """
+    The reminder without a window: detector, timer, sound alerts and statistics.
+    
+    Runs under a `QCoreApplication`, so neither QtWidgets nor the stylesheet
+    is loaded. It follows the same settings as the main window and is
+    controlled through `handle_command` (forwarded `--start`, `--stop`,
+    `--pause` and `--quit` launches).
+    """
+    
+    def __init__(self, parent=None):
+        self._startup_timings: Dict[str, float] = {}
+        self._phase_start = time.perf_counter()
+        super().__init__(parent)
+        self._config = Config()
+        self._end_phase("config")
+        
+        self._game_detector = GameDetector(self)
+        self._timer_service = TimerService(self)
+        self._notification_service = NotificationService(self)
+        self._stats_tracker = StatsTracker(self, backend=self._config.get("stats_backend"))
+        self._end_phase("services")
+        
+        self._connect_signals()
+        self._apply_settings()
+        # No window to wait for: start loading audio right away
+        self._notification_service.init_audio()
+        self._end_phase("wiring")
+        
+        if self._config.get("auto_start_detection"):
+            self._game_detector.start_detection()
+        self._end_phase("detection")
+        
+        self._control_server: Optional['ControlServer'] = None
+        if self._config.get("control_server_enabled"):
+            from .services.control_server import ControlServer
+            server = ControlServer(self._timer_service, self._game_detector, self.handle_command, self)
+            if server.start(self._config.get("control_server_port")):
+                self._control_server = server
+            self._end_phase("control server")
+    
+    def _end_phase(self, name: str):
+        now = time.perf_counter()
+        self._startup_timings[name] = (now - self._phase_start) * 1000
+        self._phase_start = now
+    
+    @property
+    def startup_timings(self) -> Dict[str, float]:
+        """Milliseconds spent in each phase of construction, in order."""
+        return dict(self._startup_timings)
+    
+    @property
+    def timer_service(self) -> TimerService:
+        return self._timer_service
+    
+    @property
+    def stats_tracker(self) -> StatsTracker:
+        return self._stats_tracker
+    
+    @property
+    def control_server(self) -> Optional['ControlServer']:
+        """The local control API, if enabled and listening."""
+        return self._control_server
+    
+    def _connect_signals(self):
+        self._game_detector.game_started.connect(self._on_game_started)
+        self._game_detector.game_ended.connect(self.stop)
+        self._game_detector.status_changed.connect(lambda status: print(f"Status: {status}"))
+        
+        self._timer_service.alert.connect(self._on_timer_alert)
+        self._timer_service.paused.connect(self._stats_tracker.record_pause)
+        self._timer_service.resumed.connect(self._stats_tracker.record_resume)
+    
+    def _apply_settings(self):
+        self._timer_service.interval = self._config.get("interval", 25)
+        self._notification_service.volume = self._config.get("volume", 70)
+        self._notification_service.sound_enabled = self._config.get("sound_enabled", True)
+        # Popups need a tray icon
+        self._notification_service.popup_enabled = False
+        
+        self._game_detector.mode = self._config.get("detection_mode", "api")
+        profile_id = self._config.get("profile_id")
+        if profile_id:
+            self._game_detector.profile_id = str(profile_id)
+    
+    def start(self):
+        if self._timer_service.is_running:
+            return
+        if self._game_detector.mode == "manual":
+            self._game_detector.manual_start()
+        self._timer_service.start()
+        self._stats_tracker.start_session(self._timer_service.interval)
+    
+    def stop(self):
+        if not self._timer_service.is_running:
+            return
+        if self._game_detector.mode == "manual":
+            self._game_detector.manual_stop()
+        self._timer_service.stop()
+        self._stats_tracker.end_session()
+    
+    def toggle_pause(self):
+        self._timer_service.toggle_pause()
+    
+    def handle_command(self, command: str):
+        """Handle a command forwarded by a later launch of the app."""
+        if command == COMMAND_START:
+            self.start()
+        elif command == COMMAND_STOP:
+            self.stop()
+        elif command == COMMAND_PAUSE:
+            self.toggle_pause()
+        elif command == COMMAND_QUIT:
+            QCoreApplication.quit()
+        elif command != COMMAND_SHOW:
+            print(f"Unknown command: {command}")
+    
+    def _on_game_started(self):
+        if self._config.get("auto_start_detection"):
+            self.start()
+    
+    def _on_timer_alert(self):
+        self._notification_service.notify()
+        self._stats_tracker.record_alert()
+    
+    def shutdown(self):
+        """Stop everything and flush statistics and settings; call before the event loop exits."""
+        self._game_detector.shutdown()
+        self._notification_service.shutdown()
+        self._timer_service.stop()
+        self._stats_tracker.end_session()
+        self._stats_tracker.close()
+        if self._control_server is not None:
+            self._control_server.stop()
+        self._config.flush()
@@ -0,0 +1,233 @@
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Any, Deque, Dict, List, Optional
+
+from ..utils.constants import AOE4_API_URL, API_REQUEST_TIMEOUT, APP_NAME, APP_VERSION
+
+if TYPE_CHECKING:
+    import requests
+
+
+def import_requests():
+    """
+    The `requests` package, imported on first use.
+    
+    It (with urllib3, charset_normalizer and certifi) is the heaviest import
+    of the app and manual-detection users never need it.
+    """
+    import requests
+    return requests
+
+
+@dataclass
+class RequestTiming:
+    """Timing of a single request made by AoE4WorldClient."""
+    
+    url: str
+    status_code: Optional[int]
+    elapsed_ms: float
+    not_modified: bool = False
+
+
+@dataclass
+class LastGameResponse:
+    """Result of a `/games/last` request."""
+    
+    status_code: int
+    data: Optional[Dict[str, Any]]
+    not_modified: bool
+    elapsed_ms: float
+    retry_after: Optional[float] = None  # seconds, from Retry-After or rate-limit headers
+
+
+class AoE4WorldClient:
+    """
+    HTTP client for the AoE4World API.
+    
+    Keeps a pooled keep-alive session so repeated polls reuse the TLS connection,
+    and sends conditional requests so an unchanged `/games/last` answers with 304
+    and skips JSON parsing.
+    """
+    
+    MAX_TIMINGS = 100
+    
+    def __init__(self, url_template: str = AOE4_API_URL, timeout: float = API_REQUEST_TIMEOUT,
+                 session: Optional["requests.Session"] = None):
+        self._url_template = url_template
+        self._timeout = timeout
+        self._session = session  # Created by the first request
+        self._lock = threading.Lock()
+        # Per-profile validators and the last decoded payload
+        self._etags: Dict[str, str] = {}
+        self._last_modified: Dict[str, str] = {}
+        self._cached_data: Dict[str, Dict[str, Any]] = {}
+        self._timings: Deque[RequestTiming] = deque(maxlen=self.MAX_TIMINGS)
+        self._request_count = 0
+        self._not_modified_count = 0
+    
+    @staticmethod
+    def _create_session() -> "requests.Session":
+        """Create a session with a small keep-alive connection pool."""
+        requests = import_requests()
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=2)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update({
+            "User-Agent": f"{APP_NAME.replace(' ', '')}/{APP_VERSION}",
+            "Accept": "application/json",
+        })
+        return session
+    
+    def _get_session(self) -> "requests.Session":
+        with self._lock:
+            if self._session is None:
+                self._session = self._create_session()
+            return self._session
+    
+    @property
+    def timings(self) -> List[RequestTiming]:
+        """Most recent request timings, oldest first."""
+        with self._lock:
+            return list(self._timings)
+    
+    @property
+    def request_count(self) -> int:
+        return self._request_count
+    
+    @property
+    def not_modified_count(self) -> int:
+        return self._not_modified_count
+    
+    @property
+    def average_elapsed_ms(self) -> float:
+        """Average request time over the recorded timings."""
+        timings = self.timings
+        if not timings:
+            return 0.0
+        return sum(t.elapsed_ms for t in timings) / len(timings)
+    
+    def fetch_last_game(self, profile_id: str) -> LastGameResponse:
+        """
+        Fetch the last game of a profile.
+        
+        Raises requests exceptions on network errors. On 304 the previously
+        decoded payload is returned with `not_modified` set.
+        """
+        url = self._url_template.format(profile_id=profile_id)
+        
+        headers = {}
+        with self._lock:
+            etag = self._etags.get(profile_id)
+            last_modified = self._last_modified.get(profile_id)
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        
+        start = time.perf_counter()
+        status_code = None
+        not_modified = False
+        data = None
+        retry_after = None
+        try:
+            response = self._get_session().get(url, headers=headers, timeout=self._timeout)
+            status_code = response.status_code
+            
+            not_modified = status_code == 304
+            retry_after = self._parse_retry_after(response.headers)
+            if status_code == 200:
+                data = response.json()
+                with self._lock:
+                    self._store_validators(profile_id, response, data)
+            elif not_modified:
+                with self._lock:
+                    data = self._cached_data.get(profile_id)
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            self._record_timing(url, status_code, elapsed_ms)
+        
+        if not_modified:
+            self._not_modified_count += 1
+        
+        return LastGameResponse(
+            status_code=status_code,
+            data=data,
+            not_modified=not_modified,
+            elapsed_ms=elapsed_ms,
+            retry_after=retry_after,
+        )
+    
+    @staticmethod
+    def _parse_retry_after(headers) -> Optional[float]:
+        """
+        Seconds the server asks us to wait, if any.
+        
+        Uses Retry-After (delta seconds or HTTP date), or the rate-limit reset
+        time once the remaining quota hits zero.
+        """
+        retry_after = headers.get("Retry-After")
+        if retry_after:
+            try:
+                return max(0.0, float(retry_after))
+            except ValueError:
+                pass
+            try:
+                return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+            except (TypeError, ValueError):
+                pass
+        
+        remaining = headers.get("RateLimit-Remaining") or headers.get("X-RateLimit-Remaining")
+        reset = headers.get("RateLimit-Reset") or headers.get("X-RateLimit-Reset")
+        if remaining is not None and reset is not None:
+            try:
+                if int(remaining) > 0:
+                    return None
+                reset_value = float(reset)
+            except ValueError:
+                return None
+            # Large values are epoch timestamps, small ones are delta seconds
+            if reset_value > 1e9:
+                reset_value -= time.time()
+            return max(0.0, reset_value)
+        return None
+    
+    def _store_validators(self, profile_id: str, response: "requests.Response", data: Dict[str, Any]):
+        """Remember cache validators for the next conditional request."""
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag:
+            self._etags[profile_id] = etag
+        else:
+            self._etags.pop(profile_id, None)
+        if last_modified:
+            self._last_modified[profile_id] = last_modified
+        else:
+            self._last_modified.pop(profile_id, None)
+        self._cached_data[profile_id] = data
+    
+    def _record_timing(self, url: str, status_code: Optional[int], elapsed_ms: float):
+        with self._lock:
+            self._request_count += 1
+            self._timings.append(RequestTiming(
+                url=url,
+                status_code=status_code,
+                elapsed_ms=elapsed_ms,
+                not_modified=status_code == 304,
+            ))
+    
+    def clear_cache(self):
+        """Forget validators so the next request is unconditional."""
+        with self._lock:
+            self._etags.clear()
+            self._last_modified.clear()
+            self._cached_data.clear()
+    
+    def close(self):
+        """Close pooled connections."""
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
@@ -0,0 +1,93 @@
+import hashlib
+import os
+import sys
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+
+# Explicit, since `mimetypes` reads the Windows registry and may answer text/plain for .js
+CONTENT_TYPES = {
+    ".html": "text/html; charset=utf-8",
+    ".css": "text/css; charset=utf-8",
+    ".js": "text/javascript; charset=utf-8",
+    ".svg": "image/svg+xml",
+    ".png": "image/png",
+}
+
+
+def find_overlay_assets() -> Optional[str]:
+    """Directory of the browser-source overlay page, from source or a PyInstaller bundle."""
+    possible_paths = [
+        os.path.join(os.path.dirname(__file__), '..', '..', 'assets', 'obs'),
+        os.path.join(getattr(sys, '_MEIPASS', ''), 'assets', 'obs'),
+    ]
+    for path in possible_paths:
+        if os.path.isdir(path):
+            return os.path.abspath(path)
+    return None
+
+
+@dataclass(frozen=True)
+class StaticAsset:
+    body: bytes
+    content_type: str
+    etag: str
+
+
+class StaticAssetCache:
+    """
+    The files of one directory, read into memory on first use.
+    
+    Each file gets a content-hash ETag, so a browser source that reloads
+    revalidates with `If-None-Match` and is answered 304 without touching
+    the disk or resending the body.
+    """
+    
+    def __init__(self, directory: Optional[str]):
+        self._directory = directory
+        self._assets: Optional[Dict[str, StaticAsset]] = None
+        self._load_count = 0
+    
+    @property
+    def load_count(self) -> int:
+        """Files read from disk since creation."""
+        return self._load_count
+    
+    def get(self, name: str) -> Optional[StaticAsset]:
+        if self._assets is None:
+            self._assets = self._load()
+        return self._assets.get(name)
+    
+    def _load(self) -> Dict[str, StaticAsset]:
+        assets = {}
+        if self._directory is None:
+            return assets
+        for name in os.listdir(self._directory):
+            path = os.path.join(self._directory, name)
+            content_type = CONTENT_TYPES.get(os.path.splitext(name)[1].lower())
+            if content_type is None or not os.path.isfile(path):
+                continue
+            with open(path, 'rb') as f:
+                body = f.read()
+            self._load_count += 1
+            etag = '"' + hashlib.sha1(body).hexdigest()[:16] + '"'
+            assets[name] = StaticAsset(body, content_type, etag)
+        return assets
+
+
+class OverlayDeltas:
+    """Last overlay fields sent to browser sources, so each update carries only what changed."""
+    
+    def __init__(self, **fields: Any):
+        self._fields: Dict[str, Any] = dict(fields)
+    
+    @property
+    def fields(self) -> Dict[str, Any]:
+        return dict(self._fields)
+    
+    def update(self, **fields: Any) -> Dict[str, Any]:
+        """Apply new values and return the ones that differ from before."""
+        delta = {key: value for key, value in fields.items()
+                 if key not in self._fields or self._fields[key] != value}
+        self._fields.update(delta)
+        return delta
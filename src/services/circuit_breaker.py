@@ -0,0 +1,124 @@
+import time
+from typing import Callable, Optional
+from ..utils.constants import (
+    API_BREAKER_FAILURE_THRESHOLD,
+    API_BREAKER_RESET_TIMEOUT,
+    API_BREAKER_MAX_RETRY_AFTER,
+)
+
+
+# Breaker states
+BREAKER_CLOSED = "closed"  # Requests flow normally
+BREAKER_OPEN = "open"  # Upstream degraded, requests are refused
+BREAKER_HALF_OPEN = "half_open"  # A single probe request is allowed
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker for upstream requests.
+    
+    Opens after `failure_threshold` consecutive failures (or immediately when the
+    server asks us to back off with Retry-After), refuses requests while open,
+    then lets exactly one probe through. A successful probe closes the breaker,
+    a failed one opens it again.
+    """
+    
+    def __init__(self, failure_threshold: int = API_BREAKER_FAILURE_THRESHOLD,
+                 reset_timeout: float = API_BREAKER_RESET_TIMEOUT,
+                 max_retry_after: float = API_BREAKER_MAX_RETRY_AFTER,
+                 clock: Callable[[], float] = time.monotonic,
+                 on_state_change: Optional[Callable[[str], None]] = None):
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._max_retry_after = max_retry_after
+        self._clock = clock
+        self._on_state_change = on_state_change
+        
+        self._state = BREAKER_CLOSED
+        self._consecutive_failures = 0
+        self._open_until = 0.0
+        self._probe_in_flight = False
+        self._rejected_count = 0
+    
+    @property
+    def state(self) -> str:
+        return self._state
+    
+    @property
+    def consecutive_failures(self) -> int:
+        return self._consecutive_failures
+    
+    @property
+    def rejected_count(self) -> int:
+        """Requests refused while the breaker was open."""
+        return self._rejected_count
+    
+    def retry_in(self) -> float:
+        """Seconds until the breaker allows the next (probe) request."""
+        if self._state != BREAKER_OPEN:
+            return 0.0
+        return max(0.0, self._open_until - self._clock())
+    
+    def allow_request(self) -> bool:
+        """Return True if a request may be sent now."""
+        if self._state == BREAKER_CLOSED:
+            return True
+        
+        if self._state == BREAKER_OPEN:
+            if self._clock() < self._open_until:
+                self._rejected_count += 1
+                return False
+            self._set_state(BREAKER_HALF_OPEN)
+        
+        # Half-open: only one probe at a time
+        if self._probe_in_flight:
+            self._rejected_count += 1
+            return False
+        self._probe_in_flight = True
+        return True
+    
+    def record_success(self):
+        self._consecutive_failures = 0
+        self._probe_in_flight = False
+        if self._state != BREAKER_CLOSED:
+            self._set_state(BREAKER_CLOSED)
+    
+    def record_failure(self, retry_after: Optional[float] = None):
+        """
+        Record a failed request.
+        
+        `retry_after` (seconds) comes from Retry-After or rate-limit headers and
+        opens the breaker immediately for that long.
+        """
+        self._consecutive_failures += 1
+        self._probe_in_flight = False
+        
+        if (retry_after is not None
+                or self._state == BREAKER_HALF_OPEN
+                or self._consecutive_failures >= self._failure_threshold):
+            self._open(retry_after)
+    
+    def release_probe(self):
+        """Give up a probe whose outcome is unknown (e.g. its result was discarded)."""
+        self._probe_in_flight = False
+    
+    def reset(self):
+        """Close the breaker and forget failures (e.g. after a profile change)."""
+        self._consecutive_failures = 0
+        self._probe_in_flight = False
+        self._open_until = 0.0
+        if self._state != BREAKER_CLOSED:
+            self._set_state(BREAKER_CLOSED)
+    
+    def _open(self, retry_after: Optional[float]):
+        timeout = self._reset_timeout
+        if retry_after is not None:
+            timeout = min(max(retry_after, 0.0), self._max_retry_after)
+        self._open_until = self._clock() + timeout
+        if self._state != BREAKER_OPEN:
+            self._set_state(BREAKER_OPEN)
+    
+    def _set_state(self, state: str):
+        self._state = state
+        if self._on_state_change:
+            self._on_state_change(state)
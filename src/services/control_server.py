@@ -0,0 +1,349 @@
+import json
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+from PyQt6.QtNetwork import QHostAddress, QTcpServer, QTcpSocket
+from .browser_overlay import OverlayDeltas, StaticAssetCache, find_overlay_assets
+from .game_detector import GameDetector
+from .timer_service import TimerService
+from ..utils.constants import (
+    CONTROL_MAX_REQUEST_BYTES,
+    CONTROL_SSE_KEEPALIVE_MS,
+    CONTROL_SSE_MAX_BACKLOG,
+    TIMER_LOW_SECONDS
+)
+from ..utils.localization import tr
+from ..utils.single_instance import COMMAND_PAUSE, COMMAND_START, COMMAND_STOP
+
+
+REASONS = {
+    200: "OK",
+    304: "Not Modified",
+    400: "Bad Request",
+    403: "Forbidden",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    431: "Request Header Fields Too Large",
+}
+
+# POST routes and the command they run
+COMMAND_ROUTES = {"/start": COMMAND_START, "/stop": COMMAND_STOP, "/pause": COMMAND_PAUSE}
+
+LOCAL_HOSTS = ("127.0.0.1", "localhost", "[::1]")
+
+# Event streams
+STREAM_EVENTS = "/events"  # Full state for tools
+STREAM_OVERLAY = "/overlay/events"  # Changed fields only, for the browser-source overlay
+
+OVERLAY_PAGE = "/overlay"
+OVERLAY_PREFIX = "/overlay/"
+OVERLAY_INDEX = "overlay.html"
+
+SSE_HEADERS = (
+    b"HTTP/1.1 200 OK\r\n"
+    b"Content-Type: text/event-stream\r\n"
+    b"Cache-Control: no-cache\r\n"
+    b"Connection: keep-alive\r\n"
+    b"Access-Control-Allow-Origin: *\r\n"
+    b"\r\n"
+)
+SSE_KEEPALIVE = b": keep-alive\n\n"
+
+
+def encode_event(event: str, data: Any) -> bytes:
+    """One Server-Sent Events message."""
+    return f"event: {event}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n".encode("utf-8")
+
+
+class ControlServer(QObject):
+    """
+    Local HTTP control API and live state stream for stream decks and OBS scripts.
+    
+    Listens on 127.0.0.1 only:
+        
+        GET  /state               timer and detection state as JSON
+        GET  /events              Server-Sent Events: `state`, `tick`, `alert`, `status`
+        POST /start, /stop, /pause  run `command_handler` like the window buttons
+        GET  /overlay             countdown page for an OBS browser source
+        GET  /overlay/events      `snapshot` on connect, then `delta` (changed fields) and `alert`
+    
+    Every event is serialized once and the same bytes are queued on each
+    subscriber's socket, so a tick costs one `json.dumps` however many tools
+    are listening. Subscribers that stop reading are dropped once too much is
+    queued for them.
+    """
+    
+    subscribers_changed = pyqtSignal(int)
+    
+    def __init__(self, timer_service: TimerService, game_detector: GameDetector,
+                 command_handler: Callable[[str], None], parent=None):
+        super().__init__(parent)
+        self._timer_service = timer_service
+        self._game_detector = game_detector
+        self._command_handler = command_handler
+        self._status = ""
+        
+        self._server = QTcpServer(self)
+        self._server.newConnection.connect(self._on_new_connection)
+        self._buffers: Dict[QTcpSocket, bytes] = {}
+        self._streams: Dict[str, List[QTcpSocket]] = {STREAM_EVENTS: [], STREAM_OVERLAY: []}
+        self._serialize_count = 0
+        self._dropped_subscribers = 0
+        self._assets = StaticAssetCache(find_overlay_assets())
+        self._overlay = OverlayDeltas(**self._overlay_fields())
+        
+        self._keepalive_timer = QTimer(self)
+        self._keepalive_timer.setInterval(CONTROL_SSE_KEEPALIVE_MS)
+        self._keepalive_timer.timeout.connect(self._send_keepalive)
+        
+        timer_service.tick.connect(self._on_tick)
+        timer_service.alert.connect(self._on_alert)
+        for signal in (timer_service.started, timer_service.stopped, timer_service.paused,
+                       timer_service.resumed, timer_service.interval_changed,
+                       game_detector.game_started, game_detector.game_ended):
+            signal.connect(self._on_state_changed)
+        game_detector.status_changed.connect(self._on_status_changed)
+    
+    @property
+    def port(self) -> int:
+        return self._server.serverPort()
+    
+    @property
+    def is_listening(self) -> bool:
+        return self._server.isListening()
+    
+    @property
+    def subscriber_count(self) -> int:
+        return sum(len(subscribers) for subscribers in self._streams.values())
+    
+    def stream_subscriber_count(self, stream: str) -> int:
+        return len(self._streams[stream])
+    
+    @property
+    def assets(self) -> StaticAssetCache:
+        return self._assets
+    
+    @property
+    def serialize_count(self) -> int:
+        """Events encoded since creation (one per published event with subscribers)."""
+        return self._serialize_count
+    
+    @property
+    def dropped_subscribers(self) -> int:
+        """Subscribers disconnected for falling too far behind."""
+        return self._dropped_subscribers
+    
+    def start(self, port: int) -> bool:
+        """Listen on 127.0.0.1:`port` (0 picks a free port)."""
+        if not self._server.listen(QHostAddress(QHostAddress.SpecialAddress.LocalHost), port):
+            print(f"Control server error: {self._server.errorString()}")
+            return False
+        return True
+    
+    def stop(self):
+        self._server.close()
+        self._keepalive_timer.stop()
+        sockets = list(self._buffers)
+        for subscribers in self._streams.values():
+            sockets += subscribers
+        for socket in sockets:
+            socket.abort()
+        for subscribers in self._streams.values():
+            subscribers.clear()
+        self._buffers.clear()
+    
+    def state(self) -> Dict[str, Any]:
+        return {
+            "running": self._timer_service.is_running,
+            "paused": self._timer_service.is_paused,
+            "remaining": self._timer_service.remaining,
+            "interval": self._timer_service.interval,
+            "game_running": self._game_detector.is_game_running,
+            "status": self._status,
+        }
+    
+    def _overlay_fields(self) -> Dict[str, Any]:
+        return {
+            "remaining": self._timer_service.remaining,
+            "interval": self._timer_service.interval,
+            "running": self._timer_service.is_running,
+            "paused": self._timer_service.is_paused,
+        }
+    
+    def _overlay_snapshot(self) -> Dict[str, Any]:
+        return {
+            **self._overlay.fields,
+            "low_seconds": TIMER_LOW_SECONDS,
+            "labels": {
+                "title": tr("overlay_title"),
+                "running": tr("timer_running"),
+                "paused": tr("timer_paused"),
+                "stopped": tr("timer_stopped"),
+            },
+        }
+    
+    def publish(self, event: str, data: Any, stream: str = STREAM_EVENTS):
+        """Send an event to every subscriber of a stream."""
+        subscribers = self._streams[stream]
+        if not subscribers:
+            return
+        self._serialize_count += 1
+        self._broadcast(encode_event(event, data), subscribers)
+    
+    def _publish_overlay_delta(self, **fields: Any):
+        delta = self._overlay.update(**fields)
+        if delta:
+            self.publish("delta", delta, STREAM_OVERLAY)
+    
+    def _on_tick(self, remaining: int):
+        self.publish("tick", {"remaining": remaining})
+        self._publish_overlay_delta(remaining=remaining)
+    
+    def _on_alert(self):
+        self.publish("alert", {"alerts": self._timer_service.alert_count})
+        self.publish("alert", {}, STREAM_OVERLAY)
+    
+    def _on_state_changed(self):
+        self.publish("state", self.state())
+        self._publish_overlay_delta(**self._overlay_fields())
+    
+    def _on_status_changed(self, message: str):
+        self._status = message
+        self.publish("status", {"message": message})
+    
+    def _send_keepalive(self):
+        for subscribers in self._streams.values():
+            self._broadcast(SSE_KEEPALIVE, subscribers)
+    
+    def _broadcast(self, payload: bytes, subscribers: List[QTcpSocket]):
+        for socket in list(subscribers):
+            if socket.bytesToWrite() > CONTROL_SSE_MAX_BACKLOG:
+                self._dropped_subscribers += 1
+                socket.abort()
+            else:
+                socket.write(payload)
+    
+    # Connections
+    
+    def _on_new_connection(self):
+        while self._server.hasPendingConnections():
+            socket = self._server.nextPendingConnection()
+            self._buffers[socket] = b""
+            socket.readyRead.connect(lambda s=socket: self._on_ready_read(s))
+            socket.disconnected.connect(lambda s=socket: self._on_disconnected(s))
+    
+    def _on_disconnected(self, socket: QTcpSocket):
+        self._buffers.pop(socket, None)
+        for subscribers in self._streams.values():
+            if socket in subscribers:
+                subscribers.remove(socket)
+                if not self.subscriber_count:
+                    self._keepalive_timer.stop()
+                self.subscribers_changed.emit(self.subscriber_count)
+        socket.deleteLater()
+    
+    def _on_ready_read(self, socket: QTcpSocket):
+        if socket not in self._buffers:
+            # Request already handled; SSE clients have nothing more to say
+            socket.readAll()
+            return
+        data = self._buffers[socket] + bytes(socket.readAll())
+        head, separator, _ = data.partition(b"\r\n\r\n")
+        if not separator:
+            if len(data) > CONTROL_MAX_REQUEST_BYTES:
+                del self._buffers[socket]
+                self._respond(socket, 431)
+            else:
+                self._buffers[socket] = data
+            return
+        del self._buffers[socket]
+        
+        request = self._parse_request(head)
+        if request is None:
+            self._respond(socket, 400)
+            return
+        self._handle_request(socket, *request)
+    
+    @staticmethod
+    def _parse_request(head: bytes) -> Optional[Tuple[str, str, Dict[str, str]]]:
+        lines = head.decode("latin-1").split("\r\n")
+        parts = lines[0].split(" ")
+        if len(parts) != 3 or not parts[2].startswith("HTTP/"):
+            return None
+        headers = {}
+        for line in lines[1:]:
+            name, colon, value = line.partition(":")
+            if colon:
+                headers[name.strip().lower()] = value.strip()
+        return parts[0], parts[1].split("?", 1)[0], headers
+    
+    def _is_allowed(self, method: str, headers: Dict[str, str]) -> bool:
+        # A Host other than localhost means a DNS-rebound web page
+        host = headers.get("host", "")
+        if host.rsplit(":", 1)[0] not in LOCAL_HOSTS:
+            return False
+        # Web pages may read the state but not drive the timer
+        origin = headers.get("origin")
+        if method == "POST" and origin is not None:
+            return origin in (f"http://{name}:{self.port}" for name in LOCAL_HOSTS)
+        return True
+    
+    def _handle_request(self, socket: QTcpSocket, method: str, path: str, headers: Dict[str, str]):
+        if not self._is_allowed(method, headers):
+            self._respond(socket, 403)
+        elif path in COMMAND_ROUTES:
+            if method != "POST":
+                self._respond(socket, 405)
+                return
+            self._command_handler(COMMAND_ROUTES[path])
+            self._respond_json(socket, self.state())
+        elif path == "/state":
+            self._respond_json(socket, self.state())
+        elif path == STREAM_EVENTS:
+            self._subscribe(socket, STREAM_EVENTS, encode_event("state", self.state()))
+        elif path == STREAM_OVERLAY:
+            self._subscribe(socket, STREAM_OVERLAY, encode_event("snapshot", self._overlay_snapshot()))
+        elif path == OVERLAY_PAGE or path.startswith(OVERLAY_PREFIX):
+            self._respond_asset(socket, path[len(OVERLAY_PREFIX):] or OVERLAY_INDEX, headers)
+        else:
+            self._respond(socket, 404)
+    
+    def _subscribe(self, socket: QTcpSocket, stream: str, first_event: bytes):
+        self._serialize_count += 1
+        socket.write(SSE_HEADERS + first_event)
+        self._streams[stream].append(socket)
+        if not self._keepalive_timer.isActive():
+            self._keepalive_timer.start()
+        self.subscribers_changed.emit(self.subscriber_count)
+    
+    def _respond_asset(self, socket: QTcpSocket, name: str, headers: Dict[str, str]):
+        asset = self._assets.get(name)
+        if asset is None:
+            self._respond(socket, 404)
+            return
+        # Revalidated on every load, which costs OBS a 304 once the page is cached
+        cache_headers = {"ETag": asset.etag, "Cache-Control": "no-cache"}
+        if headers.get("if-none-match") == asset.etag:
+            self._respond(socket, 304, extra_headers=cache_headers)
+        else:
+            self._respond(socket, 200, asset.body, asset.content_type, cache_headers)
+    
+    def _respond_json(self, socket: QTcpSocket, data: Any):
+        self._respond(socket, 200, json.dumps(data).encode("utf-8"), "application/json")
+    
+    def _respond(self, socket: QTcpSocket, status: int, body: bytes = b"", content_type: str = "text/plain",
+                 extra_headers: Optional[Dict[str, str]] = None):
+        response_headers = {
+            "Content-Type": content_type,
+            "Content-Length": str(len(body)),
+            "Cache-Control": "no-store",
+            "Access-Control-Allow-Origin": "*",
+            "Connection": "close",
+        }
+        response_headers.update(extra_headers or {})
+        if status == 304:
+            # No body, so no entity headers
+            del response_headers["Content-Type"], response_headers["Content-Length"]
+        head = f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+        head += "".join(f"{name}: {value}\r\n" for name, value in response_headers.items())
+        socket.write((head + "\r\n").encode("latin-1") + body)
+        socket.disconnectFromHost()
@@ -0,0 +1,121 @@
+import random
+import time
+from typing import Callable, Dict, Optional
+from ..utils.constants import (
+    API_CHECK_INTERVAL,
+    API_LOBBY_INTERVAL,
+    API_MATCH_INTERVAL,
+    API_BACKOFF_MAX_INTERVAL,
+    API_BACKOFF_JITTER,
+)
+
+
+# Detection states
+STATE_IDLE = "idle"  # Detection stopped
+STATE_WAITING = "waiting"  # Game exe not running, no API polling
+STATE_LOBBY = "lobby"  # Game exe running, no match ongoing
+STATE_IN_MATCH = "in_match"  # Match confirmed ongoing
+
+_POLLING_STATES = (STATE_LOBBY, STATE_IN_MATCH)
+
+
+class DetectionScheduler:
+    """
+    Chooses the AoE4World poll interval from the detection state.
+    
+    Polls quickly in the lobby to catch a match start, slowly during a match
+    where only the end matters, and backs off exponentially with jitter on
+    errors. Counts requests against the old fixed API_CHECK_INTERVAL schedule.
+    """
+    
+    def __init__(self, lobby_interval: int = API_LOBBY_INTERVAL,
+                 match_interval: int = API_MATCH_INTERVAL,
+                 backoff_max_interval: int = API_BACKOFF_MAX_INTERVAL,
+                 jitter: float = API_BACKOFF_JITTER,
+                 baseline_interval: int = API_CHECK_INTERVAL,
+                 clock: Callable[[], float] = time.monotonic,
+                 rng: Optional[random.Random] = None):
+        self._lobby_interval = lobby_interval
+        self._match_interval = match_interval
+        self._backoff_max_interval = backoff_max_interval
+        self._jitter = jitter
+        self._baseline_interval = baseline_interval
+        self._clock = clock
+        self._rng = rng or random.Random()
+        
+        self._state = STATE_IDLE
+        self._consecutive_errors = 0
+        self._requests_made = 0
+        # Time spent in polling states, which the fixed schedule polled throughout
+        self._polling_seconds = 0.0
+        self._polling_since: Optional[float] = None
+    
+    @property
+    def state(self) -> str:
+        return self._state
+    
+    @state.setter
+    def state(self, value: str):
+        if value == self._state:
+            return
+        now = self._clock()
+        if self._polling_since is not None:
+            self._polling_seconds += now - self._polling_since
+            self._polling_since = None
+        if value in _POLLING_STATES:
+            self._polling_since = now
+        if value not in _POLLING_STATES:
+            self._consecutive_errors = 0
+        self._state = value
+    
+    @property
+    def consecutive_errors(self) -> int:
+        return self._consecutive_errors
+    
+    def base_interval(self) -> int:
+        """Poll interval for the current state, without backoff."""
+        if self._state == STATE_IN_MATCH:
+            return self._match_interval
+        return self._lobby_interval
+    
+    def next_interval(self) -> int:
+        """Milliseconds until the next API poll."""
+        interval = self.base_interval()
+        if self._consecutive_errors:
+            interval = min(
+                interval * (2 ** self._consecutive_errors),
+                self._backoff_max_interval,
+            )
+            spread = interval * self._jitter
+            interval += self._rng.uniform(-spread, spread)
+        return max(0, int(interval))
+    
+    def record_request(self):
+        self._requests_made += 1
+    
+    def record_success(self):
+        self._consecutive_errors = 0
+    
+    def record_error(self):
+        self._consecutive_errors += 1
+    
+    def polling_seconds(self) -> float:
+        """Total time spent in polling states so far."""
+        total = self._polling_seconds
+        if self._polling_since is not None:
+            total += self._clock() - self._polling_since
+        return total
+    
+    def get_stats(self) -> Dict[str, float]:
+        """Requests made versus the fixed-interval schedule over the same time."""
+        polling_seconds = self.polling_seconds()
+        # The fixed schedule checked immediately and then every baseline interval
+        baseline = 0
+        if self._requests_made or polling_seconds:
+            baseline = 1 + int(polling_seconds * 1000 // self._baseline_interval)
+        return {
+            "requests_made": self._requests_made,
+            "baseline_requests": baseline,
+            "requests_saved": baseline - self._requests_made,
+            "polling_seconds": polling_seconds,
+        }
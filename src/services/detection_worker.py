@@ -0,0 +1,75 @@
+from dataclasses import dataclass
+from typing import Optional
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+from .aoe4world_client import AoE4WorldClient, import_requests
+
+
+# Error kinds reported back to the GUI thread
+API_ERROR_TIMEOUT = "timeout"
+API_ERROR_CONNECTION = "connection"
+API_ERROR_REQUEST = "request"
+API_ERROR_OTHER = "other"
+
+
+@dataclass
+class ApiCheckResult:
+    """Outcome of a single AoE4World `/games/last` check."""
+    
+    profile_id: str
+    generation: int
+    status_code: Optional[int] = None
+    ongoing: bool = False
+    not_modified: bool = False
+    elapsed_ms: float = 0.0
+    retry_after: Optional[float] = None
+    error_kind: Optional[str] = None
+    error: str = ""
+
+
+class ApiCheckSignals(QObject):
+    """Signal carrier for ApiCheckJob (QRunnable cannot emit signals itself)."""
+    
+    finished = pyqtSignal(object)  # ApiCheckResult
+
+
+class ApiCheckJob(QRunnable):
+    """Runs the HTTP request and JSON decode on a thread pool worker."""
+    
+    def __init__(self, signals: ApiCheckSignals, client: AoE4WorldClient,
+                 profile_id: str, generation: int):
+        super().__init__()
+        self._signals = signals
+        self._client = client
+        self._profile_id = profile_id
+        self._generation = generation
+    
+    def run(self):
+        result = ApiCheckResult(profile_id=self._profile_id, generation=self._generation)
+        requests = import_requests()  # First use happens here, on the worker
+        
+        try:
+            response = self._client.fetch_last_game(self._profile_id)
+            result.status_code = response.status_code
+            result.not_modified = response.not_modified
+            result.elapsed_ms = response.elapsed_ms
+            result.retry_after = response.retry_after
+            
+            if response.data is not None:
+                result.ongoing = bool(response.data.get('ongoing', False))
+        
+        except requests.Timeout:
+            result.error_kind = API_ERROR_TIMEOUT
+        except requests.ConnectionError:
+            result.error_kind = API_ERROR_CONNECTION
+        except requests.RequestException as e:
+            result.error_kind = API_ERROR_REQUEST
+            result.error = str(e)[:30]
+        except Exception as e:
+            result.error_kind = API_ERROR_OTHER
+            result.error = str(e)[:30]
+        
+        try:
+            self._signals.finished.emit(result)
+        except RuntimeError:
+            # Detector was destroyed while the request was in flight
+            pass
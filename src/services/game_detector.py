@@ -1,11 +1,25 @@
-import requests
-import psutil
-from PyQt6.QtCore import QObject, QTimer, pyqtSignal
-from typing import Optional
+from PyQt6.QtCore import QObject, QTimer, QThreadPool, Qt, pyqtSignal
+from typing import Optional, Set
+from .aoe4world_client import AoE4WorldClient
+from .circuit_breaker import CircuitBreaker, BREAKER_CLOSED, BREAKER_OPEN
+from .detection_scheduler import (
+    DetectionScheduler,
+    STATE_IDLE,
+    STATE_WAITING,
+    STATE_LOBBY,
+    STATE_IN_MATCH,
+)
+from .process_watcher import ProcessWatcher
+from .detection_worker import (
+    ApiCheckJob,
+    ApiCheckResult,
+    ApiCheckSignals,
+    API_ERROR_TIMEOUT,
+    API_ERROR_CONNECTION,
+    API_ERROR_REQUEST,
+)
+from ..utils.clock import Clock, SYSTEM_CLOCK
 from ..utils.constants import (
-    AOE4_API_URL,
-    API_CHECK_INTERVAL,
-    AOE4_EXECUTABLE,
     PROCESS_CHECK_INTERVAL,
     DETECTION_MODE_API,
     DETECTION_MODE_MANUAL,
@@ -20,9 +34,11 @@ class GameDetector(QObject):
     game_started = pyqtSignal()
     game_ended = pyqtSignal()
     status_changed = pyqtSignal(str)  # Status message for UI
+    api_health_changed = pyqtSignal(str)  # Circuit breaker state (closed/open/half_open)
     
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, clock: Optional[Clock] = None):
         super().__init__(parent)
+        self._clock = clock or SYSTEM_CLOCK
         self._mode = DETECTION_MODE_API
         self._profile_id: Optional[str] = None
         self._is_game_running = False
@@ -30,12 +46,30 @@ class GameDetector(QObject):
         self._is_detecting = False
         
         # Timer for process detection (checks if game exe is running)
+        self._process_watcher = ProcessWatcher()
         self._process_timer = QTimer(self)
         self._process_timer.timeout.connect(self._check_game_process)
         
-        # Timer for API detection
+        # Timer for API detection - single shot, re-armed by the scheduler after each result
+        self._scheduler = DetectionScheduler(clock=self._clock.monotonic)
         self._api_timer = QTimer(self)
+        self._api_timer.setSingleShot(True)
         self._api_timer.timeout.connect(self._check_api)
+        
+        # API requests run on a worker pool so a slow response never blocks the GUI thread
+        self._api_pool = QThreadPool(self)
+        self._api_pool.setMaxThreadCount(2)
+        self._api_client = AoE4WorldClient()
+        self._breaker = CircuitBreaker(
+            clock=self._clock.monotonic, on_state_change=self._on_breaker_state_changed
+        )
+        self._api_signals = ApiCheckSignals(self)
+        self._api_signals.finished.connect(
+            self._on_api_result, Qt.ConnectionType.QueuedConnection
+        )
+        self._api_in_flight: Set[str] = set()
+        # Bumped whenever detection stops so late results from old requests are dropped
+        self._generation = 0
     
     @property
     def mode(self) -> str:
@@ -56,6 +90,8 @@ class GameDetector(QObject):
     
     @profile_id.setter
     def profile_id(self, value: Optional[str]):
+        if value != self._profile_id:
+            self._breaker.reset()
         self._profile_id = value
     
     @property
@@ -70,6 +106,22 @@ class GameDetector(QObject):
     def is_detecting(self) -> bool:
         return self._is_detecting
     
+    @property
+    def scheduler(self) -> DetectionScheduler:
+        return self._scheduler
+    
+    @property
+    def api_client(self) -> AoE4WorldClient:
+        return self._api_client
+    
+    @property
+    def api_health(self) -> str:
+        return self._breaker.state
+    
+    @property
+    def is_api_request_in_flight(self) -> bool:
+        return bool(self._api_in_flight)
+    
     def start_detection(self):
         """Start game detection based on current mode."""
         if self._is_detecting:
@@ -84,9 +136,11 @@ class GameDetector(QObject):
                 return
             # Start process detection first - API will start when game exe is running
             self.status_changed.emit(tr("detection_waiting_for_game"))
-            self._check_game_process()  # Immediate check
+            self._scheduler.state = STATE_WAITING
+            self._process_watcher.reset()
             self._process_timer.start(PROCESS_CHECK_INTERVAL)
-            
+            self._check_game_process()  # Immediate check
+        
         elif self._mode == DETECTION_MODE_MANUAL:
             self.status_changed.emit(tr("detection_manual_mode"))
     
@@ -96,8 +150,19 @@ class GameDetector(QObject):
         self._process_timer.stop()
         self._api_timer.stop()
         self._is_game_exe_running = False
+        self._generation += 1
+        self._breaker.release_probe()
+        self._scheduler.state = STATE_IDLE
         self.status_changed.emit(tr("detection_stopped"))
     
+    def shutdown(self, timeout_ms: int = 1000):
+        """Stop detection and wait briefly for in-flight API requests to finish."""
+        if self._is_detecting:
+            self.stop_detection()
+        self._api_pool.clear()
+        self._api_pool.waitForDone(timeout_ms)
+        self._api_client.close()
+    
     def manual_start(self):
         """Manually signal game start (for manual mode)."""
         if self._mode == DETECTION_MODE_MANUAL:
@@ -110,14 +175,11 @@ class GameDetector(QObject):
     
     def _check_game_process(self):
         """Check if the AoE4 game executable is running."""
-        is_running = False
-        try:
-            for proc in psutil.process_iter(['name']):
-                if proc.info['name'] and proc.info['name'].lower() == AOE4_EXECUTABLE.lower():
-                    is_running = True
-                    break
-        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-            pass
+        is_running = self._process_watcher.check()
+        
+        # Cheap PID check while the game runs, slowing full scans while it is absent
+        if self._process_timer.interval() != self._process_watcher.next_interval:
+            self._process_timer.setInterval(self._process_watcher.next_interval)
         
         if is_running != self._is_game_exe_running:
             self._is_game_exe_running = is_running
@@ -125,19 +187,21 @@ class GameDetector(QObject):
             if is_running:
                 # Game exe started - start API checks
                 self.status_changed.emit(tr("detection_game_exe_detected"))
-                check_interval_sec = API_CHECK_INTERVAL // 1000
+                self._scheduler.state = STATE_IN_MATCH if self._is_game_running else STATE_LOBBY
+                check_interval_sec = self._scheduler.base_interval() // 1000
                 self.status_changed.emit(tr("detection_api_active").format(interval=check_interval_sec))
-                self._check_api()  # Immediate check
-                self._api_timer.start(API_CHECK_INTERVAL)
+                self._check_api()  # Immediate check, the scheduler arms the next one
             else:
                 # Game exe closed - stop API checks
                 self._api_timer.stop()
+                self._breaker.release_probe()
+                self._scheduler.state = STATE_WAITING
                 if self._is_game_running:
                     self._set_game_running(False)
                 self.status_changed.emit(tr("detection_game_exe_closed"))
     
     def _check_api(self):
-        """Check if there's an ongoing game via AoE4World API."""
+        """Check if there's an ongoing game via AoE4World API (non-blocking)."""
         if not self._profile_id:
             return
         
@@ -145,45 +209,111 @@ class GameDetector(QObject):
         if not self._is_game_exe_running:
             return
         
+        # At most one request per profile in flight
+        profile_id = self._profile_id
+        if profile_id in self._api_in_flight:
+            return
+        
+        # Degraded upstream: wait for the breaker instead of burning a timeout per poll
+        if not self._breaker.allow_request():
+            self._schedule_next_api_check()
+            return
+        
         # Inform user that API check is starting
         self.status_changed.emit(tr("detection_checking_api"))
         
-        try:
-            url = AOE4_API_URL.format(profile_id=self._profile_id)
-            response = requests.get(url, timeout=10)
-            
-            if response.status_code == 200:
-                data = response.json()
-                is_ongoing = data.get('ongoing', False)
-                
-                if is_ongoing:
-                    # Game is ongoing - will be handled by _set_game_running
-                    pass
-                else:
-                    # No ongoing game
-                    self.status_changed.emit(tr("detection_api_check_complete"))
-                
-                self._set_game_running(is_ongoing)
-            elif response.status_code == 404:
-                self.status_changed.emit(tr("detection_profile_not_found"))
+        self._api_in_flight.add(profile_id)
+        self._scheduler.record_request()
+        self._api_pool.start(ApiCheckJob(
+            self._api_signals, self._api_client, profile_id, self._generation
+        ))
+    
+    def _on_api_result(self, result: ApiCheckResult):
+        """Handle an API check result on the GUI thread."""
+        self._api_in_flight.discard(result.profile_id)
+        
+        # Ignore results that no longer match the current detection state
+        if (result.generation != self._generation
+                or result.profile_id != self._profile_id
+                or not self._is_game_exe_running):
+            # Neither success nor failure: let the next check probe again
+            self._breaker.release_probe()
+            # A restart while this request was pending skipped its own check; keep polling
+            if not self._api_timer.isActive():
+                self._schedule_next_api_check()
+            return
+        
+        min_delay_ms = 0
+        if result.error_kind is None and (result.status_code == 200 or result.not_modified):
+            self._scheduler.record_success()
+            self._breaker.record_success()
+            # Quota exhausted: wait for the rate-limit reset before polling again
+            if result.retry_after:
+                min_delay_ms = int(result.retry_after * 1000)
+        else:
+            self._scheduler.record_error()
+            if self._is_upstream_failure(result):
+                self._breaker.record_failure(result.retry_after)
             else:
-                self.status_changed.emit(tr("detection_api_error").format(code=response.status_code))
-                
-        except requests.Timeout:
+                # Client-side problem (e.g. unknown profile), upstream is fine
+                self._breaker.record_success()
+        
+        # While degraded, "API degraded" was shown once on the transition
+        if self._breaker.state == BREAKER_CLOSED:
+            self._report_api_result(result)
+        
+        self._schedule_next_api_check(min_delay_ms)
+    
+    def _report_api_result(self, result: ApiCheckResult):
+        """Translate an API check result into status messages and game state."""
+        if result.error_kind == API_ERROR_TIMEOUT:
             self.status_changed.emit(tr("detection_api_timeout"))
-        except requests.ConnectionError:
+        elif result.error_kind == API_ERROR_CONNECTION:
             self.status_changed.emit(tr("detection_connection_error"))
-        except requests.RequestException as e:
-            error_msg = str(e)[:30]
-            self.status_changed.emit(tr("detection_api_connection_error").format(error=error_msg))
-        except Exception as e:
-            error_msg = str(e)[:30]
-            self.status_changed.emit(tr("detection_api_check_error").format(error=error_msg))
+        elif result.error_kind == API_ERROR_REQUEST:
+            self.status_changed.emit(tr("detection_api_connection_error").format(error=result.error))
+        elif result.error_kind is not None:
+            self.status_changed.emit(tr("detection_api_check_error").format(error=result.error))
+        elif result.status_code == 200 or result.not_modified:
+            if not result.ongoing:
+                # No ongoing game
+                self.status_changed.emit(tr("detection_api_check_complete"))
+            
+            self._set_game_running(result.ongoing)
+        elif result.status_code == 404:
+            self.status_changed.emit(tr("detection_profile_not_found"))
+        else:
+            self.status_changed.emit(tr("detection_api_error").format(code=result.status_code))
+    
+    @staticmethod
+    def _is_upstream_failure(result: ApiCheckResult) -> bool:
+        """Errors that mean aoe4world.com is down, slow or rate limiting us."""
+        if result.error_kind is not None:
+            return True
+        return result.status_code == 429 or result.status_code >= 500
+    
+    def _schedule_next_api_check(self, min_delay_ms: int = 0):
+        """Arm the API timer with the scheduler's interval for the current state."""
+        if self._is_detecting and self._is_game_exe_running:
+            interval = self._scheduler.next_interval()
+            breaker_wait = int(self._breaker.retry_in() * 1000)
+            self._api_timer.start(max(interval, breaker_wait, min_delay_ms))
+    
+    def _on_breaker_state_changed(self, state: str):
+        """Report API health transitions once instead of on every poll."""
+        if state == BREAKER_OPEN:
+            retry_sec = int(round(self._breaker.retry_in()))
+            self.status_changed.emit(tr("detection_api_degraded").format(seconds=retry_sec))
+        elif state == BREAKER_CLOSED:
+            self.status_changed.emit(tr("detection_api_recovered"))
+        self.api_health_changed.emit(state)
     
     def _set_game_running(self, is_running: bool):
         """Update game running state and emit signals."""
         if is_running != self._is_game_running:
             self._is_game_running = is_running
+            if self._scheduler.state in (STATE_LOBBY, STATE_IN_MATCH):
+                self._scheduler.state = STATE_IN_MATCH if is_running else STATE_LOBBY
             
             if is_running:
                 self.status_changed.emit(tr("detection_match_started"))
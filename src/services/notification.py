@@ -1,19 +1,62 @@
 import os
 import sys
-from PyQt6.QtCore import QObject, pyqtSignal
-from PyQt6.QtWidgets import QSystemTrayIcon, QApplication
-from typing import Optional
+from PyQt6.QtCore import QCoreApplication, QObject, QRunnable, QThreadPool, Qt, pyqtSignal
+from typing import TYPE_CHECKING, Optional
+from ..utils.constants import SOUND_ALERT
 from ..utils.localization import tr
+from .sound_bank import SoundBank, init_mixer
 
-# Initialize pygame mixer for sound
-import pygame
-pygame.mixer.init()
+if TYPE_CHECKING:
+    from PyQt6.QtWidgets import QSystemTrayIcon
+
+
+def _beep():
+    """System beep; only a widget application (not the headless one) has it."""
+    app = QCoreApplication.instance()
+    if hasattr(app, "beep"):
+        app.beep()
+
+
+class AudioInitSignals(QObject):
+    """Signal carrier for AudioInitJob."""
+    
+    finished = pyqtSignal(bool, str)  # success, error message
+
+
+class AudioInitJob(QRunnable):
+    """Imports pygame, opens the mixer and decodes the alert sounds off the UI thread."""
+    
+    def __init__(self, signals: AudioInitSignals, sound_bank: SoundBank):
+        super().__init__()
+        self._signals = signals
+        self._sound_bank = sound_bank
+    
+    def run(self):
+        try:
+            init_mixer()
+            self._sound_bank.preload()
+            ok, error = True, ""
+        except Exception as e:
+            ok, error = False, str(e)
+        
+        try:
+            self._signals.finished.emit(ok, error)
+        except RuntimeError:
+            # Service was destroyed while audio was loading
+            pass
 
 
 class NotificationService(QObject):
-    """Handles sound and popup notifications."""
+    """
+    Handles sound and popup notifications.
+    
+    The audio backend is not touched at construction: `init_audio` loads it on a
+    worker thread, and alerts that fire before it is ready are played as soon as
+    it is.
+    """
     
     notification_sent = pyqtSignal()
+    audio_ready = pyqtSignal(bool)  # success
     
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -21,9 +64,22 @@ class NotificationService(QObject):
         self._sound_enabled = True
         self._popup_enabled = True
         self._sound_file: Optional[str] = None
-        self._tray_icon: Optional[QSystemTrayIcon] = None
+        self._tray_icon: Optional['QSystemTrayIcon'] = None
+        self._sound_bank = SoundBank()
         
-        # Load default sound
+        # Audio backend state
+        self._audio_loading = False
+        self._audio_ready = False
+        self._audio_failed = False
+        self._pending_alerts = 0
+        self._audio_pool = QThreadPool(self)
+        self._audio_pool.setMaxThreadCount(1)
+        self._audio_signals = AudioInitSignals(self)
+        self._audio_signals.finished.connect(
+            self._on_audio_initialized, Qt.ConnectionType.QueuedConnection
+        )
+        
+        # Locate default sound (decoded later by init_audio)
         self._load_default_sound()
     
     def _load_default_sound(self):
@@ -38,8 +94,47 @@ class NotificationService(QObject):
         for path in possible_paths:
             if os.path.exists(path):
                 self._sound_file = os.path.abspath(path)
+                self._sound_bank.register(SOUND_ALERT, self._sound_file)
                 break
     
+    def init_audio(self):
+        """Start loading the audio backend in the background (no-op if already started)."""
+        if self._audio_loading or self._audio_ready or self._audio_failed:
+            return
+        self._audio_loading = True
+        self._audio_pool.start(AudioInitJob(self._audio_signals, self._sound_bank))
+    
+    def shutdown(self, timeout_ms: int = 1000):
+        """Wait for a pending audio initialisation to finish."""
+        self._audio_pool.waitForDone(timeout_ms)
+    
+    @property
+    def is_audio_ready(self) -> bool:
+        return self._audio_ready
+    
+    @property
+    def pending_alerts(self) -> int:
+        """Alerts waiting for the audio backend."""
+        return self._pending_alerts
+    
+    def _on_audio_initialized(self, ok: bool, error: str):
+        self._audio_loading = False
+        self._audio_ready = ok
+        self._audio_failed = not ok
+        if not ok:
+            print(f"Sound init error: {error}")
+        
+        if self._pending_alerts:
+            # Several queued alerts are played as one; a burst of the same sound helps nobody
+            self._pending_alerts = 0
+            self._play_sound()
+        
+        self.audio_ready.emit(ok)
+    
+    @property
+    def sound_bank(self) -> SoundBank:
+        return self._sound_bank
+    
     @property
     def volume(self) -> int:
         return self._volume
@@ -64,14 +159,15 @@ class NotificationService(QObject):
     def popup_enabled(self, value: bool):
         self._popup_enabled = value
     
-    def set_tray_icon(self, tray_icon: QSystemTrayIcon):
+    def set_tray_icon(self, tray_icon: 'QSystemTrayIcon'):
         """Set the system tray icon for popup notifications."""
         self._tray_icon = tray_icon
     
     def set_sound_file(self, path: str):
         """Set a custom sound file."""
-        if os.path.exists(path):
+        if os.path.exists(path) and path != self._sound_file:
             self._sound_file = path
+            self._sound_bank.register(SOUND_ALERT, path)
     
     def notify(self, title: str = None, message: str = None):
         """Send notification (sound and/or popup)."""
@@ -90,17 +186,22 @@ class NotificationService(QObject):
     
     def _play_sound(self):
         """Play the alert sound."""
+        if not self._audio_ready and not self._audio_failed:
+            # Backend still loading - play once it is ready
+            self._pending_alerts += 1
+            self.init_audio()
+            return
+        if self._audio_failed:
+            _beep()
+            return
+        
         try:
-            if self._sound_file and os.path.exists(self._sound_file):
-                pygame.mixer.music.load(self._sound_file)
-                pygame.mixer.music.set_volume(self._volume / 100.0)
-                pygame.mixer.music.play()
-            else:
+            if not self._sound_bank.play(SOUND_ALERT, self._volume / 100.0):
                 # Fallback: system beep
-                QApplication.beep()
+                _beep()
         except Exception as e:
             print(f"Sound error: {e}")
-            QApplication.beep()
+            _beep()
     
     def _show_popup(self, title: str, message: str):
         """Show a popup notification."""
@@ -108,7 +209,7 @@ class NotificationService(QObject):
             self._tray_icon.showMessage(
                 title,
                 message,
-                QSystemTrayIcon.MessageIcon.Information,
+                self._tray_icon.MessageIcon.Information,
                 2000  # Duration in ms
             )
     
@@ -0,0 +1,115 @@
+from typing import Callable, Iterable, Optional
+from ..utils.constants import (
+    AOE4_EXECUTABLE,
+    PROCESS_CHECK_INTERVAL,
+    PROCESS_SCAN_MAX_INTERVAL,
+    PROCESS_SCAN_BACKOFF,
+)
+
+
+def import_psutil():
+    """The `psutil` package, imported by the first process check."""
+    import psutil
+    return psutil
+
+
+class ProcessWatcher:
+    """
+    Watches for the game executable without rescanning the whole process table.
+    
+    The first hit of a full scan caches the game's PID and create time. While the
+    game runs only that single process is checked; full scans happen only while
+    the game is absent, with a cadence that slows down the longer it stays absent.
+    """
+    
+    def __init__(self, executable: str = AOE4_EXECUTABLE,
+                 scan_min_interval: int = PROCESS_CHECK_INTERVAL,
+                 scan_max_interval: int = PROCESS_SCAN_MAX_INTERVAL,
+                 scan_backoff: float = PROCESS_SCAN_BACKOFF,
+                 alive_interval: int = PROCESS_CHECK_INTERVAL,
+                 process_iter: Optional[Callable[..., Iterable]] = None,
+                 process_factory: Optional[Callable[[int], object]] = None):
+        self._executable = executable.lower()
+        self._scan_min_interval = scan_min_interval
+        self._scan_max_interval = max(scan_min_interval, scan_max_interval)
+        self._scan_backoff = scan_backoff
+        self._alive_interval = alive_interval
+        self._process_iter = process_iter  # psutil defaults are resolved on first use
+        self._process_factory = process_factory
+        
+        self._pid: Optional[int] = None
+        self._create_time: Optional[float] = None
+        self._scan_interval = scan_min_interval
+        self._full_scan_count = 0
+        self._alive_check_count = 0
+    
+    @property
+    def pid(self) -> Optional[int]:
+        """PID of the watched game process, if found."""
+        return self._pid
+    
+    @property
+    def is_running(self) -> bool:
+        return self._pid is not None
+    
+    @property
+    def next_interval(self) -> int:
+        """Milliseconds until the next check should run."""
+        if self._pid is not None:
+            return self._alive_interval
+        return int(self._scan_interval)
+    
+    @property
+    def full_scan_count(self) -> int:
+        return self._full_scan_count
+    
+    @property
+    def alive_check_count(self) -> int:
+        return self._alive_check_count
+    
+    def reset(self):
+        """Forget the cached process and restart the scan cadence."""
+        self._pid = None
+        self._create_time = None
+        self._scan_interval = self._scan_min_interval
+    
+    def check(self) -> bool:
+        """Return True if the game process is running."""
+        if self._pid is not None:
+            if self._is_cached_process_alive():
+                return True
+            self.reset()
+        
+        if self._scan():
+            self._scan_interval = self._scan_min_interval
+            return True
+        
+        self._scan_interval = min(
+            self._scan_interval * self._scan_backoff, self._scan_max_interval
+        )
+        return False
+    
+    def _is_cached_process_alive(self) -> bool:
+        """Check only the cached PID; create time guards against PID reuse."""
+        self._alive_check_count += 1
+        psutil = import_psutil()
+        try:
+            proc = (self._process_factory or psutil.Process)(self._pid)
+            return proc.create_time() == self._create_time
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            return False
+    
+    def _scan(self) -> bool:
+        """Walk the process table looking for the game executable."""
+        self._full_scan_count += 1
+        psutil = import_psutil()
+        try:
+            for proc in (self._process_iter or psutil.process_iter)(['name', 'create_time']):
+                name = proc.info.get('name')
+                if name and name.lower() == self._executable:
+                    self._pid = proc.pid
+                    self._create_time = proc.info.get('create_time')
+                    return True
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            pass
+        return False
@@ -0,0 +1,172 @@
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+import numpy as np
+from PyQt6.QtCore import QObject
+from .stats_tracker import StatsTracker
+
+
+# Columns available for percentiles, rolling averages and trends
+COLUMN_DURATION = "duration"
+COLUMN_ALERTS = "alerts"
+COLUMN_ALERTS_PER_MINUTE = "alerts_per_minute"
+
+# Heatmap values
+HEATMAP_SESSIONS = "sessions"
+HEATMAP_ALERTS = "alerts"
+HEATMAP_MINUTES = "minutes"
+
+
+@dataclass
+class SessionColumns:
+    """Session history as parallel NumPy arrays, oldest first."""
+    
+    start: np.ndarray  # datetime64[s]
+    duration: np.ndarray  # float64 seconds
+    alerts: np.ndarray  # int64
+    alerts_per_minute: np.ndarray  # float64
+    
+    def __len__(self) -> int:
+        return len(self.start)
+    
+    def column(self, name: str) -> np.ndarray:
+        return getattr(self, name)
+    
+    @classmethod
+    def from_history(cls, history: Sequence[Dict[str, Any]]) -> 'SessionColumns':
+        return cls.from_rows([(s["date"], s.get("duration_seconds", 0), s.get("alerts", 0)) for s in history])
+    
+    @classmethod
+    def from_rows(cls, rows: Sequence[Tuple[str, float, int]]) -> 'SessionColumns':
+        """Build from (ISO start, duration seconds, alerts) tuples."""
+        if not rows:
+            return cls(np.array([], dtype="datetime64[s]"), np.zeros(0), np.zeros(0, dtype=np.int64), np.zeros(0))
+        starts, durations, alerts = zip(*rows)
+        start = np.array(starts, dtype="datetime64[s]")
+        duration = np.array(durations, dtype=np.float64)
+        alerts = np.array(alerts, dtype=np.int64)
+        minutes = duration / 60.0
+        per_minute = np.divide(alerts, minutes, out=np.zeros_like(minutes), where=minutes > 0)
+        return cls(start, duration, alerts, per_minute)
+
+
+class SessionAnalytics(QObject):
+    """
+    Vectorised statistics over the tracker's session history.
+    
+    The history is converted to columns once and every result is cached until
+    the tracker emits `stats_updated`, so repeated reads (tab switches, panel
+    refreshes) cost a dict lookup.
+    """
+    
+    def __init__(self, stats_tracker: StatsTracker, parent=None):
+        super().__init__(parent)
+        self._stats = stats_tracker
+        self._cache: Dict[Tuple, Any] = {}
+        self._compute_count = 0
+        self._stats.stats_updated.connect(self.invalidate)
+    
+    @property
+    def compute_count(self) -> int:
+        """Cache misses since creation."""
+        return self._compute_count
+    
+    def invalidate(self):
+        self._cache.clear()
+    
+    def _cached(self, key: Tuple, compute: Callable[[], Any]) -> Any:
+        if key not in self._cache:
+            self._compute_count += 1
+            self._cache[key] = compute()
+        return self._cache[key]
+    
+    def columns(self) -> SessionColumns:
+        def compute():
+            store = self._stats.store
+            if store is not None:
+                # Skip building a dict (and encoding the timeline) per session
+                return SessionColumns.from_rows(store.session_rows())
+            return SessionColumns.from_history(self._stats.get_session_history())
+        return self._cached(("columns",), compute)
+    
+    def percentiles(self, column: str = COLUMN_ALERTS_PER_MINUTE,
+                    q: Sequence[float] = (25, 50, 75, 90)) -> Dict[float, float]:
+        """Percentiles of a column; empty history gives zeros."""
+        def compute():
+            values = self.columns().column(column)
+            if len(values) == 0:
+                return {p: 0.0 for p in q}
+            return dict(zip(q, np.percentile(values, q).tolist()))
+        return self._cached(("percentiles", column, tuple(q)), compute)
+    
+    def rolling_average(self, column: str = COLUMN_ALERTS_PER_MINUTE, window: int = 10) -> np.ndarray:
+        """Mean of the last `window` sessions at each session (shorter at the start)."""
+        def compute():
+            values = self.columns().column(column).astype(np.float64)
+            if len(values) == 0:
+                return values
+            sums = np.cumsum(values)
+            sums[window:] = sums[window:] - sums[:-window]
+            counts = np.minimum(np.arange(1, len(values) + 1), window)
+            return sums / counts
+        return self._cached(("rolling", column, window), compute)
+    
+    def heatmap(self, value: str = HEATMAP_SESSIONS) -> np.ndarray:
+        """7x24 totals by weekday (Monday = 0) and hour of session start."""
+        def compute():
+            cols = self.columns()
+            seconds = cols.start.astype(np.int64)
+            days = np.floor_divide(seconds, 86400)
+            weekday = (days + 3) % 7  # 1970-01-01 was a Thursday
+            hour = np.floor_divide(seconds - days * 86400, 3600)
+            weights = {
+                HEATMAP_SESSIONS: None,
+                HEATMAP_ALERTS: cols.alerts,
+                HEATMAP_MINUTES: cols.duration / 60.0,
+            }[value]
+            grid = np.bincount(weekday * 24 + hour, weights=weights, minlength=7 * 24)
+            return grid.reshape(7, 24)
+        return self._cached(("heatmap", value), compute)
+    
+    def streaks(self, today: Optional[np.datetime64] = None) -> Dict[str, int]:
+        """Longest run of consecutive days played, and the run ending today (or yesterday)."""
+        def compute():
+            days = np.unique(self.columns().start.astype("datetime64[D]"))
+            if len(days) == 0:
+                return {"longest": 0, "current": 0}
+            ordinals = days.astype(np.int64)
+            breaks = np.flatnonzero(np.diff(ordinals) != 1)
+            run_starts = np.concatenate(([0], breaks + 1))
+            run_ends = np.concatenate((breaks, [len(ordinals) - 1]))
+            lengths = run_ends - run_starts + 1
+            
+            reference = np.datetime64(today if today is not None else self._stats.clock.today(), "D").astype(np.int64)
+            last_run = int(lengths[-1]) if reference - ordinals[-1] <= 1 else 0
+            return {"longest": int(lengths.max()), "current": last_run}
+        return self._cached(("streaks", str(today)), compute)
+    
+    def trend(self, column: str = COLUMN_ALERTS_PER_MINUTE) -> float:
+        """Least-squares slope of a column per day of calendar time (0 with fewer than 2 days)."""
+        def compute():
+            cols = self.columns()
+            if len(cols) < 2:
+                return 0.0
+            x = (cols.start - cols.start[0]).astype(np.float64) / 86400.0
+            if np.ptp(x) == 0:
+                return 0.0
+            y = cols.column(column).astype(np.float64)
+            x_mean = x.mean()
+            return float(np.dot(x - x_mean, y - y.mean()) / np.dot(x - x_mean, x - x_mean))
+        return self._cached(("trend", column), compute)
+    
+    def summary(self) -> Dict[str, Any]:
+        """Headline numbers for the statistics tab."""
+        def compute():
+            cols = self.columns()
+            return {
+                "sessions": len(cols),
+                "median_alerts_per_minute": self.percentiles(COLUMN_ALERTS_PER_MINUTE, (50,))[50],
+                "p90_duration_seconds": self.percentiles(COLUMN_DURATION, (90,))[90],
+                "trend_alerts_per_minute_per_day": self.trend(COLUMN_ALERTS_PER_MINUTE),
+                **{f"{key}_streak": value for key, value in self.streaks().items()},
+            }
+        return self._cached(("summary",), compute)
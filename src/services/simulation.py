@@ -0,0 +1,173 @@
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Any, List, Optional
+from .game_detector import GameDetector
+from .stats_tracker import StatsTracker
+from .timer_service import TimerService
+from ..utils.clock import VirtualClock
+from ..utils.constants import DETECTION_MODE_MANUAL
+
+
+# Simulation actions
+SIM_MATCH_START = "match_start"
+SIM_MATCH_END = "match_end"
+SIM_PAUSE = "pause"
+SIM_RESUME = "resume"
+SIM_INTERVAL = "interval"
+
+
+@dataclass
+class SimulationEvent:
+    """Scripted action at `at` seconds after the simulation starts."""
+    
+    at: float
+    action: str
+    value: Any = None
+
+
+@dataclass
+class SimulationReport:
+    """What happened during a simulation run."""
+    
+    simulated_seconds: float = 0.0
+    wall_seconds: float = 0.0
+    wakeups: int = 0
+    ticks: int = 0
+    alert_times: List[float] = field(default_factory=list)
+    matches: int = 0
+    
+    @property
+    def alerts(self) -> int:
+        return len(self.alert_times)
+    
+    @property
+    def speedup(self) -> float:
+        """Simulated seconds per wall-clock second."""
+        if self.wall_seconds <= 0:
+            return float("inf")
+        return self.simulated_seconds / self.wall_seconds
+
+
+class SimulationDriver:
+    """
+    Replays matches through the timer/detector/stats pipeline on a virtual clock.
+    
+    Services are wired the same way MainWindow wires them. Instead of waiting for
+    Qt timers, the driver jumps the clock straight to the next timer wakeup or
+    scripted event, so hours of play run in milliseconds and deterministically.
+    """
+    
+    def __init__(self, clock: VirtualClock, timer_service: Optional[TimerService] = None,
+                 game_detector: Optional[GameDetector] = None,
+                 stats_tracker: Optional[StatsTracker] = None):
+        self._clock = clock
+        self._timer = timer_service or TimerService(clock=clock)
+        self._detector = game_detector or GameDetector(clock=clock)
+        self._stats = stats_tracker
+        self._detector.mode = DETECTION_MODE_MANUAL
+        self._report = SimulationReport()
+        self._origin = 0.0
+        
+        self._detector.game_started.connect(self._on_game_started)
+        self._detector.game_ended.connect(self._on_game_ended)
+        self._timer.tick.connect(self._on_tick)
+        self._timer.alert.connect(self._on_alert)
+        if self._stats:
+            self._timer.paused.connect(self._stats.record_pause)
+            self._timer.resumed.connect(self._stats.record_resume)
+    
+    @property
+    def timer_service(self) -> TimerService:
+        return self._timer
+    
+    @property
+    def game_detector(self) -> GameDetector:
+        return self._detector
+    
+    def run(self, events: List[SimulationEvent], until: Optional[float] = None) -> SimulationReport:
+        """Replay `events` (and timer wakeups) until `until` seconds or the last event."""
+        self._report = SimulationReport()
+        self._origin = self._clock.monotonic()
+        queue = sorted(events, key=lambda e: e.at)
+        end = until if until is not None else (queue[-1].at if queue else 0.0)
+        end_time = self._origin + end
+        index = 0
+        wall_start = time.perf_counter()
+        
+        while True:
+            next_event = self._origin + queue[index].at if index < len(queue) else None
+            next_wake = self._timer.next_wake_time
+            
+            # Events win ties so e.g. a pause lands before a same-instant wakeup
+            if next_event is not None and next_event <= end_time and (
+                    next_wake is None or next_event <= next_wake):
+                self._clock.advance_to(next_event)
+                self._apply(queue[index])
+                index += 1
+            elif next_wake is not None and next_wake <= end_time:
+                self._clock.advance_to(next_wake)
+                self._report.wakeups += 1
+                self._timer.process_wakeup()
+            else:
+                break
+        
+        self._clock.advance_to(end_time)
+        self._report.simulated_seconds = end
+        self._report.wall_seconds = time.perf_counter() - wall_start
+        return self._report
+    
+    def _apply(self, event: SimulationEvent):
+        if event.action == SIM_MATCH_START:
+            self._detector.manual_start()
+        elif event.action == SIM_MATCH_END:
+            self._detector.manual_stop()
+        elif event.action == SIM_PAUSE:
+            self._timer.pause()
+        elif event.action == SIM_RESUME:
+            self._timer.resume()
+        elif event.action == SIM_INTERVAL:
+            self._timer.interval = int(event.value)
+            if self._stats:
+                self._stats.record_interval_change(int(event.value))
+        else:
+            raise ValueError(f"Unknown simulation action: {event.action}")
+    
+    def _on_game_started(self):
+        self._report.matches += 1
+        self._timer.start()
+        if self._stats:
+            self._stats.start_session(self._timer.interval)
+    
+    def _on_game_ended(self):
+        self._timer.stop()
+        if self._stats:
+            self._stats.end_session()
+    
+    def _on_tick(self, remaining: int):
+        self._report.ticks += 1
+    
+    def _on_alert(self):
+        self._report.alert_times.append(self._clock.monotonic() - self._origin)
+        if self._stats:
+            self._stats.record_alert()
+
+
+def generate_match_script(matches: int, seed: int = 0,
+                          min_length: float = 900, max_length: float = 2700,
+                          lobby_gap: float = 120, pause_chance: float = 0.2) -> List[SimulationEvent]:
+    """Deterministic script of back-to-back matches with occasional pauses."""
+    rng = random.Random(seed)
+    events: List[SimulationEvent] = []
+    t = 0.0
+    for _ in range(matches):
+        t += lobby_gap
+        length = rng.uniform(min_length, max_length)
+        events.append(SimulationEvent(t, SIM_MATCH_START))
+        if rng.random() < pause_chance:
+            pause_at = t + rng.uniform(60, length - 120)
+            events.append(SimulationEvent(pause_at, SIM_PAUSE))
+            events.append(SimulationEvent(pause_at + rng.uniform(10, 90), SIM_RESUME))
+        t += length
+        events.append(SimulationEvent(t, SIM_MATCH_END))
+    return events
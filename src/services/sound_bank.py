@@ -0,0 +1,120 @@
+import os
+import threading
+from typing import TYPE_CHECKING, Dict, Optional
+from ..utils.constants import SOUND_RESERVED_CHANNELS
+
+if TYPE_CHECKING:
+    import pygame
+
+
+def init_mixer():
+    """
+    Import pygame and open the audio device.
+    
+    This is the slow part of audio setup (SDL load, device open), so callers
+    run it on a worker thread once the UI is up.
+    """
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    import pygame
+    if not pygame.mixer.get_init():
+        pygame.mixer.init()
+
+
+class SoundBank:
+    """
+    Alert sounds decoded once into memory and played on reserved mixer channels.
+    
+    Each registered path is decoded into a `pygame.mixer.Sound` the first time it
+    is needed (or by `preload`), so playing an alert touches neither the disk nor
+    the decoder. Reserved channels keep other mixer users from stealing them.
+    
+    `preload` runs on the audio worker while the GUI thread may register a new
+    file, so the path and buffer maps are only touched under a lock; decoding
+    itself happens outside it.
+    """
+    
+    def __init__(self, reserved_channels: int = SOUND_RESERVED_CHANNELS):
+        self._paths: Dict[str, str] = {}
+        self._sounds: Dict[str, "pygame.mixer.Sound"] = {}
+        self._reserved_channels = reserved_channels
+        self._channels = []
+        self._next_channel = 0
+        self._decode_count = 0
+        self._lock = threading.Lock()
+    
+    @property
+    def decode_count(self) -> int:
+        """Number of times a sound file was decoded."""
+        return self._decode_count
+    
+    def path(self, key: str) -> Optional[str]:
+        with self._lock:
+            return self._paths.get(key)
+    
+    def register(self, key: str, path: str):
+        """Map `key` to a sound file; the cached buffer is dropped only if the path changes."""
+        with self._lock:
+            if self._paths.get(key) == path:
+                return
+            self._paths[key] = path
+            self._sounds.pop(key, None)
+    
+    def is_loaded(self, key: str) -> bool:
+        with self._lock:
+            return key in self._sounds
+    
+    def preload(self):
+        """Decode every registered sound now instead of on first play."""
+        with self._lock:
+            keys = list(self._paths)
+        for key in keys:
+            self._get(key)
+    
+    def play(self, key: str, volume: float = 1.0) -> bool:
+        """Play a registered sound; returns False if it is missing or undecodable."""
+        sound = self._get(key)
+        if sound is None:
+            return False
+        channel = self._channel()
+        if channel is None:
+            sound.set_volume(volume)
+            return sound.play() is not None
+        channel.set_volume(volume)
+        channel.play(sound)
+        return True
+    
+    def clear(self):
+        """Drop all decoded buffers."""
+        with self._lock:
+            self._sounds.clear()
+    
+    def _get(self, key: str) -> Optional["pygame.mixer.Sound"]:
+        with self._lock:
+            sound = self._sounds.get(key)
+            path = self._paths.get(key)
+        if sound is not None:
+            return sound
+        import pygame
+        if not path or not os.path.exists(path):
+            return None
+        sound = pygame.mixer.Sound(path)
+        with self._lock:
+            self._decode_count += 1
+            # Keep it only if the file was not replaced while decoding
+            if self._paths.get(key) == path:
+                self._sounds[key] = sound
+        return sound
+    
+    def _channel(self) -> Optional["pygame.mixer.Channel"]:
+        """Round-robin over the reserved channels."""
+        import pygame
+        if not self._channels and self._reserved_channels > 0:
+            if pygame.mixer.get_num_channels() < self._reserved_channels:
+                pygame.mixer.set_num_channels(self._reserved_channels)
+            pygame.mixer.set_reserved(self._reserved_channels)
+            self._channels = [pygame.mixer.Channel(i) for i in range(self._reserved_channels)]
+        if not self._channels:
+            return None
+        channel = self._channels[self._next_channel % len(self._channels)]
+        self._next_channel += 1
+        return channel
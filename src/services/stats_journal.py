@@ -0,0 +1,97 @@
+import json
+import os
+from typing import Any, Dict, List
+
+
+# Journal record kinds
+JOURNAL_SESSION_START = "start"
+JOURNAL_ALERT = "alert"
+JOURNAL_SESSION_END = "end"
+JOURNAL_PAUSE = "pause"
+JOURNAL_RESUME = "resume"
+JOURNAL_INTERVAL = "interval"
+
+
+class StatsJournal:
+    """
+    Append-only log of statistics events, one JSON object per line.
+    
+    Every record carries an increasing `seq` so a snapshot can remember which
+    records it already contains. Appends are a single unbuffered `write` of one
+    short line, independent of how much history the snapshot holds.
+    """
+    
+    def __init__(self, path: str, last_seq: int = 0):
+        self._path = path
+        self._seq = last_seq
+        self._file = None
+        self._write_count = 0
+    
+    @property
+    def path(self) -> str:
+        return self._path
+    
+    @property
+    def last_seq(self) -> int:
+        """Sequence number of the newest record."""
+        return self._seq
+    
+    @property
+    def write_count(self) -> int:
+        """Records appended by this instance."""
+        return self._write_count
+    
+    def append(self, kind: str, **fields) -> Dict[str, Any]:
+        """Write one record and return it."""
+        self._seq += 1
+        record = {"seq": self._seq, "kind": kind, **fields}
+        line = json.dumps(record, separators=(',', ':'), default=str) + "\n"
+        if self._file is None:
+            self._file = open(self._path, 'ab', buffering=0)
+            # Never glue a record onto a torn last line left by a crash
+            if not self._ends_with_newline():
+                line = "\n" + line
+        self._file.write(line.encode('utf-8'))
+        self._write_count += 1
+        return record
+    
+    def _ends_with_newline(self) -> bool:
+        with open(self._path, 'rb') as f:
+            f.seek(0, os.SEEK_END)
+            if f.tell() == 0:
+                return True
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b"\n"
+    
+    def read(self, after_seq: int = 0) -> List[Dict[str, Any]]:
+        """
+        Records with `seq` greater than `after_seq`, oldest first.
+        
+        A torn last line from a crash mid-write is skipped.
+        """
+        records = []
+        if not os.path.exists(self._path):
+            return records
+        with open(self._path, 'r', encoding='utf-8', errors='replace') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if not isinstance(record, dict) or record.get("seq", 0) <= after_seq:
+                    continue
+                records.append(record)
+        if records:
+            self._seq = max(self._seq, records[-1]["seq"])
+        return records
+    
+    def truncate(self):
+        """Drop all records once they are part of a snapshot; numbering continues."""
+        self.close()
+        with open(self._path, 'wb'):
+            pass
+    
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -0,0 +1,74 @@
+from bisect import bisect_left, bisect_right
+from datetime import date
+from typing import Any, Dict, Iterable, List, Tuple
+
+
+class DailyRollup:
+    """
+    Cumulative per-day totals for O(log n) date-range statistics.
+    
+    Days are kept sorted (as ordinals) with running sums of alerts, seconds and
+    sessions, so any range is two binary searches and a subtraction no matter
+    how many days it spans. Adding to the newest day, the normal case, is O(1).
+    """
+    
+    def __init__(self, daily: Iterable[Tuple[str, Dict[str, Any]]] = ()):
+        self._days: List[int] = []
+        # cum[i] is the sum over the first i days; cum[0] == 0
+        self._alerts: List[int] = [0]
+        self._time: List[float] = [0.0]
+        self._sessions: List[int] = [0]
+        self.rebuild(daily)
+    
+    def __len__(self) -> int:
+        return len(self._days)
+    
+    def rebuild(self, daily: Iterable[Tuple[str, Dict[str, Any]]]):
+        """Rebuild from (ISO day, stats) pairs in any order."""
+        self._days = []
+        self._alerts, self._time, self._sessions = [0], [0.0], [0]
+        for day, stats in sorted(daily, key=lambda item: item[0]):
+            self.add(date.fromisoformat(day), stats.get("alerts", 0),
+                     stats.get("time_seconds", 0), stats.get("sessions", 0))
+    
+    def add(self, day: date, alerts: int, time_seconds: float, sessions: int):
+        """Add to the totals of `day`."""
+        ordinal = day.toordinal()
+        days = self._days
+        
+        if days and ordinal == days[-1]:
+            self._alerts[-1] += alerts
+            self._time[-1] += time_seconds
+            self._sessions[-1] += sessions
+            return
+        
+        if not days or ordinal > days[-1]:
+            days.append(ordinal)
+            self._alerts.append(self._alerts[-1] + alerts)
+            self._time.append(self._time[-1] + time_seconds)
+            self._sessions.append(self._sessions[-1] + sessions)
+            return
+        
+        # Back-dated entry (e.g. imported history): shift the suffix
+        index = bisect_left(days, ordinal)
+        if days[index] != ordinal:
+            days.insert(index, ordinal)
+            self._alerts.insert(index + 1, self._alerts[index])
+            self._time.insert(index + 1, self._time[index])
+            self._sessions.insert(index + 1, self._sessions[index])
+        for i in range(index + 1, len(self._alerts)):
+            self._alerts[i] += alerts
+            self._time[i] += time_seconds
+            self._sessions[i] += sessions
+    
+    def range(self, start: date, end: date) -> Dict[str, Any]:
+        """Totals for the days from `start` to `end`, inclusive."""
+        lo = bisect_left(self._days, start.toordinal())
+        hi = bisect_right(self._days, end.toordinal())
+        if hi <= lo:
+            return {"alerts": 0, "time_seconds": 0, "sessions": 0}
+        return {
+            "alerts": self._alerts[hi] - self._alerts[lo],
+            "time_seconds": self._time[hi] - self._time[lo],
+            "sessions": self._sessions[hi] - self._sessions[lo],
+        }
@@ -0,0 +1,254 @@
+import base64
+import sqlite3
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY,
+    start_time TEXT NOT NULL,
+    end_time TEXT,
+    duration_seconds REAL NOT NULL DEFAULT 0,
+    alerts INTEGER NOT NULL DEFAULT 0,
+    timeline BLOB
+);
+CREATE INDEX IF NOT EXISTS idx_sessions_start ON sessions(start_time);
+
+CREATE TABLE IF NOT EXISTS alerts (
+    id INTEGER PRIMARY KEY,
+    session_id INTEGER REFERENCES sessions(id) ON DELETE SET NULL,
+    at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_alerts_at ON alerts(at);
+CREATE INDEX IF NOT EXISTS idx_alerts_session ON alerts(session_id);
+
+CREATE TABLE IF NOT EXISTS daily (
+    day TEXT PRIMARY KEY,
+    alerts INTEGER NOT NULL DEFAULT 0,
+    time_seconds REAL NOT NULL DEFAULT 0,
+    sessions INTEGER NOT NULL DEFAULT 0
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS totals (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    total_alerts INTEGER NOT NULL DEFAULT 0,
+    total_sessions INTEGER NOT NULL DEFAULT 0,
+    total_game_time_seconds REAL NOT NULL DEFAULT 0
+);
+INSERT OR IGNORE INTO totals (id) VALUES (1);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+) WITHOUT ROWID;
+"""
+
+EMPTY_DAY = {"alerts": 0, "time_seconds": 0, "sessions": 0}
+
+
+class SqliteStatsStore:
+    """
+    Statistics kept in SQLite: full session and alert history plus daily rollups.
+    
+    Day and range statistics are primary-key range scans over `daily`; session
+    and alert history are indexed by timestamp. Timestamps are stored as ISO
+    strings, which sort chronologically.
+    """
+    
+    def __init__(self, path: str):
+        self._path = path
+        self._conn = sqlite3.connect(path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        columns = [row[1] for row in self._conn.execute("PRAGMA table_info(sessions)")]
+        if "timeline" not in columns:
+            self._conn.execute("ALTER TABLE sessions ADD COLUMN timeline BLOB")
+        self._conn.commit()
+    
+    @property
+    def path(self) -> str:
+        return self._path
+    
+    def close(self):
+        self._conn.close()
+    
+    # Events
+    
+    def start_session(self, start: datetime) -> int:
+        with self._conn:
+            cursor = self._conn.execute("INSERT INTO sessions (start_time) VALUES (?)", (start.isoformat(),))
+            self._conn.execute("UPDATE totals SET total_sessions = total_sessions + 1 WHERE id = 1")
+        return cursor.lastrowid
+    
+    def record_alert(self, at: datetime, session_id: Optional[int] = None, timeline: Optional[bytes] = None):
+        with self._conn:
+            self._conn.execute("INSERT INTO alerts (session_id, at) VALUES (?, ?)", (session_id, at.isoformat()))
+            self._conn.execute("UPDATE totals SET total_alerts = total_alerts + 1 WHERE id = 1")
+            if session_id is not None:
+                self._conn.execute(
+                    "UPDATE sessions SET alerts = alerts + 1, timeline = COALESCE(?, timeline) WHERE id = ?",
+                    (timeline, session_id)
+                )
+    
+    def update_timeline(self, session_id: int, timeline: bytes):
+        """Store the packed timeline of a running session."""
+        with self._conn:
+            self._conn.execute("UPDATE sessions SET timeline = ? WHERE id = ?", (timeline, session_id))
+    
+    def end_session(self, session_id: int, end: datetime, duration: float, timeline: Optional[bytes] = None):
+        """Close a session and add it to the daily rollup of the day it ended."""
+        with self._conn:
+            row = self._conn.execute("SELECT alerts FROM sessions WHERE id = ?", (session_id,)).fetchone()
+            alerts = row[0] if row else 0
+            self._conn.execute(
+                "UPDATE sessions SET end_time = ?, duration_seconds = ?, timeline = COALESCE(?, timeline) "
+                "WHERE id = ?",
+                (end.isoformat(), duration, timeline, session_id)
+            )
+            self._conn.execute(
+                "UPDATE totals SET total_game_time_seconds = total_game_time_seconds + ? WHERE id = 1",
+                (duration,)
+            )
+            self._add_daily(end.date().isoformat(), alerts, duration, 1)
+    
+    def open_session(self) -> Optional[Tuple[int, datetime, datetime]]:
+        """Newest session that was never ended: (id, start, last event time)."""
+        row = self._conn.execute(
+            "SELECT s.id, s.start_time, COALESCE(MAX(a.at), s.start_time) FROM sessions s "
+            "LEFT JOIN alerts a ON a.session_id = s.id "
+            "WHERE s.end_time IS NULL GROUP BY s.id ORDER BY s.start_time DESC LIMIT 1"
+        ).fetchone()
+        if row is None:
+            return None
+        return row[0], datetime.fromisoformat(row[1]), datetime.fromisoformat(row[2])
+    
+    def session_alerts(self, session_id: int) -> int:
+        row = self._conn.execute("SELECT alerts FROM sessions WHERE id = ?", (session_id,)).fetchone()
+        return row[0] if row else 0
+    
+    def reset(self):
+        with self._conn:
+            self._conn.execute("DELETE FROM alerts")
+            self._conn.execute("DELETE FROM sessions WHERE end_time IS NOT NULL")
+            self._conn.execute("DELETE FROM daily")
+            self._conn.execute(
+                "UPDATE totals SET total_alerts = 0, total_sessions = 0, total_game_time_seconds = 0 WHERE id = 1"
+            )
+    
+    # Queries
+    
+    def totals(self) -> Dict[str, Any]:
+        row = self._conn.execute(
+            "SELECT total_alerts, total_sessions, total_game_time_seconds FROM totals WHERE id = 1"
+        ).fetchone()
+        return {"total_alerts": row[0], "total_sessions": row[1], "total_game_time_seconds": row[2]}
+    
+    def day_stats(self, day: date) -> Dict[str, Any]:
+        row = self._conn.execute(
+            "SELECT alerts, time_seconds, sessions FROM daily WHERE day = ?", (day.isoformat(),)
+        ).fetchone()
+        if row is None:
+            return dict(EMPTY_DAY)
+        return {"alerts": row[0], "time_seconds": row[1], "sessions": row[2]}
+    
+    def daily_rows(self) -> List[Tuple[str, Dict[str, Any]]]:
+        """All daily rollups as (ISO day, stats) pairs, oldest first."""
+        rows = self._conn.execute("SELECT day, alerts, time_seconds, sessions FROM daily ORDER BY day").fetchall()
+        return [(r[0], {"alerts": r[1], "time_seconds": r[2], "sessions": r[3]}) for r in rows]
+    
+    def range_stats(self, start: date, end: date) -> Dict[str, Any]:
+        """Summed daily statistics for `start`..`end`, both inclusive."""
+        row = self._conn.execute(
+            "SELECT COALESCE(SUM(alerts), 0), COALESCE(SUM(time_seconds), 0), COALESCE(SUM(sessions), 0) "
+            "FROM daily WHERE day BETWEEN ? AND ?",
+            (start.isoformat(), end.isoformat())
+        ).fetchone()
+        return {"alerts": row[0], "time_seconds": row[1], "sessions": row[2]}
+    
+    def session_history(self, start: Optional[datetime] = None, end: Optional[datetime] = None,
+                        limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Ended sessions, oldest first, optionally within [start, end) and limited to the newest `limit`."""
+        query = "SELECT start_time, duration_seconds, alerts, timeline FROM sessions WHERE end_time IS NOT NULL"
+        params: List[Any] = []
+        if start is not None:
+            query += " AND start_time >= ?"
+            params.append(start.isoformat())
+        if end is not None:
+            query += " AND start_time < ?"
+            params.append(end.isoformat())
+        query += " ORDER BY start_time DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        rows = self._conn.execute(query, params).fetchall()
+        sessions = []
+        for row in reversed(rows):
+            session = {"date": row[0], "duration_seconds": row[1], "alerts": row[2]}
+            if row[3] is not None:
+                # Same encoding as the JSON backend
+                session["timeline"] = base64.b64encode(row[3]).decode('ascii')
+            sessions.append(session)
+        return sessions
+    
+    def session_rows(self) -> List[Tuple[str, float, int]]:
+        """(start, duration, alerts) of every ended session, oldest first, for bulk analytics."""
+        return self._conn.execute(
+            "SELECT start_time, duration_seconds, alerts FROM sessions "
+            "WHERE end_time IS NOT NULL ORDER BY start_time"
+        ).fetchall()
+    
+    # Migration
+    
+    def is_empty(self) -> bool:
+        return self._conn.execute("SELECT 1 FROM sessions LIMIT 1").fetchone() is None and \
+            self._conn.execute("SELECT 1 FROM daily LIMIT 1").fetchone() is None
+    
+    def get_meta(self, key: str) -> Optional[str]:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+    
+    def import_json_stats(self, stats: Dict[str, Any]):
+        """
+        One-time import of a JSON statistics document.
+        
+        Totals and daily rollups are copied as-is; sessions come from
+        `session_history`, which is all the JSON format kept of them.
+        """
+        with self._conn:
+            self._conn.execute(
+                "UPDATE totals SET total_alerts = ?, total_sessions = ?, total_game_time_seconds = ? WHERE id = 1",
+                (stats.get("total_alerts", 0), stats.get("total_sessions", 0),
+                 stats.get("total_game_time_seconds", 0))
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO daily (day, alerts, time_seconds, sessions) VALUES (?, ?, ?, ?)",
+                ((day, d.get("alerts", 0), d.get("time_seconds", 0), d.get("sessions", 0))
+                 for day, d in stats.get("daily_stats", {}).items())
+            )
+            self._conn.executemany(
+                "INSERT INTO sessions (start_time, end_time, duration_seconds, alerts, timeline) "
+                "VALUES (?, ?, ?, ?, ?)",
+                self._imported_sessions(stats.get("session_history", []))
+            )
+            self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('migrated_from_json', ?)",
+                               (datetime.now().isoformat(),))
+    
+    @staticmethod
+    def _imported_sessions(history: List[Dict[str, Any]]):
+        for session in history:
+            if not session.get("date"):
+                continue
+            duration = session.get("duration_seconds", 0)
+            end = datetime.fromisoformat(session["date"]) + timedelta(seconds=duration)
+            timeline = base64.b64decode(session["timeline"]) if session.get("timeline") is not None else None
+            yield session["date"], end.isoformat(), duration, session.get("alerts", 0), timeline
+    
+    def _add_daily(self, day: str, alerts: int, time_seconds: float, sessions: int):
+        self._conn.execute(
+            "INSERT INTO daily (day, alerts, time_seconds, sessions) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT(day) DO UPDATE SET alerts = alerts + excluded.alerts, "
+            "time_seconds = time_seconds + excluded.time_seconds, sessions = sessions + excluded.sessions",
+            (day, alerts, time_seconds, sessions)
+        )
@@ -1,23 +1,72 @@
 import json
 import os
-from datetime import datetime, date
-from typing import Dict, List, Any, Optional
-from PyQt6.QtCore import QObject, pyqtSignal
-from ..utils.constants import STATS_FILE
+from datetime import date, datetime, timedelta
+from typing import TYPE_CHECKING, Dict, List, Any, Optional
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+from .stats_rollup import DailyRollup
+from .session_timeline import (
+    SessionTimeline, TIMELINE_ALERT, TIMELINE_PAUSE, TIMELINE_RESUME, TIMELINE_INTERVAL
+)
+from .stats_journal import (
+    StatsJournal, JOURNAL_SESSION_START, JOURNAL_ALERT, JOURNAL_SESSION_END,
+    JOURNAL_PAUSE, JOURNAL_RESUME, JOURNAL_INTERVAL
+)
+from ..utils.clock import Clock, SYSTEM_CLOCK
+from ..utils.constants import (
+    STATS_FILE, STATS_JOURNAL_SUFFIX, STATS_COMPACT_IDLE_MS, STATS_DB_FILE,
+    STATS_BACKEND_JSON, STATS_BACKEND_SQLITE
+)
+from ..utils.fileio import atomic_write_json
 from ..utils.localization import tr
 
+if TYPE_CHECKING:
+    from .stats_store import SqliteStatsStore
+
 
 class StatsTracker(QObject):
-    """Tracks and persists usage statistics."""
+    """
+    Tracks and persists usage statistics.
+    
+    Events (session start, alert, session end) are appended to a small journal
+    as they happen; the full statistics snapshot is only rewritten when the
+    journal is compacted at session end or after a quiet period. Loading replays
+    any journal records newer than the snapshot, so a crashed session is kept.
+    
+    With the SQLite backend, events go straight to a `SqliteStatsStore` that
+    keeps the full history and answers day/range queries from indexes; an
+    existing JSON statistics file is imported into it once.
+    
+    Both backends keep a prefix-sum rollup of the daily totals in memory, so
+    range statistics of any span cost two binary searches. Each session also
+    gets a packed `SessionTimeline` of its alerts, pauses and interval changes.
+    """
     
     stats_updated = pyqtSignal()
+    session_changed = pyqtSignal(bool)  # True when a session starts, False when it ends
     
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, stats_path: Optional[str] = None, clock: Optional[Clock] = None,
+                 backend: str = STATS_BACKEND_JSON):
         super().__init__(parent)
-        self._stats_path = self._get_stats_path()
+        self._clock = clock or SYSTEM_CLOCK
+        self._stats_path = stats_path or self._get_stats_path()
+        self._backend = backend
         self._stats: Dict[str, Any] = {}
+        self._store: Optional["SqliteStatsStore"] = None
+        self._session_id: Optional[int] = None
+        self._rollup = DailyRollup()
+        self._timeline = SessionTimeline()
         self._session_start: Optional[datetime] = None
         self._session_alerts = 0
+        self._last_event: Optional[datetime] = None
+        self._snapshot_count = 0
+        self._journal: Optional[StatsJournal] = None
+        
+        # Compact once events stop arriving for a while
+        self._idle_timer = QTimer(self)
+        self._idle_timer.setSingleShot(True)
+        self._idle_timer.setInterval(STATS_COMPACT_IDLE_MS)
+        self._idle_timer.timeout.connect(self.compact)
+        
         self._load()
     
     @staticmethod
@@ -28,8 +77,50 @@ class StatsTracker(QObject):
         os.makedirs(config_dir, exist_ok=True)
         return os.path.join(config_dir, STATS_FILE)
     
+    @property
+    def backend(self) -> str:
+        return self._backend
+    
+    @property
+    def clock(self) -> Clock:
+        return self._clock
+    
+    @property
+    def store(self) -> Optional["SqliteStatsStore"]:
+        """The SQLite store, when that backend is active."""
+        return self._store
+    
     def _load(self):
-        """Load statistics from file."""
+        """Load statistics from the configured backend."""
+        if self._backend == STATS_BACKEND_SQLITE:
+            self._load_sqlite()
+        else:
+            self._load_json()
+    
+    def _load_sqlite(self):
+        """Open the database, importing the JSON statistics on first use."""
+        # sqlite3 is only imported when this backend is selected
+        from .stats_store import SqliteStatsStore
+        
+        db_path = os.path.join(os.path.dirname(os.path.abspath(self._stats_path)), STATS_DB_FILE)
+        self._store = SqliteStatsStore(db_path)
+        if self._store.is_empty() and self._store.get_meta("migrated_from_json") is None \
+                and os.path.exists(self._stats_path):
+            # Replays and compacts any pending journal before the import
+            self._load_json()
+            self._store.import_json_stats(self._stats)
+            self._journal.close()
+        
+        open_session = self._store.open_session()
+        if open_session is not None:
+            # The app exited mid-session: close it at its last recorded event
+            session_id, start, last_event = open_session
+            self._store.end_session(session_id, last_event, (last_event - start).total_seconds())
+        
+        self._rollup.rebuild(self._store.daily_rows())
+    
+    def _load_json(self):
+        """Load statistics from the JSON snapshot and journal."""
         try:
             if os.path.exists(self._stats_path):
                 with open(self._stats_path, 'r', encoding='utf-8') as f:
@@ -48,28 +139,195 @@ class StatsTracker(QObject):
         for key, value in defaults.items():
             if key not in self._stats:
                 self._stats[key] = value
+        self._rollup.rebuild(self._stats["daily_stats"].items())
+        
+        # Session that was still open when the snapshot was taken
+        open_session = self._stats.pop("open_session", None)
+        if open_session:
+            self._session_start = datetime.fromisoformat(open_session["start"])
+            self._session_alerts = open_session.get("alerts", 0)
+            self._timeline = SessionTimeline.decode(open_session.get("timeline"))
+            self._last_event = datetime.fromisoformat(open_session.get("last", open_session["start"]))
+        
+        # Replay events written after the snapshot
+        snapshot_seq = self._stats.get("journal_seq", 0)
+        self._journal = StatsJournal(self._stats_path + STATS_JOURNAL_SUFFIX, last_seq=snapshot_seq)
+        records = self._journal.read(after_seq=snapshot_seq)
+        for record in records:
+            self._apply(record)
+        
+        if self._session_start is not None:
+            # The app exited mid-session: close it at its last recorded event
+            self._close_session(self._last_event or self._session_start)
+        if records or open_session:
+            self.compact()
     
     def _save(self):
-        """Save statistics to file."""
+        """Write the statistics snapshot atomically."""
         try:
-            with open(self._stats_path, 'w', encoding='utf-8') as f:
-                json.dump(self._stats, f, indent=2, default=str)
-        except IOError as e:
+            atomic_write_json(self._stats_path, self._stats, indent=2)
+            self._snapshot_count += 1
+            return True
+        except (IOError, OSError) as e:
             print(f"Error saving stats: {e}")
+            return False
+    
+    def _record(self, kind: str, **fields):
+        """Journal an event and apply it to the in-memory statistics."""
+        fields["t"] = self._clock.now().isoformat()
+        try:
+            record = self._journal.append(kind, **fields)
+        except (IOError, OSError) as e:
+            print(f"Error writing stats journal: {e}")
+            record = {"kind": kind, **fields}
+        self._apply(record)
+        self._idle_timer.start()
     
-    def start_session(self):
-        """Start a new tracking session."""
-        self._session_start = datetime.now()
+    def _apply(self, record: Dict[str, Any]):
+        """Update statistics from one journal record (live or replayed)."""
+        kind = record.get("kind")
+        when = datetime.fromisoformat(record["t"])
+        self._last_event = when
+        
+        if kind == JOURNAL_SESSION_START:
+            self._begin_session(when, record.get("interval"))
+            self._stats["total_sessions"] += 1
+        elif kind == JOURNAL_ALERT:
+            self._session_alerts += 1
+            self._stats["total_alerts"] += 1
+            self._add_timeline_event(TIMELINE_ALERT, when)
+        elif kind == JOURNAL_PAUSE:
+            self._add_timeline_event(TIMELINE_PAUSE, when)
+        elif kind == JOURNAL_RESUME:
+            self._add_timeline_event(TIMELINE_RESUME, when)
+        elif kind == JOURNAL_INTERVAL:
+            self._add_timeline_event(TIMELINE_INTERVAL, when, record.get("interval", 0))
+        elif kind == JOURNAL_SESSION_END:
+            if self._session_start is not None:
+                self._close_session(when, record.get("duration"))
+    
+    def _begin_session(self, start: datetime, interval: Optional[int] = None):
+        self._session_start = start
         self._session_alerts = 0
-        self._stats["total_sessions"] += 1
-        self._save()
+        self._timeline = SessionTimeline()
+        if interval:
+            self._timeline.append(TIMELINE_INTERVAL, 0, interval)
+    
+    def _add_timeline_event(self, kind: int, when: datetime, arg: int = 0) -> bool:
+        """Add an event to the open session's timeline; False if no session is open."""
+        if self._session_start is None:
+            return False
+        self._timeline.append(kind, (when - self._session_start).total_seconds(), arg)
+        return True
+    
+    def compact(self):
+        """Fold the journal into the snapshot and empty it."""
+        self._idle_timer.stop()
+        if self._store is not None:
+            return
+        self._stats["journal_seq"] = self._journal.last_seq
+        if self._session_start is not None:
+            self._stats["open_session"] = {
+                "start": self._session_start.isoformat(),
+                "alerts": self._session_alerts,
+                "last": (self._last_event or self._session_start).isoformat(),
+                "timeline": self._timeline.encode(),
+            }
+        saved = self._save()
+        self._stats.pop("open_session", None)
+        if saved:
+            try:
+                self._journal.truncate()
+            except (IOError, OSError) as e:
+                print(f"Error truncating stats journal: {e}")
+    
+    def close(self):
+        """Compact pending journal records and release the journal file."""
+        if self._idle_timer.isActive():
+            self.compact()
+        if self._journal is not None:
+            self._journal.close()
+        if self._store is not None:
+            self._store.close()
+    
+    @property
+    def journal_write_count(self) -> int:
+        """Journal records written since startup."""
+        return self._journal.write_count if self._journal is not None else 0
+    
+    @property
+    def snapshot_count(self) -> int:
+        """Full snapshot rewrites since startup."""
+        return self._snapshot_count
+    
+    @property
+    def session_timeline(self) -> SessionTimeline:
+        """Timeline of the current (or last) session."""
+        return self._timeline
+    
+    @staticmethod
+    def get_session_timeline(session: Dict[str, Any]) -> SessionTimeline:
+        """Decode the timeline of a `get_session_history` entry."""
+        return SessionTimeline.decode(session.get("timeline"))
+    
+    def start_session(self, interval: Optional[int] = None):
+        """Start a new tracking session, optionally noting the timer interval."""
+        if self._store is not None:
+            self._begin_session(self._clock.now(), interval)
+            self._session_id = self._store.start_session(self._session_start)
+            if interval:
+                self._store.update_timeline(self._session_id, self._timeline.to_bytes())
+        elif interval:
+            self._record(JOURNAL_SESSION_START, interval=interval)
+        else:
+            self._record(JOURNAL_SESSION_START)
+        self.session_changed.emit(True)
+    
+    def record_pause(self):
+        """Note that the timer was paused."""
+        self._record_timeline(JOURNAL_PAUSE, TIMELINE_PAUSE)
+    
+    def record_resume(self):
+        """Note that the timer was resumed."""
+        self._record_timeline(JOURNAL_RESUME, TIMELINE_RESUME)
+    
+    def record_interval_change(self, interval: int):
+        """Note a new timer interval."""
+        self._record_timeline(JOURNAL_INTERVAL, TIMELINE_INTERVAL, interval)
+    
+    def _record_timeline(self, journal_kind: str, timeline_kind: int, interval: int = 0):
+        if self._session_start is None:
+            return
+        if self._store is not None:
+            self._add_timeline_event(timeline_kind, self._clock.now(), interval)
+            self._store.update_timeline(self._session_id, self._timeline.to_bytes())
+        elif interval:
+            self._record(journal_kind, interval=interval)
+        else:
+            self._record(journal_kind)
     
     def end_session(self):
         """End the current session and save stats."""
         if self._session_start is None:
             return
         
-        session_duration = (datetime.now() - self._session_start).total_seconds()
+        now = self._clock.now()
+        session_duration = (now - self._session_start).total_seconds()
+        if self._store is not None:
+            self._store.end_session(self._session_id, now, session_duration, self._timeline.to_bytes())
+            self._rollup.add(now.date(), self._session_alerts, session_duration, 1)
+            self._session_start = None
+            self._session_id = None
+        else:
+            self._record(JOURNAL_SESSION_END, duration=session_duration)
+            self.compact()
+        self.session_changed.emit(False)
+        self.stats_updated.emit()
+    
+    def _close_session(self, end: datetime, session_duration: Optional[float] = None):
+        """Add the open session to totals, history and daily stats."""
+        if session_duration is None:
+            session_duration = max(0.0, (end - self._session_start).total_seconds())
         
         # Update totals
         self._stats["total_game_time_seconds"] += session_duration
@@ -79,57 +337,72 @@ class StatsTracker(QObject):
             "date": self._session_start.isoformat(),
             "duration_seconds": session_duration,
             "alerts": self._session_alerts,
+            "timeline": self._timeline.encode(),
         }
         self._stats["session_history"].append(session_data)
         self._stats["session_history"] = self._stats["session_history"][-100:]
         
         # Update daily stats
-        today = date.today().isoformat()
+        today = end.date().isoformat()
         if today not in self._stats["daily_stats"]:
             self._stats["daily_stats"][today] = {"alerts": 0, "time_seconds": 0, "sessions": 0}
         
         self._stats["daily_stats"][today]["alerts"] += self._session_alerts
         self._stats["daily_stats"][today]["time_seconds"] += session_duration
         self._stats["daily_stats"][today]["sessions"] += 1
+        self._rollup.add(end.date(), self._session_alerts, session_duration, 1)
         
         self._session_start = None
-        self._save()
-        self.stats_updated.emit()
     
     def record_alert(self):
         """Record an alert notification."""
-        self._session_alerts += 1
-        self._stats["total_alerts"] += 1
-        self._save()
+        if self._store is not None:
+            now = self._clock.now()
+            self._session_alerts += 1
+            if self._add_timeline_event(TIMELINE_ALERT, now):
+                self._store.record_alert(now, self._session_id, self._timeline.to_bytes())
+            else:
+                self._store.record_alert(now, self._session_id)
+        else:
+            self._record(JOURNAL_ALERT)
         self.stats_updated.emit()
     
+    def _totals(self) -> Dict[str, Any]:
+        return self._store.totals() if self._store is not None else self._stats
+    
     @property
     def total_alerts(self) -> int:
-        return self._stats.get("total_alerts", 0)
+        return self._totals().get("total_alerts", 0)
     
     @property
     def total_sessions(self) -> int:
-        return self._stats.get("total_sessions", 0)
+        return self._totals().get("total_sessions", 0)
     
     @property
     def total_game_time(self) -> float:
         """Total game time in seconds."""
-        return self._stats.get("total_game_time_seconds", 0)
+        return self._totals().get("total_game_time_seconds", 0)
     
     @property
     def session_alerts(self) -> int:
         return self._session_alerts
     
+    @property
+    def is_session_active(self) -> bool:
+        return self._session_start is not None
+    
     @property
     def current_session_duration(self) -> float:
         """Current session duration in seconds."""
         if self._session_start:
-            return (datetime.now() - self._session_start).total_seconds()
+            return (self._clock.now() - self._session_start).total_seconds()
         return 0
     
     def get_today_stats(self) -> Dict[str, Any]:
         """Get statistics for today."""
-        today = date.today().isoformat()
+        if self._store is not None:
+            return self._store.day_stats(self._clock.today())
+        today = self._clock.today().isoformat()
         return self._stats.get("daily_stats", {}).get(today, {
             "alerts": 0,
             "time_seconds": 0,
@@ -138,25 +411,25 @@ class StatsTracker(QObject):
     
     def get_weekly_stats(self) -> Dict[str, Any]:
         """Get aggregated statistics for the last 7 days."""
-        from datetime import timedelta
-        
-        total_alerts = 0
-        total_time = 0
-        total_sessions = 0
-        
-        for i in range(7):
-            day = (date.today() - timedelta(days=i)).isoformat()
-            if day in self._stats.get("daily_stats", {}):
-                day_stats = self._stats["daily_stats"][day]
-                total_alerts += day_stats.get("alerts", 0)
-                total_time += day_stats.get("time_seconds", 0)
-                total_sessions += day_stats.get("sessions", 0)
-        
-        return {
-            "alerts": total_alerts,
-            "time_seconds": total_time,
-            "sessions": total_sessions,
-        }
+        today = self._clock.today()
+        return self.get_range_stats(today - timedelta(days=6), today)
+    
+    def get_range_stats(self, start: date, end: date) -> Dict[str, Any]:
+        """Get aggregated statistics for the days from `start` to `end`, inclusive."""
+        return self._rollup.range(start, end)
+    
+    def get_session_history(self, start: Optional[datetime] = None, end: Optional[datetime] = None,
+                            limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Ended sessions that started in [start, end), oldest first (the JSON backend keeps the last 100)."""
+        if self._store is not None:
+            return self._store.session_history(start, end, limit)
+        
+        sessions = [
+            session for session in self._stats.get("session_history", [])
+            if (start is None or session["date"] >= start.isoformat())
+            and (end is None or session["date"] < end.isoformat())
+        ]
+        return sessions[-limit:] if limit else sessions
     
     def get_average_alerts_per_session(self) -> float:
         """Calculate average alerts per session."""
@@ -179,6 +452,11 @@ class StatsTracker(QObject):
     
     def reset_all_stats(self):
         """Reset all statistics."""
+        self._rollup.rebuild(())
+        if self._store is not None:
+            self._store.reset()
+            self.stats_updated.emit()
+            return
         self._stats = {
             "total_alerts": 0,
             "total_sessions": 0,
@@ -186,7 +464,7 @@ class StatsTracker(QObject):
             "daily_stats": {},
             "session_history": [],
         }
-        self._save()
+        self.compact()
         self.stats_updated.emit()
 
 
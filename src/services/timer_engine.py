@@ -0,0 +1,278 @@
+import heapq
+import itertools
+import math
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from PyQt6.QtCore import QObject, QTimer, Qt, pyqtSignal
+from ..utils.clock import Clock, SYSTEM_CLOCK
+from ..utils.constants import TIMER_LATE_TOLERANCE
+
+
+@dataclass
+class ReminderTimer:
+    """State of one named reminder in TimerEngine."""
+    
+    timer_id: str
+    interval: int  # seconds
+    payload: Any = None
+    deadline: float = 0.0  # monotonic time of the next alert while running
+    paused_remaining: float = 0.0  # seconds left while paused
+    is_paused: bool = False
+    alert_count: int = 0
+    missed_ticks: int = 0  # seconds skipped by late wakeups (stalled event loop)
+    missed_alerts: int = 0  # deadlines that passed entirely inside a stall
+    last_tick: Optional[int] = None
+    version: int = 0  # bumped on every reschedule, invalidates stale heap entries
+
+
+class TimerEngine(QObject):
+    """
+    Runs any number of independent named reminders from one Qt timer.
+    
+    All upcoming wakeups live in a single heap ordered by deadline and the Qt
+    timer is armed only for the earliest one, so the number of wakeups depends
+    on how many distinct deadlines there are, not on how many reminders exist.
+    A reminder only gets per-second wakeups while something subscribes to its
+    ticks; otherwise it wakes the engine once per alert.
+    """
+    
+    # Signals
+    tick = pyqtSignal(str, int)  # timer_id, remaining seconds (subscribed timers only)
+    alert = pyqtSignal(str, object)  # timer_id, payload
+    
+    def __init__(self, parent=None, clock: Optional[Clock] = None):
+        super().__init__(parent)
+        self._clock = (clock or SYSTEM_CLOCK).monotonic
+        self._timers: Dict[str, ReminderTimer] = {}
+        self._heap: List[Tuple[float, int, str, int]] = []  # (wake_time, seq, timer_id, version)
+        self._seq = itertools.count()
+        self._tick_subscribers: Dict[str, List[Callable[[int], None]]] = {}
+        self._alert_subscribers: Dict[str, List[Callable[[Any], None]]] = {}
+        self._wakeup_count = 0
+        
+        self._qt_timer = QTimer(self)
+        self._qt_timer.setSingleShot(True)
+        self._qt_timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._qt_timer.timeout.connect(self.process_wakeup)
+    
+    @property
+    def timer_ids(self) -> List[str]:
+        return list(self._timers)
+    
+    @property
+    def wakeup_count(self) -> int:
+        """Number of times the engine woke up to process deadlines."""
+        return self._wakeup_count
+    
+    @property
+    def next_wake_time(self) -> Optional[float]:
+        """Monotonic time of the earliest pending wakeup, or None."""
+        self._discard_stale()
+        return self._heap[0][0] if self._heap else None
+    
+    def has_timer(self, timer_id: str) -> bool:
+        return timer_id in self._timers
+    
+    def add_timer(self, timer_id: str, interval: int, payload: Any = None, paused: bool = False):
+        """Add (or replace) a reminder that alerts every `interval` seconds."""
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        timer = ReminderTimer(timer_id=timer_id, interval=interval, payload=payload)
+        if timer_id in self._timers:
+            timer.version = self._timers[timer_id].version + 1
+        self._timers[timer_id] = timer
+        if paused:
+            timer.is_paused = True
+            timer.paused_remaining = float(interval)
+        else:
+            timer.deadline = self._clock() + interval
+            self._push(timer)
+        self._emit_tick(timer, self._display_seconds(timer))
+        self._rearm()
+    
+    def remove_timer(self, timer_id: str):
+        """Remove a reminder; its pending heap entries become stale."""
+        self._tick_subscribers.pop(timer_id, None)
+        self._alert_subscribers.pop(timer_id, None)
+        if self._timers.pop(timer_id, None) is not None:
+            self._rearm()
+    
+    def clear(self):
+        """Remove all reminders and their subscriptions."""
+        self._timers.clear()
+        self._tick_subscribers.clear()
+        self._alert_subscribers.clear()
+        self._heap.clear()
+        self._qt_timer.stop()
+    
+    def pause(self, timer_id: str):
+        timer = self._timers[timer_id]
+        if timer.is_paused:
+            return
+        timer.paused_remaining = max(0.0, timer.deadline - self._clock())
+        timer.is_paused = True
+        timer.version += 1
+        self._rearm()
+    
+    def resume(self, timer_id: str):
+        timer = self._timers[timer_id]
+        if not timer.is_paused:
+            return
+        timer.is_paused = False
+        timer.deadline = self._clock() + timer.paused_remaining
+        self._push(timer)
+        self._rearm()
+    
+    def restart(self, timer_id: str):
+        """Start the current cycle over from the full interval, keeping counters and pause state."""
+        timer = self._timers[timer_id]
+        if timer.is_paused:
+            timer.paused_remaining = float(timer.interval)
+        else:
+            timer.deadline = self._clock() + timer.interval
+            self._push(timer)
+        self._emit_tick(timer, self._display_seconds(timer))
+        self._rearm()
+    
+    def is_paused(self, timer_id: str) -> bool:
+        return self._timers[timer_id].is_paused
+    
+    def set_interval(self, timer_id: str, interval: int):
+        """Change the interval; applies from the next cycle."""
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        self._timers[timer_id].interval = interval
+    
+    def interval(self, timer_id: str) -> int:
+        return self._timers[timer_id].interval
+    
+    def remaining(self, timer_id: str) -> int:
+        """Seconds until the reminder's next alert."""
+        return self._display_seconds(self._timers[timer_id])
+    
+    def alert_count(self, timer_id: str) -> int:
+        return self._timers[timer_id].alert_count
+    
+    def missed_ticks(self, timer_id: str) -> int:
+        return self._timers[timer_id].missed_ticks
+    
+    def missed_alerts(self, timer_id: str) -> int:
+        return self._timers[timer_id].missed_alerts
+    
+    def subscribe(self, timer_id: str, on_tick: Optional[Callable[[int], None]] = None,
+                  on_alert: Optional[Callable[[Any], None]] = None) -> Callable[[], None]:
+        """
+        Receive ticks and/or alerts of a single reminder.
+        
+        Returns a function that removes the subscription.
+        """
+        if on_tick:
+            self._tick_subscribers.setdefault(timer_id, []).append(on_tick)
+            # Switch the reminder to per-second wakeups
+            timer = self._timers.get(timer_id)
+            if timer and not timer.is_paused:
+                self._push(timer)
+                self._rearm()
+        if on_alert:
+            self._alert_subscribers.setdefault(timer_id, []).append(on_alert)
+        
+        def unsubscribe():
+            if on_tick and on_tick in self._tick_subscribers.get(timer_id, []):
+                self._tick_subscribers[timer_id].remove(on_tick)
+                if not self._tick_subscribers[timer_id]:
+                    del self._tick_subscribers[timer_id]
+                    # Back to one wakeup per alert
+                    timer = self._timers.get(timer_id)
+                    if timer and not timer.is_paused:
+                        self._push(timer)
+                        self._rearm()
+            if on_alert and on_alert in self._alert_subscribers.get(timer_id, []):
+                self._alert_subscribers[timer_id].remove(on_alert)
+                if not self._alert_subscribers[timer_id]:
+                    del self._alert_subscribers[timer_id]
+        
+        return unsubscribe
+    
+    def process_wakeup(self):
+        """Handle every reminder whose wakeup time has passed."""
+        self._wakeup_count += 1
+        now = self._clock()
+        
+        while self._heap and self._heap[0][0] <= now:
+            wake_time, _, timer_id, version = heapq.heappop(self._heap)
+            timer = self._timers.get(timer_id)
+            if timer is None or timer.version != version or timer.is_paused:
+                continue
+            
+            lateness = now - wake_time
+            if lateness > TIMER_LATE_TOLERANCE:
+                # Stalled event loop: the skipped seconds are compensated below
+                timer.missed_ticks += max(1, int(lateness))
+            
+            if now >= timer.deadline:
+                # Re-anchor on the original phase, alerting once even after a long stall
+                elapsed_intervals = int((now - timer.deadline) // timer.interval)
+                timer.missed_alerts += elapsed_intervals
+                timer.deadline += (elapsed_intervals + 1) * timer.interval
+                timer.alert_count += 1
+                self._emit_tick(timer, 0)
+                self._emit_alert(timer)
+            
+            self._emit_tick(timer, self._display_seconds(timer))
+            self._push(timer)
+        
+        self._rearm()
+    
+    def _display_seconds(self, timer: ReminderTimer) -> int:
+        if timer.is_paused:
+            remaining = timer.paused_remaining
+        else:
+            remaining = timer.deadline - self._clock()
+        return max(0, math.ceil(remaining - 1e-6))
+    
+    def _next_wake_for(self, timer: ReminderTimer) -> float:
+        """Next whole-second boundary for ticked reminders, else the alert deadline."""
+        if not self._tick_subscribers.get(timer.timer_id):
+            return timer.deadline
+        remaining = timer.deadline - self._clock()
+        shown = max(0, math.ceil(remaining - 1e-6))
+        if shown <= 1:
+            return timer.deadline
+        return timer.deadline - (shown - 1)
+    
+    def _push(self, timer: ReminderTimer):
+        timer.version += 1
+        heapq.heappush(self._heap, (self._next_wake_for(timer), next(self._seq), timer.timer_id, timer.version))
+    
+    def _discard_stale(self):
+        while self._heap:
+            _, _, timer_id, version = self._heap[0]
+            timer = self._timers.get(timer_id)
+            if timer is not None and timer.version == version and not timer.is_paused:
+                return
+            heapq.heappop(self._heap)
+    
+    def _rearm(self):
+        """Arm the single Qt timer for the earliest pending wakeup."""
+        wake = self.next_wake_time
+        if wake is None:
+            self._qt_timer.stop()
+            return
+        delay_ms = max(0, int(math.ceil((wake - self._clock()) * 1000)))
+        self._qt_timer.start(delay_ms)
+    
+    def _emit_tick(self, timer: ReminderTimer, seconds: int):
+        if seconds == timer.last_tick:
+            return
+        timer.last_tick = seconds
+        subscribers = self._tick_subscribers.get(timer.timer_id)
+        if not subscribers:
+            return
+        self.tick.emit(timer.timer_id, seconds)
+        for callback in list(subscribers):
+            callback(seconds)
+    
+    def _emit_alert(self, timer: ReminderTimer):
+        self.alert.emit(timer.timer_id, timer.payload)
+        for callback in list(self._alert_subscribers.get(timer.timer_id, [])):
+            callback(timer.payload)
@@ -1,9 +1,20 @@
-from PyQt6.QtCore import QObject, QTimer, pyqtSignal
-from ..utils.constants import DEFAULT_INTERVAL
+from typing import Optional
+from PyQt6.QtCore import QObject, pyqtSignal
+from .timer_engine import TimerEngine
+from ..utils.clock import Clock
+from ..utils.constants import DEFAULT_INTERVAL, VILLAGER_TIMER_ID
 
 
 class TimerService(QObject):
-    """Manages the villager production timer."""
+    """
+    Manages the villager production timer.
+    
+    The countdown is the `VILLAGER_TIMER_ID` reminder of a `TimerEngine`, so
+    views can subscribe to it by id and other reminders can share the same
+    Qt timer. Alerts are scheduled on absolute monotonic deadlines; the
+    remaining time is derived from the clock on every wakeup, so Qt timer
+    coarseness, event-loop stalls and system sleep cannot accumulate drift.
+    """
     
     # Signals
     tick = pyqtSignal(int)  # Remaining seconds
@@ -12,18 +23,23 @@ class TimerService(QObject):
     stopped = pyqtSignal()
     paused = pyqtSignal()
     resumed = pyqtSignal()
+    interval_changed = pyqtSignal(int)  # New interval in seconds
     
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, clock: Optional[Clock] = None, engine: Optional[TimerEngine] = None):
         super().__init__(parent)
+        self._engine = engine or TimerEngine(self, clock)
         self._interval = DEFAULT_INTERVAL
-        self._remaining = self._interval
         self._is_running = False
         self._is_paused = False
-        self._alert_count = 0
         
-        self._timer = QTimer(self)
-        self._timer.setInterval(1000)  # 1 second
-        self._timer.timeout.connect(self._on_tick)
+        # Held paused at a full interval while stopped
+        self._engine.add_timer(VILLAGER_TIMER_ID, self._interval, paused=True)
+        self._engine.subscribe(VILLAGER_TIMER_ID, on_tick=self._emit_tick, on_alert=self._on_alert)
+    
+    @property
+    def engine(self) -> TimerEngine:
+        """Engine running the countdown; subscribe to `VILLAGER_TIMER_ID` for its ticks."""
+        return self._engine
     
     @property
     def interval(self) -> int:
@@ -33,14 +49,19 @@ class TimerService(QObject):
     @interval.setter
     def interval(self, value: int):
         """Set timer interval in seconds."""
+        if value == self._interval:
+            return
         self._interval = value
-        if not self._is_running:
-            self._remaining = value
+        # A running countdown picks it up from the next cycle
+        self._engine.set_interval(VILLAGER_TIMER_ID, value)
+        self.interval_changed.emit(value)
     
     @property
     def remaining(self) -> int:
         """Get remaining seconds."""
-        return self._remaining
+        if not self._is_running:
+            return self._interval
+        return self._engine.remaining(VILLAGER_TIMER_ID)
     
     @property
     def is_running(self) -> bool:
@@ -55,7 +76,22 @@ class TimerService(QObject):
     @property
     def alert_count(self) -> int:
         """Get total alert count for current session."""
-        return self._alert_count
+        return self._engine.alert_count(VILLAGER_TIMER_ID)
+    
+    @property
+    def next_wake_time(self) -> Optional[float]:
+        """Monotonic time of the next scheduled wakeup, or None when idle."""
+        return self._engine.next_wake_time
+    
+    @property
+    def missed_ticks(self) -> int:
+        """Display ticks that came late because the event loop stalled."""
+        return self._engine.missed_ticks(VILLAGER_TIMER_ID)
+    
+    @property
+    def missed_alerts(self) -> int:
+        """Alert deadlines that passed entirely inside a stall (e.g. system sleep)."""
+        return self._engine.missed_alerts(VILLAGER_TIMER_ID)
     
     def start(self):
         """Start the timer."""
@@ -65,32 +101,28 @@ class TimerService(QObject):
         if self._is_paused:
             # Resume from pause
             self._is_paused = False
-            self._timer.start()
+            self._engine.resume(VILLAGER_TIMER_ID)
             self.resumed.emit()
+            self._emit_tick(self.remaining)
         else:
-            # Fresh start
-            self._remaining = self._interval
+            # Fresh start: a new reminder resets the counters and ticks the full interval
             self._is_running = True
             self._is_paused = False
-            self._alert_count = 0
-            self._timer.start()
             self.started.emit()
-        
-        self.tick.emit(self._remaining)
+            self._engine.add_timer(VILLAGER_TIMER_ID, self._interval)
     
     def stop(self):
         """Stop the timer completely."""
-        self._timer.stop()
+        self._engine.pause(VILLAGER_TIMER_ID)
         self._is_running = False
         self._is_paused = False
-        self._remaining = self._interval
         self.stopped.emit()
-        self.tick.emit(self._remaining)
+        self._emit_tick(self._interval)
     
     def pause(self):
         """Pause the timer."""
         if self._is_running and not self._is_paused:
-            self._timer.stop()
+            self._engine.pause(VILLAGER_TIMER_ID)
             self._is_paused = True
             self.paused.emit()
     
@@ -98,7 +130,7 @@ class TimerService(QObject):
         """Resume from pause."""
         if self._is_paused:
             self._is_paused = False
-            self._timer.start()
+            self._engine.resume(VILLAGER_TIMER_ID)
             self.resumed.emit()
     
     def toggle_pause(self):
@@ -110,19 +142,17 @@ class TimerService(QObject):
     
     def reset(self):
         """Reset timer to initial interval without stopping."""
-        self._remaining = self._interval
-        self.tick.emit(self._remaining)
+        if self._is_running:
+            self._engine.restart(VILLAGER_TIMER_ID)
+        else:
+            self._emit_tick(self._interval)
     
-    def _on_tick(self):
-        """Handle each second tick."""
-        self._remaining -= 1
-        self.tick.emit(self._remaining)
-        
-        if self._remaining <= 0:
-            # Time's up - alert and reset
-            self._alert_count += 1
-            self.alert.emit()
-            self._remaining = self._interval
-            self.tick.emit(self._remaining)
-
-
+    def _emit_tick(self, seconds: int):
+        self.tick.emit(seconds)
+    
+    def _on_alert(self, payload):
+        self.alert.emit()
+    
+    def process_wakeup(self):
+        """Run a scheduled wakeup now (used by the simulation driver)."""
+        self._engine.process_wakeup()
@@ -0,0 +1,39 @@
+from typing import Callable, Optional
+from PyQt6.QtWidgets import QWidget, QVBoxLayout
+
+
+class LazyPanel(QWidget):
+    """
+    Tab page that builds its real panel the first time it is shown.
+    
+    `factory` creates the panel and `on_built` (if given) wires it up, so a
+    tab the user never opens costs one empty widget.
+    """
+    
+    def __init__(self, factory: Callable[[], QWidget], on_built: Optional[Callable[[QWidget], None]] = None,
+                 parent=None):
+        super().__init__(parent)
+        self._factory = factory
+        self._on_built = on_built
+        self._panel: Optional[QWidget] = None
+        
+        self._layout = QVBoxLayout(self)
+        self._layout.setContentsMargins(0, 0, 0, 0)
+    
+    @property
+    def panel(self) -> Optional[QWidget]:
+        """The real panel, or None if it has not been needed yet."""
+        return self._panel
+    
+    def ensure_built(self) -> QWidget:
+        """Build the panel now if it does not exist yet."""
+        if self._panel is None:
+            self._panel = self._factory()
+            self._layout.addWidget(self._panel)
+            if self._on_built is not None:
+                self._on_built(self._panel)
+        return self._panel
+    
+    def showEvent(self, event):
+        self.ensure_built()
+        super().showEvent(event)
@@ -1,52 +1,118 @@
 import os
 import sys
+import time
+from typing import TYPE_CHECKING, Dict, Optional
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QTabWidget, QSystemTrayIcon, QMenu, QApplication
 )
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QIcon, QAction, QCloseEvent
+from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtGui import QIcon, QAction, QCloseEvent, QShowEvent
 
 from .styles import DARK_THEME
 from .timer_panel import TimerPanel
 from .settings_panel import SettingsPanel
 from .statistics_panel import StatisticsPanel
 from .overlay_widget import OverlayWidget
+from .lazy_panel import LazyPanel
 from ..services.game_detector import GameDetector
 from ..services.timer_service import TimerService
 from ..services.notification import NotificationService
 from ..services.stats_tracker import StatsTracker
 from ..utils.config import Config
-from ..utils.constants import APP_NAME, APP_VERSION
+from ..utils.constants import APP_NAME, APP_VERSION, OVERLAY_RENDERER_PAINTED, VILLAGER_TIMER_ID
 from ..utils.localization import tr
+from ..utils.single_instance import COMMAND_PAUSE, COMMAND_QUIT, COMMAND_SHOW, COMMAND_START, COMMAND_STOP
+
+if TYPE_CHECKING:
+    from ..services.control_server import ControlServer
 
 
 class MainWindow(QMainWindow):
     """Main application window - compact and fixed size."""
     
     def __init__(self):
+        self._startup_timings: Dict[str, float] = {}
+        self._phase_start = time.perf_counter()
         super().__init__()
         self._config = Config()
+        self._end_phase("config")
         
         # Initialize services
         self._game_detector = GameDetector(self)
         self._timer_service = TimerService(self)
         self._notification_service = NotificationService(self)
-        self._stats_tracker = StatsTracker(self)
+        self._audio_init_scheduled = False
+        self._stats_tracker = StatsTracker(self, backend=self._config.get("stats_backend"))
+        self._end_phase("services")
         
-        # Overlay window
-        self._overlay = OverlayWidget()
+        # Overlay window, created the first time it is shown
+        self._overlay: Optional[OverlayWidget] = None
+        self._control_server: Optional['ControlServer'] = None
         
         # Setup UI
         self._setup_window()
+        self._end_phase("window")
         self._setup_tray()
+        self._end_phase("tray")
         self._setup_ui()
+        self._end_phase("ui")
         self._connect_signals()
         self._apply_settings()
+        self._end_phase("wiring")
         
         # Auto-start detection if enabled
-        if self._settings_panel.auto_start_enabled:
+        if self._config.get("auto_start_detection"):
             self._game_detector.start_detection()
+        self._end_phase("detection")
+        
+        if self._config.get("control_server_enabled"):
+            self._start_control_server()
+            self._end_phase("control server")
+    
+    def _end_phase(self, name: str):
+        now = time.perf_counter()
+        self._startup_timings[name] = (now - self._phase_start) * 1000
+        self._phase_start = now
+    
+    @property
+    def startup_timings(self) -> Dict[str, float]:
+        """Milliseconds spent in each phase of construction, in order."""
+        return dict(self._startup_timings)
+    
+    @property
+    def control_server(self) -> Optional['ControlServer']:
+        """The local control API, if enabled and listening."""
+        return self._control_server
+    
+    def _start_control_server(self):
+        # Off by default: the server and its browser-overlay assets load only when enabled
+        from ..services.control_server import ControlServer
+        server = ControlServer(self._timer_service, self._game_detector, self.handle_command, self)
+        if server.start(self._config.get("control_server_port")):
+            self._control_server = server
+    
+    @property
+    def settings_panel(self) -> SettingsPanel:
+        """The settings panel, built now if its tab has not been opened yet."""
+        return self._settings_tab.ensure_built()
+    
+    @property
+    def stats_panel(self) -> StatisticsPanel:
+        """The statistics panel, built now if its tab has not been opened yet."""
+        return self._stats_tab.ensure_built()
+    
+    @property
+    def overlay(self) -> OverlayWidget:
+        """The in-game overlay, created on first use."""
+        if self._overlay is None:
+            if self._config.get("overlay_renderer") == OVERLAY_RENDERER_PAINTED:
+                from .painted_overlay import PaintedOverlayWidget
+                self._overlay = PaintedOverlayWidget()
+            else:
+                self._overlay = OverlayWidget()
+            self._connect_overlay(self._overlay)
+        return self._overlay
     
     def _setup_window(self):
         """Configure main window - fixed size, no resize."""
@@ -187,13 +253,12 @@ class MainWindow(QMainWindow):
         self._timer_panel = TimerPanel()
         self._tabs.addTab(self._timer_panel, "⏱ " + tr("tab_timer"))
         
-        # Settings tab
-        self._settings_panel = SettingsPanel()
-        self._tabs.addTab(self._settings_panel, "⚙ " + tr("tab_settings"))
+        # Settings and statistics tabs are built when first opened
+        self._settings_tab = LazyPanel(SettingsPanel, self._connect_settings_panel)
+        self._tabs.addTab(self._settings_tab, "⚙ " + tr("tab_settings"))
         
-        # Statistics tab
-        self._stats_panel = StatisticsPanel(self._stats_tracker)
-        self._tabs.addTab(self._stats_panel, "📊 " + tr("tab_statistics"))
+        self._stats_tab = LazyPanel(lambda: StatisticsPanel(self._stats_tracker))
+        self._tabs.addTab(self._stats_tab, "📊 " + tr("tab_statistics"))
         
         main_layout.addWidget(self._tabs)
     
@@ -204,8 +269,8 @@ class MainWindow(QMainWindow):
         self._game_detector.game_ended.connect(self._on_game_ended)
         self._game_detector.status_changed.connect(self._timer_panel.set_status)
         
-        # Timer service
-        self._timer_service.tick.connect(self._on_timer_tick)
+        # Timer service; the displays follow the villager reminder on its engine
+        self._timer_service.engine.subscribe(VILLAGER_TIMER_ID, on_tick=self._update_timer_panel)
         self._timer_service.alert.connect(self._on_timer_alert)
         self._timer_service.started.connect(lambda: self._on_timer_state_changed(True))
         self._timer_service.stopped.connect(lambda: self._on_timer_state_changed(False))
@@ -218,30 +283,44 @@ class MainWindow(QMainWindow):
         self._timer_panel.stop_btn.clicked.connect(self._on_stop_clicked)
         self._timer_panel.overlay_btn.clicked.connect(self._toggle_overlay)
         
-        # Settings panel
-        self._settings_panel.interval_changed.connect(self._on_interval_changed)
-        self._settings_panel.volume_changed.connect(self._on_volume_changed)
-        self._settings_panel.detection_mode_changed.connect(self._on_detection_mode_changed)
-        self._settings_panel.profile_id_changed.connect(self._on_profile_id_changed)
-        self._settings_panel.sound_enabled_changed.connect(
+        # Connect pause/resume to overlay as well
+        self._timer_service.paused.connect(lambda: self._set_overlay_paused(True))
+        self._timer_service.resumed.connect(lambda: self._set_overlay_paused(False))
+        
+        # Session timeline
+        self._timer_service.paused.connect(self._stats_tracker.record_pause)
+        self._timer_service.resumed.connect(self._stats_tracker.record_resume)
+    
+    def _connect_settings_panel(self, panel: SettingsPanel):
+        """Wire a freshly built settings panel."""
+        panel.interval_changed.connect(self._on_interval_changed)
+        panel.interval_settled.connect(self._stats_tracker.record_interval_change)
+        panel.volume_changed.connect(self._on_volume_changed)
+        panel.detection_mode_changed.connect(self._on_detection_mode_changed)
+        panel.profile_id_changed.connect(self._on_profile_id_changed)
+        panel.sound_enabled_changed.connect(
             lambda v: setattr(self._notification_service, 'sound_enabled', v)
         )
-        self._settings_panel.popup_enabled_changed.connect(
+        panel.popup_enabled_changed.connect(
             lambda v: setattr(self._notification_service, 'popup_enabled', v)
         )
-        self._settings_panel.always_on_top_changed.connect(self._on_always_on_top_changed)
-        self._settings_panel.test_sound_requested.connect(self._notification_service.test_sound)
-        self._settings_panel.test_popup_requested.connect(self._notification_service.test_popup)
-        self._settings_panel.language_changed.connect(self._on_language_changed)
-        
-        # Overlay
-        self._overlay.closed.connect(self._on_overlay_closed)
-        self._overlay.start_clicked.connect(self._on_start_clicked)
-        self._overlay.stop_clicked.connect(self._on_stop_clicked)
-        
-        # Connect pause/resume to overlay as well
-        self._timer_service.paused.connect(lambda: self._overlay.set_paused(True))
-        self._timer_service.resumed.connect(lambda: self._overlay.set_paused(False))
+        panel.always_on_top_changed.connect(self._on_always_on_top_changed)
+        panel.test_sound_requested.connect(self._notification_service.test_sound)
+        panel.test_popup_requested.connect(self._notification_service.test_popup)
+        panel.language_changed.connect(self._on_language_changed)
+    
+    def _connect_overlay(self, overlay: OverlayWidget):
+        """Wire a freshly created overlay and bring it up to date with the timer."""
+        overlay.closed.connect(self._on_overlay_closed)
+        overlay.start_clicked.connect(self._on_start_clicked)
+        overlay.stop_clicked.connect(self._on_stop_clicked)
+        self._timer_service.engine.subscribe(VILLAGER_TIMER_ID, on_tick=overlay.update_timer)
+        
+        overlay.update_timer(self._timer_service.remaining)
+        if self._timer_service.is_running:
+            overlay.set_running(True)
+            if self._timer_service.is_paused:
+                overlay.set_paused(True)
     
     def _apply_settings(self):
         """Apply settings from config."""
@@ -257,14 +336,13 @@ class MainWindow(QMainWindow):
         
         # Update timer display
         self._timer_panel.update_timer(self._timer_service.interval, self._timer_service.interval)
-        self._overlay.update_timer(self._timer_service.interval)
     
     def _on_start_clicked(self):
         """Handle start button."""
         if self._game_detector.mode == "manual":
             self._game_detector.manual_start()
         self._timer_service.start()
-        self._stats_tracker.start_session()
+        self._stats_tracker.start_session(self._timer_service.interval)
     
     def _on_pause_clicked(self):
         """Handle pause button."""
@@ -280,46 +358,52 @@ class MainWindow(QMainWindow):
     def _on_game_started(self):
         """Handle game start detection."""
         # Auto-open overlay when match starts (if enabled)
-        if self._settings_panel.auto_show_overlay_enabled and not self._overlay.isVisible():
-            self._overlay.show()
+        if self._config.get("auto_show_overlay") and not self.overlay.isVisible():
+            self.overlay.show()
             self._timer_panel.overlay_btn.setText(tr("btn_hide"))
         
-        if self._settings_panel.auto_start_enabled:
+        if self._config.get("auto_start_detection"):
             self._timer_service.start()
-            self._stats_tracker.start_session()
+            self._stats_tracker.start_session(self._timer_service.interval)
     
     def _on_game_ended(self):
         """Handle game end detection."""
         self._timer_service.stop()
         self._stats_tracker.end_session()
     
-    def _on_timer_tick(self, remaining: int):
-        """Update displays on timer tick."""
+    def _update_timer_panel(self, remaining: int):
         self._timer_panel.update_timer(remaining, self._timer_service.interval)
-        self._overlay.update_timer(remaining)
+    
+    def _set_overlay_paused(self, is_paused: bool):
+        if self._overlay is not None:
+            self._overlay.set_paused(is_paused)
     
     def _on_timer_alert(self):
         """Handle timer alert."""
         self._notification_service.notify()
         self._stats_tracker.record_alert()
-        self._overlay.flash_alert()
+        if self._overlay is not None:
+            self._overlay.flash_alert()
     
     def _on_timer_state_changed(self, is_running: bool):
         """Handle timer start/stop."""
         self._timer_panel.update_button_states(is_running)
-        self._overlay.set_running(is_running)
+        if self._overlay is not None:
+            self._overlay.set_running(is_running)
         
         if not is_running:
             # Reset display
             self._timer_panel.update_timer(self._timer_service.interval, self._timer_service.interval)
-            self._overlay.update_timer(self._timer_service.interval)
+            if self._overlay is not None:
+                self._overlay.update_timer(self._timer_service.interval)
     
     def _on_interval_changed(self, value: int):
         """Handle interval change."""
         self._timer_service.interval = value
         if not self._timer_service.is_running:
             self._timer_panel.update_timer(value, value)
-            self._overlay.update_timer(value)
+            if self._overlay is not None:
+                self._overlay.update_timer(value)
     
     def _on_volume_changed(self, value: int):
         """Handle volume change."""
@@ -333,7 +417,7 @@ class MainWindow(QMainWindow):
         """Handle profile ID change."""
         self._game_detector.profile_id = profile_id if profile_id else None
         # Restart detection if API mode is active
-        if self._game_detector.mode == "api" and self._settings_panel.auto_start_enabled:
+        if self._game_detector.mode == "api" and self._config.get("auto_start_detection"):
             if profile_id:
                 # Stop current detection and restart with new profile ID
                 was_detecting = self._game_detector.is_detecting
@@ -354,9 +438,10 @@ class MainWindow(QMainWindow):
         """Handle language change - retranslate all UI."""
         self._retranslate_ui()
         self._timer_panel.retranslate_ui()
-        self._settings_panel.retranslate_ui()
-        self._stats_panel.retranslate_ui()
-        self._overlay.retranslate_ui()
+        # Panels built later pick up the new language when they are created
+        for panel in (self._settings_tab.panel, self._stats_tab.panel, self._overlay):
+            if panel is not None:
+                panel.retranslate_ui()
     
     def _retranslate_ui(self):
         """Retranslate main window UI strings."""
@@ -374,11 +459,11 @@ class MainWindow(QMainWindow):
     
     def _toggle_overlay(self):
         """Toggle overlay visibility."""
-        if self._overlay.isVisible():
+        if self._overlay is not None and self._overlay.isVisible():
             self._overlay.hide()
             self._timer_panel.overlay_btn.setText(tr("btn_show"))
         else:
-            self._overlay.show()
+            self.overlay.show()
             self._timer_panel.overlay_btn.setText(tr("btn_hide"))
     
     def _on_overlay_closed(self):
@@ -396,6 +481,32 @@ class MainWindow(QMainWindow):
         self.activateWindow()
         self.raise_()
     
+    def handle_command(self, command: str):
+        """Handle a command forwarded by a second launch of the app."""
+        if command == COMMAND_SHOW:
+            self.show_normal()
+        elif command == COMMAND_START:
+            if not self._timer_service.is_running:
+                self._on_start_clicked()
+        elif command == COMMAND_STOP:
+            if self._timer_service.is_running:
+                self._on_stop_clicked()
+        elif command == COMMAND_PAUSE:
+            if self._timer_service.is_running:
+                self._on_pause_clicked()
+        elif command == COMMAND_QUIT:
+            self._quit_app()
+        else:
+            print(f"Unknown command: {command}")
+    
+    def showEvent(self, event: QShowEvent):
+        """Load the audio backend once the window is on screen."""
+        super().showEvent(event)
+        if not self._audio_init_scheduled:
+            self._audio_init_scheduled = True
+            # Queued behind the first paint so audio setup never delays it
+            QTimer.singleShot(0, self._notification_service.init_audio)
+    
     def closeEvent(self, event: QCloseEvent):
         """Handle close - minimize to tray."""
         if self._tray_icon.isVisible():
@@ -412,9 +523,15 @@ class MainWindow(QMainWindow):
     
     def _quit_app(self):
         """Quit application properly."""
-        self._game_detector.stop_detection()
+        self._game_detector.shutdown()
+        self._notification_service.shutdown()
         self._timer_service.stop()
         self._stats_tracker.end_session()
-        self._overlay.close()
+        self._stats_tracker.close()
+        if self._overlay is not None:
+            self._overlay.close()
+        if self._control_server is not None:
+            self._control_server.stop()
+        self._config.flush()
         self._tray_icon.hide()
         QApplication.quit()
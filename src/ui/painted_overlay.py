@@ -0,0 +1,346 @@
+from typing import Dict, Optional, Tuple
+from PyQt6.QtWidgets import QToolTip
+from PyQt6.QtCore import Qt, QEvent, QPoint, QRect, QRectF, QTimer
+from PyQt6.QtGui import (
+    QColor, QFont, QFontMetrics, QMouseEvent, QPainter, QPainterPath, QPen, QPixmap, QStaticText
+)
+
+from .overlay_widget import OverlayWidget
+from ..utils.constants import TIMER_LOW_SECONDS
+from ..utils.localization import tr
+
+
+# Colors (same palette as the stylesheet overlay)
+DIGIT_COLOR = QColor("#ffd700")
+DIGIT_LOW_COLOR = QColor("#ff6b6b")
+TITLE_COLOR = QColor(255, 215, 0, 204)
+STATUS_COLOR = QColor(176, 176, 176, 204)
+ICON_COLOR = QColor("#b0b0b0")
+CONTROL_COLOR = QColor(220, 220, 220, 230)
+CONTROL_HOVER_COLOR = QColor(255, 255, 255)
+CONTROL_DISABLED_COLOR = QColor(100, 100, 100, 128)
+
+# (background, border, border width) per frame state
+FRAME_IDLE = (QColor(26, 26, 46, 217), QColor(255, 215, 0, 77), 1)
+FRAME_RUNNING = (QColor(26, 26, 46, 230), QColor(45, 106, 79, 204), 1)
+FRAME_FLASH = (QColor(255, 107, 107, 230), QColor("#ff6b6b"), 2)
+
+
+def _pixel_font(size: int, bold: bool = False) -> QFont:
+    font = QFont()
+    font.setPixelSize(size)
+    font.setBold(bold)
+    return font
+
+
+class PaintedOverlayWidget(OverlayWidget):
+    """
+    In-game overlay drawn in a single `paintEvent`, without child widgets or stylesheets.
+    
+    Same API and signals as `OverlayWidget`. The frame and title are cached in
+    a pixmap per state, digits are blitted from pre-rendered glyph pixmaps,
+    and a timer tick only invalidates the rectangle covering the old and new
+    digits, so the per-second cost is a couple of small blits.
+    """
+    
+    def _setup_ui(self):
+        """Set up paint state instead of child widgets."""
+        self.setMouseTracking(True)
+        
+        self._title_font = _pixel_font(11, bold=True)
+        self._status_font = _pixel_font(10)
+        self._digit_font = _pixel_font(32, bold=True)
+        self._icon_font = _pixel_font(12)
+        self._close_font = _pixel_font(14)
+        
+        # Geometry of the 150x95 overlay (10/8 px margins like the widget version)
+        self._buttons: Dict[str, QRect] = {
+            "lock": QRect(100, 8, 20, 20),
+            "close": QRect(120, 8, 20, 20),
+            "start": QRect(116, 38, 24, 20),
+            "stop": QRect(116, 61, 24, 20),
+        }
+        self._digits_area = QRect(10, 30, 100, 42)
+        self._status_rect = QRect(10, 72, 100, 14)
+        
+        self._glyphs: Dict[Tuple[str, bool], QPixmap] = {}
+        self._frame_cache: Dict[Tuple[int, str], QPixmap] = {}
+        self._title_text = tr("overlay_title")
+        self._status = QStaticText(tr("timer_ready"))
+        self._seconds_text = "25"
+        self._low = False
+        self._digits_rect = self._layout_digits(self._seconds_text, False)
+        
+        self._running = False
+        self._flashing = False
+        self._start_enabled = True
+        self._stop_enabled = False
+        self._hovered: Optional[str] = None
+        self._pressed: Optional[str] = None
+        
+        self._paint_count = 0
+        self._last_paint_rect = QRect()
+    
+    @property
+    def paint_count(self) -> int:
+        """Paint events handled."""
+        return self._paint_count
+    
+    @property
+    def last_paint_rect(self) -> QRect:
+        """Region repainted by the last paint event."""
+        return QRect(self._last_paint_rect)
+    
+    # Public API (mirrors OverlayWidget)
+    
+    def update_timer(self, seconds: int):
+        """Update the timer display."""
+        text = str(seconds)
+        low = seconds <= TIMER_LOW_SECONDS
+        if text == self._seconds_text and low == self._low:
+            return
+        
+        old_rect = self._digits_rect
+        self._seconds_text = text
+        self._low = low
+        self._digits_rect = self._layout_digits(text, low)
+        self.update(old_rect.united(self._digits_rect))
+    
+    def set_status(self, status: str):
+        """Update status text."""
+        if status == self._status.text():
+            return
+        self._status.setText(status)
+        self.update(self._status_rect)
+    
+    def set_running(self, is_running: bool):
+        """Update visual state based on timer running."""
+        self._set_controls(start=not is_running, stop=is_running)
+        self.set_status(tr("timer_running") if is_running else tr("timer_stopped"))
+        if is_running != self._running:
+            self._running = is_running
+            self.update()
+    
+    def set_paused(self, is_paused: bool):
+        """Update visual state when paused."""
+        self._set_controls(start=is_paused, stop=True)
+        self.set_status(tr("timer_paused") if is_paused else tr("timer_running"))
+    
+    def flash_alert(self):
+        """Flash the overlay when alert triggers."""
+        self._flashing = True
+        self.update()
+        QTimer.singleShot(200, self._end_flash)
+    
+    def retranslate_ui(self):
+        """Retranslate all UI strings (called when language changes)."""
+        self._title_text = tr("overlay_title")
+        self._frame_cache.clear()
+        self._status.setText(tr("timer_ready"))
+        self.update()
+    
+    def _toggle_lock(self):
+        """Toggle position lock."""
+        self._is_locked = not self._is_locked
+        self.update(self._buttons["lock"])
+    
+    def _end_flash(self):
+        self._flashing = False
+        self.update()
+    
+    def _set_controls(self, start: bool, stop: bool):
+        if start != self._start_enabled:
+            self._start_enabled = start
+            self.update(self._buttons["start"])
+        if stop != self._stop_enabled:
+            self._stop_enabled = stop
+            self.update(self._buttons["stop"])
+    
+    # Rendering
+    
+    def _glyph(self, char: str, low: bool) -> QPixmap:
+        """Pre-rendered pixmap of one countdown character."""
+        key = (char, low)
+        pixmap = self._glyphs.get(key)
+        if pixmap is None:
+            metrics = QFontMetrics(self._digit_font)
+            width, height = max(1, metrics.horizontalAdvance(char)), metrics.height()
+            ratio = self.devicePixelRatioF()
+            pixmap = QPixmap(round(width * ratio), round(height * ratio))
+            pixmap.setDevicePixelRatio(ratio)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
+            painter.setFont(self._digit_font)
+            painter.setPen(DIGIT_LOW_COLOR if low else DIGIT_COLOR)
+            painter.drawText(QRect(0, 0, width, height), Qt.AlignmentFlag.AlignCenter, char)
+            painter.end()
+            self._glyphs[key] = pixmap
+        return pixmap
+    
+    def _layout_digits(self, text: str, low: bool) -> QRect:
+        """Rectangle the countdown text occupies, centered in the digits area."""
+        glyphs = [self._glyph(char, low) for char in text]
+        ratio = self.devicePixelRatioF()
+        width = sum(round(glyph.width() / ratio) for glyph in glyphs)
+        height = round(glyphs[0].height() / ratio) if glyphs else 0
+        area = self._digits_area
+        return QRect(area.x() + (area.width() - width) // 2, area.y() + (area.height() - height) // 2,
+                     width, height)
+    
+    def _frame_state(self) -> Tuple[QColor, QColor, int]:
+        if self._flashing:
+            return FRAME_FLASH
+        return FRAME_RUNNING if self._running else FRAME_IDLE
+    
+    def _frame(self) -> QPixmap:
+        """Background, border and title for the current state, cached."""
+        state = self._frame_state()
+        key = (id(state), self._title_text)
+        pixmap = self._frame_cache.get(key)
+        if pixmap is None:
+            background, border, border_width = state
+            ratio = self.devicePixelRatioF()
+            pixmap = QPixmap(round(self.width() * ratio), round(self.height() * ratio))
+            pixmap.setDevicePixelRatio(ratio)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            inset = border_width / 2
+            path = QPainterPath()
+            path.addRoundedRect(QRectF(self.rect()).adjusted(inset, inset, -inset, -inset), 10, 10)
+            painter.fillPath(path, background)
+            painter.setPen(QPen(border, border_width))
+            painter.drawPath(path)
+            
+            painter.setFont(self._title_font)
+            painter.setPen(TITLE_COLOR)
+            painter.drawText(QRect(10, 8, 90, 20),
+                             Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, self._title_text)
+            painter.end()
+            self._frame_cache[key] = pixmap
+        return pixmap
+    
+    def _button_color(self, name: str) -> QColor:
+        hovered = name == self._hovered
+        if name == "lock":
+            return DIGIT_COLOR if hovered else ICON_COLOR
+        if name == "close":
+            return QColor("#ff4444") if hovered else ICON_COLOR
+        if not self._button_enabled(name):
+            return CONTROL_DISABLED_COLOR
+        return CONTROL_HOVER_COLOR if hovered else CONTROL_COLOR
+    
+    def _button_text(self, name: str) -> str:
+        if name == "lock":
+            return "🔒" if self._is_locked else "🔓"
+        return {"close": "✕", "start": "▶", "stop": "■"}[name]
+    
+    def paintEvent(self, event):
+        rect = event.rect()
+        self._paint_count += 1
+        self._last_paint_rect = rect
+        
+        painter = QPainter(self)
+        painter.setClipRect(rect)
+        painter.drawPixmap(0, 0, self._frame())
+        
+        if rect.intersects(self._digits_rect):
+            x = self._digits_rect.x()
+            for char in self._seconds_text:
+                glyph = self._glyph(char, self._low)
+                painter.drawPixmap(x, self._digits_rect.y(), glyph)
+                x += round(glyph.width() / glyph.devicePixelRatio())
+        
+        if rect.intersects(self._status_rect):
+            painter.setFont(self._status_font)
+            painter.setPen(STATUS_COLOR)
+            size = self._status.size()
+            painter.drawStaticText(
+                QPoint(self._status_rect.x() + round(self._status_rect.width() - size.width()) // 2,
+                       self._status_rect.y() + round(self._status_rect.height() - size.height()) // 2),
+                self._status
+            )
+        
+        for name, button_rect in self._buttons.items():
+            if rect.intersects(button_rect):
+                painter.setFont(self._close_font if name == "close" else self._icon_font)
+                painter.setPen(self._button_color(name))
+                painter.drawText(button_rect, Qt.AlignmentFlag.AlignCenter, self._button_text(name))
+        painter.end()
+    
+    # Buttons
+    
+    def _button_enabled(self, name: str) -> bool:
+        if name == "start":
+            return self._start_enabled
+        if name == "stop":
+            return self._stop_enabled
+        return True
+    
+    def _button_at(self, pos: QPoint) -> Optional[str]:
+        for name, rect in self._buttons.items():
+            if rect.contains(pos) and self._button_enabled(name):
+                return name
+        return None
+    
+    def _set_hovered(self, name: Optional[str]):
+        if name == self._hovered:
+            return
+        for previous in (self._hovered, name):
+            if previous is not None:
+                self.update(self._buttons[previous])
+        self._hovered = name
+    
+    def _click(self, name: str):
+        if name == "lock":
+            self._toggle_lock()
+        elif name == "close":
+            self._on_close()
+        elif name == "start":
+            self.start_clicked.emit()
+        elif name == "stop":
+            self.stop_clicked.emit()
+    
+    def mousePressEvent(self, event: QMouseEvent):
+        """Press a painted button, or start dragging."""
+        if event.button() == Qt.MouseButton.LeftButton:
+            self._pressed = self._button_at(event.position().toPoint())
+            if self._pressed is not None:
+                event.accept()
+                return
+        super().mousePressEvent(event)
+    
+    def mouseMoveEvent(self, event: QMouseEvent):
+        """Track button hover, or drag."""
+        if event.buttons() == Qt.MouseButton.NoButton:
+            self._set_hovered(self._button_at(event.position().toPoint()))
+        if self._pressed is None:
+            super().mouseMoveEvent(event)
+    
+    def mouseReleaseEvent(self, event: QMouseEvent):
+        """Click a painted button if released over it, or finish dragging."""
+        if event.button() == Qt.MouseButton.LeftButton and self._pressed is not None:
+            pressed, self._pressed = self._pressed, None
+            if self._button_at(event.position().toPoint()) == pressed:
+                self._click(pressed)
+            event.accept()
+            return
+        super().mouseReleaseEvent(event)
+    
+    def leaveEvent(self, event):
+        self._set_hovered(None)
+        super().leaveEvent(event)
+    
+    def event(self, event):
+        if event.type() == QEvent.Type.ToolTip:
+            tips = {"lock": "overlay_lock_tooltip", "start": "btn_start", "stop": "btn_stop"}
+            name = self._button_at(event.pos())
+            if name in tips:
+                QToolTip.showText(event.globalPos(), tr(tips[name]), self, self._buttons[name])
+            else:
+                QToolTip.hideText()
+            return True
+        return super().event(event)
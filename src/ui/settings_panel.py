@@ -17,6 +17,7 @@ class SettingsPanel(QWidget):
     
     # Signals
     interval_changed = pyqtSignal(int)
+    interval_settled = pyqtSignal(int)  # Once per drag, preset or key press, not per step
     volume_changed = pyqtSignal(int)
     detection_mode_changed = pyqtSignal(str)
     profile_id_changed = pyqtSignal(str)
@@ -31,6 +32,7 @@ class SettingsPanel(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._config = Config()
+        self._settled_interval = None
         self._setup_ui()
         self._load_settings()
         self._connect_signals()
@@ -252,6 +254,7 @@ class SettingsPanel(QWidget):
     
     def _connect_signals(self):
         self.interval_slider.valueChanged.connect(self._on_interval_changed)
+        self.interval_slider.sliderReleased.connect(self._settle_interval)
         self.volume_slider.valueChanged.connect(self._on_volume_changed)
         self.detection_combo.currentIndexChanged.connect(self._on_detection_mode_changed)
         self.profile_input.textChanged.connect(self._on_profile_id_changed)
@@ -269,6 +272,9 @@ class SettingsPanel(QWidget):
         self.auto_show_overlay_checkbox.stateChanged.connect(
             lambda state: self._on_auto_show_overlay_changed(state == Qt.CheckState.Checked.value)
         )
+        self.auto_start_checkbox.stateChanged.connect(
+            lambda state: self._config.set("auto_start_detection", state == Qt.CheckState.Checked.value)
+        )
         
         self.test_sound_btn.clicked.connect(self.test_sound_requested.emit)
         self.test_popup_btn.clicked.connect(self.test_popup_requested.emit)
@@ -307,6 +313,15 @@ class SettingsPanel(QWidget):
         self.interval_label.setText(f"{value}s")
         self._config.set("interval", value)
         self.interval_changed.emit(value)
+        # A mouse drag settles when the slider is released
+        if not self.interval_slider.isSliderDown():
+            self._settle_interval()
+    
+    def _settle_interval(self):
+        value = self.interval_slider.value()
+        if value != self._settled_interval:
+            self._settled_interval = value
+            self.interval_settled.emit(value)
     
     def _on_volume_changed(self, value: int):
         self.volume_label.setText(f"{value}%")
@@ -4,6 +4,7 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import Qt, QTimer
 from ..services.stats_tracker import StatsTracker
+from ..utils.constants import STATS_REFRESH_INTERVAL_MS
 from ..utils.localization import tr
 
 
@@ -34,23 +35,66 @@ class StatCard(QFrame):
         self.title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(self.title_label)
     
-    def set_value(self, value: str):
+    def set_value(self, value: str) -> bool:
+        """Show `value`; returns False (and leaves the label alone) if it is already shown."""
+        if value == self.value_label.text():
+            return False
         self.value_label.setText(value)
+        return True
 
 
 class StatisticsPanel(QWidget):
-    """Compact statistics panel."""
+    """
+    Compact statistics panel.
+    
+    Nothing is refreshed while the panel is hidden (another tab selected or
+    the window in the tray): statistics changes only mark it stale, and it
+    catches up when shown. The live session cards tick once a second only
+    while the panel is visible and a session is running. The trend cards
+    come from `SessionAnalytics`, created (and NumPy imported) the first
+    time the panel is shown; its results stay cached until statistics change.
+    """
     
     def __init__(self, stats_tracker: StatsTracker, parent=None):
         super().__init__(parent)
         self._stats = stats_tracker
-        self._setup_ui()
-        self._connect_signals()
-        self._update_stats()
+        self._stale = True
+        self._refresh_count = 0
+        self._skipped_refreshes = 0
+        self._analytics = None
         
         self._refresh_timer = QTimer(self)
-        self._refresh_timer.timeout.connect(self._update_session_stats)
-        self._refresh_timer.start(1000)
+        self._refresh_timer.setInterval(STATS_REFRESH_INTERVAL_MS)
+        self._refresh_timer.timeout.connect(self._on_refresh_tick)
+        
+        self._setup_ui()
+        self._connect_signals()
+    
+    @property
+    def refresh_count(self) -> int:
+        """Refreshes actually performed."""
+        return self._refresh_count
+    
+    @property
+    def skipped_refreshes(self) -> int:
+        """Refresh requests dropped because the panel was not on screen."""
+        return self._skipped_refreshes
+    
+    @property
+    def analytics(self):
+        """The `SessionAnalytics` behind the trend cards, or None until first shown."""
+        return self._analytics
+    
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._stale:
+            self._update_stats()
+        self._update_session_stats()
+        self._update_refresh_timer()
+    
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self._refresh_timer.stop()
     
     def retranslate_ui(self):
         """Retranslate all UI strings (called when language changes)."""
@@ -58,6 +102,7 @@ class StatisticsPanel(QWidget):
         self.session_group.setTitle(tr("stats_current_session"))
         self.today_group.setTitle(tr("stats_today"))
         self.alltime_group.setTitle(tr("stats_all_time"))
+        self.trends_group.setTitle(tr("stats_trends"))
         
         # Update stat card titles
         self.session_alerts_card.title_label.setText(tr("stats_alert"))
@@ -68,9 +113,18 @@ class StatisticsPanel(QWidget):
         self.total_alerts_card.title_label.setText(tr("stats_alert"))
         self.total_time_card.title_label.setText(tr("stats_duration"))
         self.avg_alerts_card.title_label.setText(tr("stats_avg_per_session"))
+        self.median_rate_card.title_label.setText(tr("stats_median_per_minute"))
+        self.streak_card.title_label.setText(tr("stats_day_streak"))
+        self.best_streak_card.title_label.setText(tr("stats_best_streak"))
         
         # Update button
         self.reset_btn.setText(tr("btn_reset"))
+        
+        # Durations carry translated units
+        if self._is_on_screen():
+            self._update_stats()
+        else:
+            self._stale = True
     
     def _setup_ui(self):
         layout = QVBoxLayout(self)
@@ -125,6 +179,23 @@ class StatisticsPanel(QWidget):
         
         layout.addWidget(self.alltime_group)
         
+        # Trends
+        self.trends_group = QGroupBox(tr("stats_trends"))
+        self.trends_group.setStyleSheet("QGroupBox { font-size: 11px; }")
+        trends_layout = QHBoxLayout(self.trends_group)
+        trends_layout.setSpacing(8)
+        
+        self.median_rate_card = StatCard(tr("stats_median_per_minute"))
+        trends_layout.addWidget(self.median_rate_card)
+        
+        self.streak_card = StatCard(tr("stats_day_streak"))
+        trends_layout.addWidget(self.streak_card)
+        
+        self.best_streak_card = StatCard(tr("stats_best_streak"))
+        trends_layout.addWidget(self.best_streak_card)
+        
+        layout.addWidget(self.trends_group)
+        
         layout.addStretch()
         
         # Reset button
@@ -150,10 +221,47 @@ class StatisticsPanel(QWidget):
         layout.addLayout(reset_layout)
     
     def _connect_signals(self):
-        self._stats.stats_updated.connect(self._update_stats)
+        self._stats.stats_updated.connect(self._on_stats_updated)
+        self._stats.session_changed.connect(self._on_session_changed)
         self.reset_btn.clicked.connect(self._on_reset_clicked)
     
+    def _is_on_screen(self) -> bool:
+        return self.isVisible() and not self.window().isMinimized()
+    
+    def _update_refresh_timer(self):
+        if self.isVisible() and self._stats.is_session_active:
+            if not self._refresh_timer.isActive():
+                self._refresh_timer.start()
+        else:
+            self._refresh_timer.stop()
+    
+    def _on_stats_updated(self):
+        if self._analytics is not None:
+            # This slot was connected first and runs before the analytics' own
+            self._analytics.invalidate()
+        if not self._is_on_screen():
+            self._stale = True
+            self._skipped_refreshes += 1
+            return
+        self._update_stats()
+        self._update_session_stats()
+    
+    def _on_session_changed(self, active: bool):
+        self._update_refresh_timer()
+        if self._is_on_screen():
+            self._update_session_stats()
+    
+    def _on_refresh_tick(self):
+        if not self._is_on_screen():
+            # Minimized: the window is "visible" but nothing is drawn
+            self._skipped_refreshes += 1
+            return
+        self._update_session_stats()
+    
     def _update_stats(self):
+        self._stale = False
+        self._refresh_count += 1
+        
         # Today
         today = self._stats.get_today_stats()
         self.today_alerts_card.set_value(str(today.get("alerts", 0)))
@@ -164,8 +272,22 @@ class StatisticsPanel(QWidget):
         self.total_alerts_card.set_value(str(self._stats.total_alerts))
         self.total_time_card.set_value(self._format_short(self._stats.total_game_time))
         self.avg_alerts_card.set_value(f"{self._stats.get_average_alerts_per_session():.1f}")
+        
+        # Trends
+        summary = self._get_analytics().summary()
+        self.median_rate_card.set_value(f"{summary['median_alerts_per_minute']:.1f}")
+        self.streak_card.set_value(str(summary["current_streak"]))
+        self.best_streak_card.set_value(str(summary["longest_streak"]))
+    
+    def _get_analytics(self):
+        if self._analytics is None:
+            # Deferred: NumPy is not needed until the statistics are on screen
+            from ..services.session_analytics import SessionAnalytics
+            self._analytics = SessionAnalytics(self._stats, self)
+        return self._analytics
     
     def _update_session_stats(self):
+        self._refresh_count += 1
         self.session_alerts_card.set_value(str(self._stats.session_alerts))
         
         duration = self._stats.current_session_duration
@@ -2,17 +2,46 @@ from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QPushButton, QProgressBar, QFrame
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QPropertyAnimation, QEasingCurve
 
+from ..utils.constants import TIMER_LOW_SECONDS
 from ..utils.localization import tr
 
 
+# Progress bar units per second of countdown
+PROGRESS_SCALE = 1000
+
+
 class TimerPanel(QWidget):
-    """Timer display panel for the main window."""
+    """
+    Timer display panel for the main window.
+    
+    Ticks only change what differs: the "low" colour is a dynamic property
+    re-polished when the countdown crosses the threshold, and the progress
+    bar glides through each second with a linear animation (QProgressBar only
+    repaints when the chunk moves by a pixel).
+    """
     
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._low = False
+        self._running = False
+        self._paused = False
+        self._seconds = None
+        self._restyle_count = 0
         self._setup_ui()
+        
+        self._progress_animation = QPropertyAnimation(self.progress_bar, b"value", self)
+        self._progress_animation.setEasingCurve(QEasingCurve.Type.Linear)
+    
+    @property
+    def restyle_count(self) -> int:
+        """Times the timer label was re-polished for a colour change."""
+        return self._restyle_count
+    
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._animate_progress()
     
     def _setup_ui(self):
         layout = QVBoxLayout(self)
@@ -35,20 +64,24 @@ class TimerPanel(QWidget):
         
         # Timer label
         self.timer_label = QLabel("25")
+        self.timer_label.setProperty("low", False)
         self.timer_label.setStyleSheet("""
             QLabel {
                 color: #ffd700;
                 font-size: 72px;
                 font-weight: bold;
             }
+            QLabel[low="true"] {
+                color: #ff6b6b;
+            }
         """)
         self.timer_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         timer_layout.addWidget(self.timer_label)
         
         # Progress bar
         self.progress_bar = QProgressBar()
-        self.progress_bar.setMaximum(100)
-        self.progress_bar.setValue(100)
+        self.progress_bar.setMaximum(25 * PROGRESS_SCALE)
+        self.progress_bar.setValue(25 * PROGRESS_SCALE)
         self.progress_bar.setTextVisible(False)
         self.progress_bar.setFixedHeight(8)
         self.progress_bar.setStyleSheet("""
@@ -193,27 +226,44 @@ class TimerPanel(QWidget):
     
     def update_timer(self, seconds: int, interval: int):
         """Update timer display."""
-        self.timer_label.setText(str(seconds))
-        progress = (seconds / interval) * 100 if interval > 0 else 100
-        self.progress_bar.setValue(int(progress))
-        
-        # Color change when low
-        if seconds <= 3:
-            self.timer_label.setStyleSheet("""
-                QLabel {
-                    color: #ff6b6b;
-                    font-size: 72px;
-                    font-weight: bold;
-                }
-            """)
-        else:
-            self.timer_label.setStyleSheet("""
-                QLabel {
-                    color: #ffd700;
-                    font-size: 72px;
-                    font-weight: bold;
-                }
-            """)
+        text = str(seconds)
+        if text != self.timer_label.text():
+            self.timer_label.setText(text)
+        self._set_low(seconds <= TIMER_LOW_SECONDS)
+        
+        maximum = max(interval, 1) * PROGRESS_SCALE
+        if maximum != self.progress_bar.maximum():
+            self.progress_bar.setMaximum(maximum)
+        self._seconds = seconds
+        value = min(seconds, interval) * PROGRESS_SCALE if interval > 0 else maximum
+        self._progress_animation.stop()
+        self.progress_bar.setValue(value)
+        self._animate_progress()
+    
+    def _set_low(self, low: bool):
+        """Switch the timer colour; only re-polishes when the state changes."""
+        if low == self._low:
+            return
+        self._low = low
+        self.timer_label.setProperty("low", low)
+        style = self.timer_label.style()
+        style.unpolish(self.timer_label)
+        style.polish(self.timer_label)
+        self._restyle_count += 1
+    
+    def _animate_progress(self):
+        """Glide the bar toward the next second while the countdown runs and is on screen."""
+        if not self._running or self._paused or not self._seconds or not self.isVisible():
+            return
+        start = self.progress_bar.value()
+        end = max(0, (self._seconds - 1) * PROGRESS_SCALE)
+        if start <= end:
+            return
+        # Remaining part of the current second (less than a full second after a resume)
+        self._progress_animation.setDuration(min(PROGRESS_SCALE, start - end) * 1000 // PROGRESS_SCALE)
+        self._progress_animation.setStartValue(start)
+        self._progress_animation.setEndValue(end)
+        self._progress_animation.start()
     
     def set_status(self, message: str):
         """Update status message."""
@@ -225,10 +275,20 @@ class TimerPanel(QWidget):
         self.pause_btn.setEnabled(is_running)
         self.stop_btn.setEnabled(is_running)
         self.pause_btn.setText(tr("btn_pause"))
+        self._running = is_running
+        self._paused = False
+        if not is_running:
+            self._progress_animation.stop()
     
     def set_paused(self, is_paused: bool):
         """Update pause button text."""
         self.pause_btn.setText(tr("btn_resume") if is_paused else tr("btn_pause"))
+        self._paused = is_paused
+        if is_paused:
+            # Hold the bar where the countdown stopped
+            self._progress_animation.stop()
+        else:
+            self._animate_progress()
     
     def retranslate_ui(self):
         """Retranslate all UI strings (called when language changes)."""
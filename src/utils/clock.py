@@ -0,0 +1,66 @@
+"""Clock abstraction shared by the timer, detector and statistics services."""
+import time
+from abc import ABC, abstractmethod
+from datetime import date, datetime, timedelta
+from typing import Optional
+
+
+class Clock(ABC):
+    """Source of monotonic and wall time."""
+    
+    @abstractmethod
+    def monotonic(self) -> float:
+        """Seconds on a clock that never goes backwards."""
+    
+    @abstractmethod
+    def now(self) -> datetime:
+        """Current local wall time."""
+    
+    def today(self) -> date:
+        return self.now().date()
+
+
+class SystemClock(Clock):
+    """Real time."""
+    
+    def monotonic(self) -> float:
+        return time.monotonic()
+    
+    def now(self) -> datetime:
+        return datetime.now()
+
+
+class VirtualClock(Clock):
+    """
+    Manually advanced clock for tests and simulations.
+    
+    Wall time moves in lockstep with monotonic time from `start`.
+    """
+    
+    def __init__(self, start: Optional[datetime] = None):
+        self._start = start or datetime(2024, 1, 1, 12, 0, 0)
+        self._elapsed = 0.0
+    
+    @property
+    def elapsed(self) -> float:
+        """Seconds advanced since creation."""
+        return self._elapsed
+    
+    def monotonic(self) -> float:
+        return self._elapsed
+    
+    def now(self) -> datetime:
+        return self._start + timedelta(seconds=self._elapsed)
+    
+    def advance(self, seconds: float):
+        """Move time forward."""
+        if seconds < 0:
+            raise ValueError("VirtualClock cannot go backwards")
+        self._elapsed += seconds
+    
+    def advance_to(self, monotonic: float):
+        """Move time forward to an absolute monotonic value."""
+        self.advance(max(0.0, monotonic - self._elapsed))
+
+
+SYSTEM_CLOCK = SystemClock()
@@ -1,16 +1,32 @@
+import atexit
 import json
 import os
 from typing import Any, Optional
+from PyQt6 import sip
+from PyQt6.QtCore import QCoreApplication, QTimer
+from .fileio import atomic_write_json
 from .constants import (
     CONFIG_FILE, 
+    CONFIG_FLUSH_DELAY_MS,
+    CONTROL_SERVER_DEFAULT_PORT,
     DEFAULT_INTERVAL, 
     DEFAULT_VOLUME,
-    DETECTION_MODE_API
+    DETECTION_MODE_API,
+    OVERLAY_RENDERER_WIDGETS,
+    STATS_BACKEND_JSON
 )
 
 
 class Config:
-    """Manages application configuration with JSON persistence."""
+    """
+    Manages application configuration with JSON persistence.
+    
+    Changes are written behind: `set` marks the config dirty and a debounce
+    timer writes it once things settle, so a slider drag or typing in a text
+    field costs one write instead of one per step. `flush` forces pending
+    changes out (on quit and at interpreter exit); writes replace the file
+    atomically.
+    """
     
     _instance: Optional['Config'] = None
     _defaults = {
@@ -25,6 +41,10 @@ class Config:
         "auto_start_detection": True,
         "auto_show_overlay": True,
         "language": None,  # None means auto-detect
+        "stats_backend": STATS_BACKEND_JSON,  # "json" or "sqlite"
+        "overlay_renderer": OVERLAY_RENDERER_WIDGETS,  # "widgets" or "painted"
+        "control_server_enabled": False,  # Local HTTP/SSE API on 127.0.0.1
+        "control_server_port": CONTROL_SERVER_DEFAULT_PORT,
     }
     
     def __new__(cls):
@@ -32,7 +52,12 @@ class Config:
             cls._instance = super().__new__(cls)
             cls._instance._config = {}
             cls._instance._config_path = cls._get_config_path()
+            cls._instance._dirty = False
+            cls._instance._flush_timer = None
+            cls._instance._write_count = 0
+            cls._instance._writes_avoided = 0
             cls._instance._load()
+            atexit.register(cls._instance.flush)
         return cls._instance
     
     @staticmethod
@@ -58,21 +83,71 @@ class Config:
                 self._config[key] = value
     
     def save(self):
-        """Save configuration to file."""
+        """Save configuration to file now."""
+        if self._flush_timer is not None and not sip.isdeleted(self._flush_timer):
+            self._flush_timer.stop()
         try:
-            with open(self._config_path, 'w', encoding='utf-8') as f:
-                json.dump(self._config, f, indent=2)
-        except IOError as e:
+            atomic_write_json(self._config_path, self._config, indent=2)
+            self._dirty = False
+            self._write_count += 1
+        except (IOError, OSError) as e:
             print(f"Error saving config: {e}")
     
+    def flush(self):
+        """Write pending changes, if any."""
+        if self._dirty:
+            self.save()
+    
+    @property
+    def is_dirty(self) -> bool:
+        """Whether there are changes not yet written."""
+        return self._dirty
+    
+    @property
+    def write_count(self) -> int:
+        """Config file writes this session."""
+        return self._write_count
+    
+    @property
+    def writes_avoided(self) -> int:
+        """Changes this session that did not need a write of their own."""
+        return self._writes_avoided
+    
     def get(self, key: str, default: Any = None) -> Any:
         """Get a configuration value."""
         return self._config.get(key, default if default is not None else self._defaults.get(key))
     
     def set(self, key: str, value: Any):
-        """Set a configuration value and save."""
+        """Set a configuration value; it is written shortly after changes stop."""
+        if key in self._config and self._config[key] == value:
+            self._writes_avoided += 1
+            return
         self._config[key] = value
-        self.save()
+        self._mark_dirty()
+    
+    def _mark_dirty(self):
+        if self._dirty:
+            # Coalesced into the write that is already pending
+            self._writes_avoided += 1
+        self._dirty = True
+        
+        timer = self._get_flush_timer()
+        if timer is None:
+            # No Qt event loop yet (e.g. during startup): write through
+            self.save()
+        else:
+            timer.start()
+    
+    def _get_flush_timer(self) -> Optional[QTimer]:
+        if self._flush_timer is not None and sip.isdeleted(self._flush_timer):
+            # The application that owned it has been torn down
+            self._flush_timer = None
+        if self._flush_timer is None and QCoreApplication.instance() is not None:
+            self._flush_timer = QTimer()
+            self._flush_timer.setSingleShot(True)
+            self._flush_timer.setInterval(CONFIG_FLUSH_DELAY_MS)
+            self._flush_timer.timeout.connect(self.flush)
+        return self._flush_timer
     
     def __getitem__(self, key: str) -> Any:
         return self.get(key)
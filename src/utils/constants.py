@@ -6,14 +6,27 @@ APP_VERSION = "1.1.0"
 DEFAULT_INTERVAL = 25  # seconds (villager production time)
 MIN_INTERVAL = 5
 MAX_INTERVAL = 60
+TIMER_LATE_TOLERANCE = 0.25  # seconds a wakeup may be late before it counts as missed ticks
+TIMER_LOW_SECONDS = 3  # countdown is shown in red at or below this
+VILLAGER_TIMER_ID = "villager"  # TimerEngine reminder behind the main countdown
 
 # Game detection via aoe4world.com API
 AOE4_API_URL = "https://aoe4world.com/api/v0/players/{profile_id}/games/last"
-API_CHECK_INTERVAL = 10000  # ms (check every 10 seconds for match status)
+API_CHECK_INTERVAL = 10000  # ms (fixed poll interval, baseline for the adaptive scheduler)
+API_REQUEST_TIMEOUT = 10  # seconds
+API_LOBBY_INTERVAL = 5000  # ms (game running, no match: poll fast to catch match start)
+API_MATCH_INTERVAL = 20000  # ms (match ongoing: only the end matters)
+API_BACKOFF_MAX_INTERVAL = 120000  # ms (slowest poll after repeated errors)
+API_BACKOFF_JITTER = 0.2  # +/- fraction of the backoff interval
+API_BREAKER_FAILURE_THRESHOLD = 3  # consecutive failures before the API is treated as degraded
+API_BREAKER_RESET_TIMEOUT = 60  # seconds before a single probe request is allowed
+API_BREAKER_MAX_RETRY_AFTER = 900  # seconds (cap for server-provided Retry-After)
 
 # Game executable detection
 AOE4_EXECUTABLE = "RelicCardinal.exe"
 PROCESS_CHECK_INTERVAL = 10000  # ms (check every 10 seconds if game is running)
+PROCESS_SCAN_MAX_INTERVAL = 30000  # ms (slowest full scan while the game is absent)
+PROCESS_SCAN_BACKOFF = 1.5  # full scan interval growth per miss
 
 # Detection modes
 DETECTION_MODE_API = "api"
@@ -21,9 +34,32 @@ DETECTION_MODE_MANUAL = "manual"
 
 # Notification
 DEFAULT_VOLUME = 70  # 0-100
+SOUND_ALERT = "alert"  # Sound bank key of the villager alert
+SOUND_RESERVED_CHANNELS = 1  # Mixer channels kept free for alert sounds
 
 # Config file
 CONFIG_FILE = "config.json"
+CONFIG_FLUSH_DELAY_MS = 500  # Coalesce config changes for this long before writing
 STATS_FILE = "statistics.json"
+STATS_JOURNAL_SUFFIX = ".journal"  # Append-only event log next to the stats file
+STATS_COMPACT_IDLE_MS = 60000  # Compact the journal after this long without events
+STATS_DB_FILE = "statistics.db"
+STATS_REFRESH_INTERVAL_MS = 1000  # Live session card refresh while the statistics tab is visible
 
+# Statistics backends
+STATS_BACKEND_JSON = "json"
+STATS_BACKEND_SQLITE = "sqlite"
 
+# Overlay renderers
+OVERLAY_RENDERER_WIDGETS = "widgets"  # QLabel/QPushButton overlay styled with stylesheets
+OVERLAY_RENDERER_PAINTED = "painted"  # Single custom-painted widget
+
+# Single instance
+SINGLE_INSTANCE_TIMEOUT_MS = 200  # Local socket connect/write timeout when handing a command to the running instance
+HEADLESS_SIGNAL_POLL_MS = 250  # Event loop wake-up so Ctrl+C/SIGTERM reach Python in headless mode
+
+# Local control server (stream decks, OBS scripts)
+CONTROL_SERVER_DEFAULT_PORT = 47800  # Bound to 127.0.0.1 only
+CONTROL_MAX_REQUEST_BYTES = 8192  # Request line and headers
+CONTROL_SSE_KEEPALIVE_MS = 15000  # Comment line sent to event stream subscribers while idle
+CONTROL_SSE_MAX_BACKLOG = 256 * 1024  # Bytes queued for one subscriber before it is dropped as too slow
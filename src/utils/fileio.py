@@ -0,0 +1,33 @@
+"""Crash-safe file writes."""
+import json
+import os
+import tempfile
+from typing import Any, Optional
+
+
+def atomic_write_text(path: str, text: str):
+    """
+    Replace `path` with `text` so readers see either the old or the new file.
+    
+    The data is written to a temporary file in the same directory, flushed to
+    disk and then moved over the target with `os.replace`.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=".tmp-", dir=directory)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def atomic_write_json(path: str, data: Any, indent: Optional[int] = 2):
+    """Serialise `data` as JSON and write it with `atomic_write_text`."""
+    atomic_write_text(path, json.dumps(data, indent=indent, default=str))
@@ -0,0 +1,126 @@
+import getpass
+from typing import Dict, List, Optional
+from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtNetwork import QLocalServer, QLocalSocket
+from .constants import APP_NAME, SINGLE_INSTANCE_TIMEOUT_MS
+
+
+# Commands a second launch can forward to the running instance
+COMMAND_SHOW = "show"
+COMMAND_START = "start"
+COMMAND_STOP = "stop"
+COMMAND_PAUSE = "pause"  # Toggles pause
+COMMAND_QUIT = "quit"
+
+_COMMAND_FLAGS = {
+    "--show": COMMAND_SHOW,
+    "--start": COMMAND_START,
+    "--stop": COMMAND_STOP,
+    "--pause": COMMAND_PAUSE,
+    "--quit": COMMAND_QUIT,
+}
+
+
+def command_from_args(argv: List[str]) -> str:
+    """The command requested on the command line (the last flag wins); showing the window by default."""
+    command = COMMAND_SHOW
+    for arg in argv[1:]:
+        command = _COMMAND_FLAGS.get(arg, command)
+    return command
+
+
+def default_server_name() -> str:
+    """Per-user name of the local socket / named pipe."""
+    try:
+        user = getpass.getuser()
+    except (KeyError, OSError):
+        user = "user"
+    return f"{APP_NAME.replace(' ', '')}-{user}"
+
+
+class SingleInstance(QObject):
+    """
+    Keeps one running instance per user.
+    
+    The first instance `listen`s on a `QLocalServer`. Later launches find it
+    with `send_to_running`, hand over their command and exit, so there is only
+    ever one game poller and one writer of the statistics files.
+    """
+    
+    command_received = pyqtSignal(str)
+    
+    def __init__(self, server_name: Optional[str] = None, parent=None):
+        super().__init__(parent)
+        self._server_name = server_name or default_server_name()
+        self._server: Optional[QLocalServer] = None
+        self._buffers: Dict[QLocalSocket, bytes] = {}
+    
+    @property
+    def server_name(self) -> str:
+        return self._server_name
+    
+    @property
+    def is_listening(self) -> bool:
+        return self._server is not None and self._server.isListening()
+    
+    def send_to_running(self, command: str, timeout_ms: int = SINGLE_INSTANCE_TIMEOUT_MS) -> bool:
+        """Forward `command` to a running instance; False if there is none."""
+        socket = QLocalSocket()
+        socket.connectToServer(self._server_name)
+        if not socket.waitForConnected(timeout_ms):
+            return False
+        socket.write(command.encode("utf-8") + b"\n")
+        delivered = socket.waitForBytesWritten(timeout_ms)
+        socket.disconnectFromServer()
+        if socket.state() != QLocalSocket.LocalSocketState.UnconnectedState:
+            socket.waitForDisconnected(timeout_ms)
+        return delivered
+    
+    def listen(self) -> bool:
+        """Become the running instance; False if another one already is."""
+        # Probe first: with UserAccessOption Qt replaces an existing socket
+        # file instead of failing with AddressInUseError
+        probe = QLocalSocket()
+        probe.connectToServer(self._server_name)
+        if probe.waitForConnected(SINGLE_INSTANCE_TIMEOUT_MS):
+            probe.disconnectFromServer()
+            return False
+        # Nobody answered: any socket file was left behind by a crashed instance
+        QLocalServer.removeServer(self._server_name)
+        
+        server = QLocalServer(self)
+        server.setSocketOptions(QLocalServer.SocketOption.UserAccessOption)
+        if not server.listen(self._server_name):
+            print(f"Single instance server error: {server.errorString()}")
+            return False
+        
+        server.newConnection.connect(self._on_new_connection)
+        self._server = server
+        return True
+    
+    def close(self):
+        if self._server is not None:
+            self._server.close()
+            self._server = None
+    
+    def _on_new_connection(self):
+        while self._server is not None and self._server.hasPendingConnections():
+            socket = self._server.nextPendingConnection()
+            self._buffers[socket] = b""
+            socket.readyRead.connect(lambda s=socket: self._on_ready_read(s))
+            socket.disconnected.connect(lambda s=socket: self._on_disconnected(s))
+            if socket.bytesAvailable():
+                self._on_ready_read(socket)
+    
+    def _on_ready_read(self, socket: QLocalSocket):
+        data = self._buffers.get(socket, b"") + bytes(socket.readAll())
+        *lines, rest = data.split(b"\n")
+        self._buffers[socket] = rest
+        for line in lines:
+            command = line.decode("utf-8", errors="replace").strip()
+            if command:
+                self.command_received.emit(command)
+    
+    def _on_disconnected(self, socket: QLocalSocket):
+        self._buffers.pop(socket, None)
+        socket.deleteLater()
@@ -4,14 +4,22 @@ Pytest configuration and fixtures for PyQt6 testing.
 
 import sys
 import os
+import json
+import threading
 import pytest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
+# Mixer tests must not need a sound card (CI, headless machines)
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
 from PyQt6.QtWidgets import QApplication
 
+from src.utils.config import Config
+
 
 @pytest.fixture(scope="session")
 def qapp():
@@ -22,6 +30,19 @@ def qapp():
     yield app
 
 
+@pytest.fixture
+def config(qapp, tmp_path, monkeypatch):
+    """A fresh Config singleton whose config.json lives in tmp_path; the previous one is restored after."""
+    monkeypatch.setenv('APPDATA', str(tmp_path))
+    previous = Config._instance
+    Config._instance = None
+    instance = Config()
+    yield instance
+    if instance._flush_timer is not None:
+        instance._flush_timer.stop()
+    Config._instance = previous
+
+
 @pytest.fixture
 def golden_dir():
     """Return the path to the golden images directory."""
@@ -29,3 +50,79 @@ def golden_dir():
     os.makedirs(path, exist_ok=True)
     return path
 
+
+class FakeAoE4WorldServer:
+    """Local stand-in for aoe4world.com serving `/api/v0/players/<id>/games/last`."""
+    
+    def __init__(self):
+        self.payload = {"ongoing": False}
+        self.etag = '"v1"'
+        self.status_code = 200
+        self.extra_headers = {}
+        self.requests = []  # (path, headers) per request
+        self.connections = 0
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+    
+    @property
+    def url_template(self) -> str:
+        host, port = self._server.server_address
+        return f"http://{host}:{port}/api/v0/players/{{profile_id}}/games/last"
+    
+    def set_payload(self, payload: dict, etag: str):
+        self.payload = payload
+        self.etag = etag
+    
+    def _make_handler(self):
+        server = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive
+            
+            def setup(self):
+                super().setup()
+                server.connections += 1
+            
+            def do_GET(self):
+                server.requests.append((self.path, dict(self.headers)))
+                if server.status_code != 200:
+                    self._send(server.status_code, b"")
+                elif server.etag and self.headers.get("If-None-Match") == server.etag:
+                    self._send(304, b"")
+                else:
+                    self._send(200, json.dumps(server.payload).encode("utf-8"))
+            
+            def _send(self, code, body):
+                self.send_response(code)
+                if server.etag:
+                    self.send_header("ETag", server.etag)
+                for key, value in server.extra_headers.items():
+                    self.send_header(key, value)
+                if code != 304:
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                if code != 304:
+                    self.wfile.write(body)
+            
+            def log_message(self, format, *args):
+                pass
+        
+        return Handler
+    
+    def start(self):
+        self._thread.start()
+    
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@pytest.fixture
+def aoe4world_server():
+    """Start a local fake AoE4World API server."""
+    server = FakeAoE4WorldServer()
+    server.start()
+    yield server
+    server.stop()
@@ -0,0 +1,73 @@
+"""
+Tests for the AoE4World HTTP client against a local stand-in server.
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.services.aoe4world_client import AoE4WorldClient
+
+
+def test_conditional_request_returns_not_modified(aoe4world_server):
+    """Second poll sends If-None-Match and reuses the cached payload on 304."""
+    aoe4world_server.set_payload({"ongoing": True}, '"abc"')
+    client = AoE4WorldClient(url_template=aoe4world_server.url_template, timeout=2)
+    
+    first = client.fetch_last_game("42")
+    second = client.fetch_last_game("42")
+    
+    assert first.status_code == 200
+    assert not first.not_modified
+    assert second.status_code == 304
+    assert second.not_modified
+    assert second.data == {"ongoing": True}
+    assert aoe4world_server.requests[1][1].get("If-None-Match") == '"abc"'
+    assert client.not_modified_count == 1
+    client.close()
+
+
+def test_changed_state_returns_new_payload(aoe4world_server):
+    """A new ETag on the server yields a full 200 response."""
+    client = AoE4WorldClient(url_template=aoe4world_server.url_template, timeout=2)
+    client.fetch_last_game("42")
+    
+    aoe4world_server.set_payload({"ongoing": True}, '"v2"')
+    response = client.fetch_last_game("42")
+    
+    assert response.status_code == 200
+    assert response.data == {"ongoing": True}
+    client.close()
+
+
+def test_session_reuses_connection_and_records_timing(aoe4world_server):
+    """Repeated polls go over one keep-alive connection and are timed."""
+    client = AoE4WorldClient(url_template=aoe4world_server.url_template, timeout=2)
+    
+    for _ in range(5):
+        client.fetch_last_game("42")
+    
+    assert aoe4world_server.connections == 1
+    assert client.request_count == 5
+    assert len(client.timings) == 5
+    assert all(t.elapsed_ms > 0 for t in client.timings)
+    assert client.average_elapsed_ms > 0
+    client.close()
+
+
+def test_retry_after_and_rate_limit_headers(aoe4world_server):
+    """Retry-After and exhausted rate-limit quotas are reported in seconds."""
+    client = AoE4WorldClient(url_template=aoe4world_server.url_template, timeout=2)
+    
+    aoe4world_server.status_code = 429
+    aoe4world_server.extra_headers = {"Retry-After": "30"}
+    assert client.fetch_last_game("42").retry_after == 30
+    
+    aoe4world_server.status_code = 200
+    aoe4world_server.extra_headers = {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "12"}
+    assert client.fetch_last_game("42").retry_after == 12
+    
+    aoe4world_server.extra_headers = {"X-RateLimit-Remaining": "5", "X-RateLimit-Reset": "12"}
+    assert client.fetch_last_game("42").retry_after is None
+    client.close()
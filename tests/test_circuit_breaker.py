@@ -0,0 +1,90 @@
+"""
+Tests for the AoE4World circuit breaker.
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.services.circuit_breaker import (
+    CircuitBreaker,
+    BREAKER_CLOSED,
+    BREAKER_OPEN,
+    BREAKER_HALF_OPEN,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self):
+        return self.now
+
+
+def make_breaker(clock, transitions):
+    return CircuitBreaker(failure_threshold=3, reset_timeout=60, max_retry_after=600,
+                          clock=clock, on_state_change=transitions.append)
+
+
+def test_opens_after_consecutive_failures_and_probes_once():
+    clock = FakeClock()
+    transitions = []
+    breaker = make_breaker(clock, transitions)
+    
+    for _ in range(3):
+        assert breaker.allow_request()
+        breaker.record_failure()
+    assert breaker.state == BREAKER_OPEN
+    assert not breaker.allow_request()
+    assert breaker.retry_in() == 60
+    
+    clock.now = 60
+    assert breaker.allow_request()  # the single half-open probe
+    assert breaker.state == BREAKER_HALF_OPEN
+    assert not breaker.allow_request()
+    
+    breaker.record_success()
+    assert breaker.state == BREAKER_CLOSED
+    assert transitions == [BREAKER_OPEN, BREAKER_HALF_OPEN, BREAKER_CLOSED]
+
+
+def test_failed_probe_reopens():
+    clock = FakeClock()
+    breaker = make_breaker(clock, [])
+    for _ in range(3):
+        breaker.record_failure()
+    
+    clock.now = 61
+    assert breaker.allow_request()
+    breaker.record_failure()
+    assert breaker.state == BREAKER_OPEN
+    assert breaker.retry_in() == 60
+
+
+def test_retry_after_opens_immediately_and_is_capped():
+    clock = FakeClock()
+    breaker = make_breaker(clock, [])
+    
+    breaker.record_failure(retry_after=5)
+    assert breaker.state == BREAKER_OPEN
+    assert breaker.retry_in() == 5
+    
+    breaker.reset()
+    breaker.record_failure(retry_after=86400)
+    assert breaker.retry_in() == 600
+
+
+def test_released_probe_allows_another():
+    clock = FakeClock()
+    breaker = make_breaker(clock, [])
+    for _ in range(3):
+        breaker.record_failure()
+    
+    clock.now = 60
+    assert breaker.allow_request()
+    breaker.release_probe()
+    assert breaker.state == BREAKER_HALF_OPEN
+    assert breaker.allow_request()
+    assert not breaker.allow_request()
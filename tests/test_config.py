@@ -0,0 +1,56 @@
+"""
+Tests for write-behind Config persistence.
+"""
+
+import sys
+import os
+import json
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from PyQt6 import sip
+
+from src.utils.constants import CONFIG_FLUSH_DELAY_MS
+
+
+def read_config(config):
+    with open(config._config_path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def test_slider_drag_is_written_once(qtbot, config):
+    for value in range(5, 61):
+        config.set("interval", value)
+    
+    assert config.is_dirty
+    assert config.write_count == 0
+    
+    qtbot.waitUntil(lambda: not config.is_dirty, timeout=CONFIG_FLUSH_DELAY_MS * 4)
+    assert config.write_count == 1
+    assert config.writes_avoided == 55
+    assert read_config(config)["interval"] == 60
+
+
+def test_flush_writes_pending_changes_atomically(config):
+    config.set("profile_id", "1234")
+    config.set("profile_id", "1234")  # unchanged: no write needed
+    config.flush()
+    
+    assert read_config(config)["profile_id"] == "1234"
+    assert config.write_count == 1
+    assert config.writes_avoided == 1
+    # Only the config itself is left behind, no temp files
+    assert os.listdir(os.path.dirname(config._config_path)) == ["config.json"]
+    
+    config.flush()
+    assert config.write_count == 1
+
+
+def test_flush_timer_deleted_with_its_application(qtbot, config):
+    config.set("interval", 30)
+    sip.delete(config._flush_timer)
+    
+    config.set("interval", 35)
+    assert config._flush_timer is not None and not sip.isdeleted(config._flush_timer)
+    config.flush()
+    assert read_config(config)["interval"] == 35
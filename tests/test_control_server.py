@@ -0,0 +1,231 @@
+"""
+Tests for the local control API and its Server-Sent Events stream.
+"""
+
+import sys
+import os
+import json
+import socket
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import pytest
+
+from src.services.control_server import ControlServer
+from src.services.game_detector import GameDetector
+from src.services.timer_service import TimerService
+
+
+LOAD_TEST_CLIENTS = 100
+
+
+class Client:
+    """Raw HTTP client that is read without blocking the Qt event loop."""
+    
+    def __init__(self, port: int, method: str, path: str, headers=None):
+        self.data = b""
+        self.closed = False
+        self._sock = socket.create_connection(("127.0.0.1", port))
+        lines = [f"{method} {path} HTTP/1.1", f"Host: 127.0.0.1:{port}"]
+        lines += [f"{name}: {value}" for name, value in (headers or {}).items()]
+        self._sock.sendall(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+        self._sock.setblocking(False)
+    
+    def poll(self):
+        while not self.closed:
+            try:
+                chunk = self._sock.recv(65536)
+            except BlockingIOError:
+                return
+            if not chunk:
+                self.closed = True
+            self.data += chunk
+    
+    @property
+    def status(self) -> int:
+        return int(self.data.split(b" ", 2)[1])
+    
+    @property
+    def body(self) -> bytes:
+        return self.data.partition(b"\r\n\r\n")[2]
+    
+    def events(self, name: str):
+        # The last block is empty or a message still in flight
+        complete = self.body.split(b"\n\n")[:-1]
+        return [json.loads(block.split(b"\ndata: ", 1)[1]) for block in complete
+                if block.startswith(f"event: {name}\n".encode())]
+    
+    def close(self):
+        self._sock.close()
+
+
+@pytest.fixture
+def control(qapp):
+    timer_service = TimerService()
+    game_detector = GameDetector()
+    commands = []
+    
+    def handle_command(command):
+        commands.append(command)
+        if command == "start":
+            timer_service.start()
+        elif command == "stop":
+            timer_service.stop()
+    
+    server = ControlServer(timer_service, game_detector, handle_command)
+    assert server.start(0)
+    server.commands = commands
+    yield server
+    server.stop()
+    timer_service.stop()
+    game_detector.shutdown()
+
+
+def request(qtbot, server, method, path, headers=None) -> Client:
+    client = Client(server.port, method, path, headers)
+    
+    def done():
+        client.poll()
+        assert client.closed
+    
+    qtbot.waitUntil(done, timeout=2000)
+    client.close()
+    return client
+
+
+def test_state_route(qtbot, control):
+    response = request(qtbot, control, "GET", "/state")
+    
+    assert response.status == 200
+    state = json.loads(response.body)
+    assert state["running"] is False
+    assert state["remaining"] == state["interval"]
+
+
+def test_command_routes(qtbot, control):
+    response = request(qtbot, control, "POST", "/start")
+    
+    assert response.status == 200
+    assert control.commands == ["start"]
+    assert json.loads(response.body)["running"] is True
+    
+    assert request(qtbot, control, "GET", "/stop").status == 405
+    assert request(qtbot, control, "GET", "/missing").status == 404
+    assert control.commands == ["start"]
+
+
+def test_rejects_foreign_hosts_and_cross_origin_commands(qtbot, control):
+    assert request(qtbot, control, "GET", "/state", {"Host": "evil.example"}).status == 403
+    assert request(qtbot, control, "POST", "/start", {"Origin": "https://evil.example"}).status == 403
+    assert control.commands == []
+    
+    same_origin = {"Origin": f"http://127.0.0.1:{control.port}"}
+    assert request(qtbot, control, "POST", "/start", same_origin).status == 200
+
+
+def test_ticks_fan_out_to_many_subscribers_from_one_payload(qtbot, control):
+    clients = []
+    for _ in range(LOAD_TEST_CLIENTS):
+        clients.append(Client(control.port, "GET", "/events"))
+        # Let the server accept as we go so the listen backlog never fills up
+        qtbot.waitUntil(lambda: control.subscriber_count == len(clients), timeout=2000)
+    
+    serialized = control.serialize_count
+    for remaining in range(20, 0, -1):
+        control._timer_service.tick.emit(remaining)
+    
+    assert control.serialize_count - serialized == 20
+    
+    def all_received():
+        for client in clients:
+            client.poll()
+            assert len(client.events("tick")) == 20
+    
+    qtbot.waitUntil(all_received, timeout=5000)
+    for client in clients:
+        assert client.events("state")[0]["running"] is False
+        assert [e["remaining"] for e in client.events("tick")] == list(range(20, 0, -1))
+        client.close()
+    qtbot.waitUntil(lambda: control.subscriber_count == 0, timeout=2000)
+
+
+def test_state_changes_are_pushed(qtbot, control):
+    client = Client(control.port, "GET", "/events")
+    qtbot.waitUntil(lambda: control.subscriber_count == 1, timeout=2000)
+    
+    request(qtbot, control, "POST", "/start")
+    
+    def received():
+        client.poll()
+        assert len(client.events("state")) == 2
+    
+    qtbot.waitUntil(received, timeout=2000)
+    assert client.events("state")[-1]["running"] is True
+    client.close()
+
+
+def test_overlay_page_is_served_from_memory_with_etags(qtbot, control):
+    page = request(qtbot, control, "GET", "/overlay")
+    
+    assert page.status == 200
+    assert b"text/html" in page.data
+    assert b'src="/overlay/overlay.js"' in page.body
+    etag = next(line.split(b": ", 1)[1].decode() for line in page.data.split(b"\r\n")
+                if line.lower().startswith(b"etag:"))
+    loaded = control.assets.load_count
+    
+    cached = request(qtbot, control, "GET", "/overlay", {"If-None-Match": etag})
+    assert cached.status == 304
+    assert cached.body == b""
+    
+    script = request(qtbot, control, "GET", "/overlay/overlay.js")
+    assert script.status == 200
+    assert b"text/javascript" in script.data
+    assert control.assets.load_count == loaded
+    
+    assert request(qtbot, control, "GET", "/overlay/../main.py").status == 404
+
+
+def test_overlay_stream_sends_snapshot_then_only_changes(qtbot, control):
+    client = Client(control.port, "GET", "/overlay/events")
+    qtbot.waitUntil(lambda: control.stream_subscriber_count("/overlay/events") == 1, timeout=2000)
+    timer_service = control._timer_service
+    
+    timer_service.start()
+    timer_service.tick.emit(24)
+    timer_service.tick.emit(24)
+    timer_service.alert.emit()
+    
+    def received():
+        client.poll()
+        assert len(client.events("alert")) == 1
+    
+    qtbot.waitUntil(received, timeout=2000)
+    snapshot = client.events("snapshot")[0]
+    assert snapshot["running"] is False
+    assert snapshot["labels"]["title"]
+    deltas = client.events("delta")
+    assert deltas[0]["running"] is True
+    assert "interval" not in deltas[0]
+    assert deltas[-1] == {"remaining": 24}
+    assert deltas.count({"remaining": 24}) == 1
+    assert client.events("tick") == []
+    client.close()
+
+
+def test_interval_change_while_stopped_is_pushed(qtbot, control):
+    overlay = Client(control.port, "GET", "/overlay/events")
+    events = Client(control.port, "GET", "/events")
+    qtbot.waitUntil(lambda: control.subscriber_count == 2, timeout=2000)
+    
+    control._timer_service.interval = 40
+    
+    def received():
+        overlay.poll()
+        events.poll()
+        assert overlay.events("delta") == [{"remaining": 40, "interval": 40}]
+        assert events.events("state")[-1]["interval"] == 40
+    
+    qtbot.waitUntil(received, timeout=2000)
+    overlay.close()
+    events.close()
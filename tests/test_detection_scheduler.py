@@ -0,0 +1,83 @@
+"""
+Tests for the adaptive API detection scheduler.
+"""
+
+import sys
+import os
+import random
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.services.detection_scheduler import (
+    DetectionScheduler,
+    STATE_WAITING,
+    STATE_LOBBY,
+    STATE_IN_MATCH,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self):
+        return self.now
+
+
+def make_scheduler(clock=None):
+    return DetectionScheduler(
+        lobby_interval=5000,
+        match_interval=20000,
+        backoff_max_interval=60000,
+        jitter=0.2,
+        baseline_interval=10000,
+        clock=clock or FakeClock(),
+        rng=random.Random(1),
+    )
+
+
+def test_interval_depends_on_state():
+    scheduler = make_scheduler()
+    scheduler.state = STATE_LOBBY
+    assert scheduler.next_interval() == 5000
+    scheduler.state = STATE_IN_MATCH
+    assert scheduler.next_interval() == 20000
+
+
+def test_errors_back_off_with_jitter_and_cap():
+    scheduler = make_scheduler()
+    scheduler.state = STATE_LOBBY
+    
+    scheduler.record_error()
+    assert 8000 <= scheduler.next_interval() <= 12000
+    
+    for _ in range(10):
+        scheduler.record_error()
+    assert 48000 <= scheduler.next_interval() <= 72000
+    
+    scheduler.record_success()
+    assert scheduler.next_interval() == 5000
+
+
+def test_counts_requests_saved_against_fixed_schedule():
+    clock = FakeClock()
+    scheduler = make_scheduler(clock)
+    scheduler.state = STATE_WAITING
+    
+    # 2 minutes lobby at 5 s, then a 30 minute match at 20 s
+    scheduler.state = STATE_LOBBY
+    for _ in range(24):
+        scheduler.record_request()
+        clock.now += 5
+    scheduler.state = STATE_IN_MATCH
+    for _ in range(90):
+        scheduler.record_request()
+        clock.now += 20
+    scheduler.state = STATE_WAITING
+    clock.now += 600  # not polling, must not count
+    
+    stats = scheduler.get_stats()
+    assert stats["polling_seconds"] == 1920
+    assert stats["baseline_requests"] == 193
+    assert stats["requests_made"] == 114
+    assert stats["requests_saved"] == 79
@@ -0,0 +1,187 @@
+"""
+Tests for GameDetector API polling.
+"""
+
+import sys
+import os
+import time
+import threading
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import pytest
+
+from src.services.aoe4world_client import AoE4WorldClient, LastGameResponse
+from src.services.game_detector import GameDetector
+from src.utils.clock import VirtualClock
+from src.utils.constants import API_BREAKER_RESET_TIMEOUT
+
+
+class FakeClient(AoE4WorldClient):
+    """Client whose requests block until released."""
+    
+    def __init__(self, payload=None, status_code=200):
+        super().__init__()
+        self.payload = payload if payload is not None else {"ongoing": False}
+        self.status_code = status_code
+        self.release = threading.Event()
+        self.calls = []
+    
+    def fetch_last_game(self, profile_id):
+        self.calls.append(threading.current_thread())
+        self.release.wait(5)
+        return LastGameResponse(self.status_code, self.payload, False, 1.0)
+
+
+@pytest.fixture
+def detector(qapp):
+    detector = GameDetector()
+    detector.profile_id = "12345678"
+    detector._is_game_exe_running = True
+    yield detector
+    detector.shutdown()
+
+
+def test_check_api_does_not_block_gui_thread(qtbot, detector):
+    """A slow API response must not block the caller."""
+    client = FakeClient({"ongoing": True})
+    detector._api_client = client
+    
+    start = time.perf_counter()
+    detector._check_api()
+    assert time.perf_counter() - start < 0.1
+    assert detector.is_api_request_in_flight
+    
+    with qtbot.waitSignal(detector.game_started, timeout=2000):
+        client.release.set()
+    
+    assert detector.is_game_running
+    assert client.calls[0] is not threading.main_thread()
+
+
+def test_single_request_in_flight_per_profile(qtbot, detector):
+    """Repeated checks while a request is pending must not start new requests."""
+    client = FakeClient()
+    detector._api_client = client
+    
+    for _ in range(5):
+        detector._check_api()
+    
+    client.release.set()
+    qtbot.waitUntil(lambda: not detector.is_api_request_in_flight, timeout=2000)
+    assert len(client.calls) == 1
+
+
+def test_stale_result_ignored_after_stop(qtbot, detector):
+    """Results arriving after detection stopped must not emit game_started."""
+    client = FakeClient({"ongoing": True})
+    detector._api_client = client
+    
+    detector._is_detecting = True
+    detector._check_api()
+    detector.stop_detection()
+    
+    started = []
+    detector.game_started.connect(lambda: started.append(True))
+    client.release.set()
+    qtbot.waitUntil(lambda: not detector.is_api_request_in_flight, timeout=2000)
+    assert not started
+
+
+def test_detector_polls_through_client(qtbot, detector, aoe4world_server):
+    """End to end: detector reaches the local server and reacts to 304s."""
+    aoe4world_server.set_payload({"ongoing": True}, '"m1"')
+    detector._api_client = AoE4WorldClient(url_template=aoe4world_server.url_template, timeout=2)
+    
+    with qtbot.waitSignal(detector.game_started, timeout=2000):
+        detector._check_api()
+    
+    qtbot.waitUntil(lambda: not detector.is_api_request_in_flight, timeout=2000)
+    detector._check_api()
+    qtbot.waitUntil(lambda: not detector.is_api_request_in_flight, timeout=2000)
+    
+    assert detector.is_game_running
+    assert detector.api_client.not_modified_count == 1
+
+
+def test_next_check_armed_with_state_interval(qtbot, detector):
+    """After a result the API timer is re-armed with the scheduler's interval."""
+    client = FakeClient({"ongoing": True})
+    client.release.set()
+    detector._api_client = client
+    detector._is_detecting = True
+    detector.scheduler.state = "lobby"
+    
+    with qtbot.waitSignal(detector.game_started, timeout=2000):
+        detector._check_api()
+    
+    assert detector.scheduler.state == "in_match"
+    assert detector._api_timer.isActive()
+    assert detector._api_timer.interval() == detector.scheduler.base_interval()
+
+
+def test_degraded_api_reported_once(qtbot, detector, aoe4world_server):
+    """Repeated upstream errors open the breaker and stop further requests."""
+    aoe4world_server.status_code = 503
+    detector._api_client = AoE4WorldClient(url_template=aoe4world_server.url_template, timeout=2)
+    detector._is_detecting = True
+    
+    health = []
+    statuses = []
+    detector.api_health_changed.connect(health.append)
+    detector.status_changed.connect(statuses.append)
+    
+    for _ in range(5):
+        detector._check_api()
+        qtbot.waitUntil(lambda: not detector.is_api_request_in_flight, timeout=2000)
+    
+    assert detector.api_health == "open"
+    assert health == ["open"]
+    assert len(aoe4world_server.requests) == 3
+    assert sum("503" in s for s in statuses) == 2
+    assert detector._api_timer.remainingTime() > 30000
+
+
+def test_restart_while_request_in_flight_keeps_polling(qtbot, detector):
+    """A stale result after stop/start must re-arm the API timer."""
+    client = FakeClient({"ongoing": False})
+    detector._api_client = client
+    detector._process_watcher.check = lambda: True
+    detector._is_game_exe_running = False
+    
+    detector.start_detection()
+    assert detector.is_api_request_in_flight
+    detector.stop_detection()
+    detector.start_detection()
+    assert not detector._api_timer.isActive()
+    
+    client.release.set()
+    qtbot.waitUntil(lambda: not detector.is_api_request_in_flight, timeout=2000)
+    assert detector._api_timer.isActive()
+    assert len(client.calls) == 1
+
+
+def test_discarded_probe_does_not_wedge_breaker(qtbot, qapp):
+    """A half-open probe whose result is discarded must not block later probes."""
+    clock = VirtualClock()
+    detector = GameDetector(clock=clock)
+    detector.profile_id = "12345678"
+    detector._process_watcher.check = lambda: True
+    client = FakeClient()
+    detector._api_client = client
+    for _ in range(3):
+        detector._breaker.record_failure()
+    clock.advance(API_BREAKER_RESET_TIMEOUT)
+    
+    detector.start_detection()
+    assert detector.api_health == "half_open"
+    detector.stop_detection()
+    detector.start_detection()
+    
+    client.release.set()
+    qtbot.waitUntil(lambda: not detector.is_api_request_in_flight, timeout=2000)
+    detector._check_api()
+    assert detector.is_api_request_in_flight
+    qtbot.waitUntil(lambda: detector.api_health == "closed", timeout=2000)
+    assert len(client.calls) == 2
+    detector.shutdown()
@@ -0,0 +1,67 @@
+"""
+Tests for the headless (no widgets) mode.
+"""
+
+import sys
+import os
+import subprocess
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import pytest
+
+from src.headless import HeadlessApp
+
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+
+@pytest.fixture
+def headless(config):
+    config.set("auto_start_detection", False)
+    
+    app = HeadlessApp()
+    yield app
+    app.shutdown()
+
+
+def test_headless_app_loads_no_widgets(tmp_path):
+    code = (
+        "import sys\n"
+        "from PyQt6.QtCore import QCoreApplication\n"
+        "app = QCoreApplication([])\n"
+        "from src.headless import HeadlessApp\n"
+        "headless = HeadlessApp()\n"
+        "headless.handle_command('start')\n"
+        "assert headless.timer_service.is_running\n"
+        "headless.shutdown()\n"
+        "print('loaded:' + ','.join(m for m in ('PyQt6.QtWidgets', 'PyQt6.QtGui') if m in sys.modules))\n"
+    )
+    env = dict(os.environ, APPDATA=str(tmp_path), HOME=str(tmp_path), SDL_AUDIODRIVER="dummy")
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, env=env,
+                            capture_output=True, text=True, timeout=60)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip().splitlines()[-1] == "loaded:"
+
+
+def test_commands_drive_timer_and_statistics(headless):
+    headless.handle_command("start")
+    assert headless.timer_service.is_running
+    assert headless.stats_tracker.is_session_active
+    
+    headless.handle_command("pause")
+    assert headless.timer_service.is_paused
+    headless.handle_command("pause")
+    assert not headless.timer_service.is_paused
+    
+    headless.handle_command("stop")
+    assert not headless.timer_service.is_running
+    assert not headless.stats_tracker.is_session_active
+
+
+def test_timer_alert_is_recorded(headless):
+    headless.handle_command("start")
+    headless.timer_service.alert.emit()
+    
+    assert headless.stats_tracker.session_alerts == 1
+    assert headless.stats_tracker.total_alerts == 1
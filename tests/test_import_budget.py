@@ -0,0 +1,48 @@
+"""
+Import-time budget for the main window.
+
+Cold-imports `src.ui.main_window` in fresh interpreters and fails if it
+pulls in dependencies that should load on first use, or takes longer than
+the budget. See benchmarks/import_time_report.py for the per-module table.
+"""
+
+import sys
+import os
+import statistics
+import subprocess
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# About 100 ms on a developer machine; generous for slow CI runners
+IMPORT_BUDGET_MS = float(os.environ.get("IMPORT_BUDGET_MS", 300))
+LAZY_MODULES = ("requests", "psutil", "pygame", "numpy", "sqlite3",
+                "src.services.control_server", "src.ui.painted_overlay")
+
+
+def cold_import():
+    """Return (cumulative ms, loaded lazy modules) for one fresh interpreter."""
+    code = (
+        "import sys, src.ui.main_window; "
+        f"print(','.join(m for m in {LAZY_MODULES!r} if m in sys.modules))"
+    )
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                            cwd=ROOT, env=env, capture_output=True, text=True, check=True)
+    cumulative_us = None
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and line.rstrip().endswith("| src.ui.main_window"):
+            cumulative_us = int(line.split("|")[1])
+    loaded = [name for name in result.stdout.strip().split(",") if name]
+    return cumulative_us / 1000, loaded
+
+
+def test_heavy_dependencies_are_not_imported_at_startup():
+    _, loaded = cold_import()
+    assert loaded == []
+
+
+def test_main_window_import_within_budget():
+    times = [cold_import()[0] for _ in range(3)]
+    assert statistics.median(times) < IMPORT_BUDGET_MS, f"import took {times} ms"
@@ -0,0 +1,110 @@
+"""
+Tests for MainWindow's lazily built tabs and overlay.
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import pytest
+
+from src.ui.main_window import MainWindow
+from src.ui.settings_panel import SettingsPanel
+from src.ui.statistics_panel import StatisticsPanel
+
+
+@pytest.fixture
+def window(qtbot, config):
+    config.set("auto_start_detection", False)
+    
+    window = MainWindow()
+    qtbot.addWidget(window)
+    yield window
+    window._game_detector.shutdown()
+    window._notification_service.shutdown()
+    window._stats_tracker.close()
+    if window._overlay is not None:
+        window._overlay.close()
+
+
+def test_only_timer_tab_is_built_at_startup(qtbot, window):
+    window.show()
+    qtbot.waitExposed(window)
+    
+    assert window._settings_tab.panel is None
+    assert window._stats_tab.panel is None
+    assert window._overlay is None
+    assert list(window.startup_timings) == ["config", "services", "window", "tray", "ui", "wiring", "detection"]
+
+
+def test_tabs_are_built_and_wired_on_first_select(qtbot, window):
+    window.show()
+    window._tabs.setCurrentIndex(2)
+    assert isinstance(window._stats_tab.panel, StatisticsPanel)
+    assert window._settings_tab.panel is None
+    
+    window._tabs.setCurrentIndex(1)
+    panel = window._settings_tab.panel
+    assert isinstance(panel, SettingsPanel)
+    
+    panel.interval_slider.setValue(30)
+    assert window._timer_service.interval == 30
+
+
+def test_slider_drag_records_one_interval_change(qtbot, window, monkeypatch):
+    recorded = []
+    monkeypatch.setattr(window._stats_tracker, "record_interval_change", recorded.append)
+    window.show()
+    window._tabs.setCurrentIndex(1)
+    slider = window._settings_tab.panel.interval_slider
+    
+    slider.setSliderDown(True)
+    for value in range(26, 41):
+        slider.setValue(value)
+    assert window._timer_service.interval == 40
+    assert recorded == []
+    slider.setSliderDown(False)
+    assert recorded == [40]
+    
+    # Preset buttons and keyboard steps settle immediately
+    slider.setValue(30)
+    assert recorded == [40, 30]
+
+
+def test_overlay_is_created_on_first_show_with_current_state(qtbot, window):
+    window._timer_service.start()
+    assert window._overlay is None
+    
+    window._toggle_overlay()
+    assert window._overlay is not None and window._overlay.isVisible()
+    assert not window._overlay._start_btn.isEnabled()
+    assert window._overlay._stop_btn.isEnabled()
+    window._timer_service.stop()
+
+
+def test_panel_and_overlay_follow_the_villager_reminder(qtbot, window):
+    window._toggle_overlay()
+    window._timer_service.interval = 5
+    window._timer_service.start()
+    
+    def ticked():
+        assert window._timer_panel.timer_label.text() == "4"
+        assert window._overlay._timer_label.text() == "4"
+    
+    qtbot.waitUntil(ticked, timeout=2000)
+    window._timer_service.stop()
+
+
+def test_forwarded_commands_drive_the_timer(qtbot, window):
+    window.handle_command("start")
+    assert window._timer_service.is_running
+    
+    window.handle_command("start")
+    assert window._stats_tracker.is_session_active
+    
+    window.handle_command("stop")
+    assert not window._timer_service.is_running
+    
+    window.handle_command("show")
+    assert window.isVisible()
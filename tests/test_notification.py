@@ -0,0 +1,41 @@
+"""
+Tests for deferred audio initialisation in NotificationService.
+"""
+
+import sys
+import os
+import subprocess
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.services.notification import NotificationService
+
+ROOT = os.path.join(os.path.dirname(__file__), '..')
+
+
+def test_importing_services_does_not_load_pygame():
+    code = "import sys, src.services; print('pygame' in sys.modules)"
+    output = subprocess.run([sys.executable, "-c", code], cwd=ROOT,
+                            capture_output=True, text=True, check=True).stdout
+    assert output.strip() == "False"
+
+
+def test_alert_before_audio_ready_is_queued(qtbot):
+    service = NotificationService()
+    service.popup_enabled = False
+    
+    # First alert starts the backend instead of blocking on it
+    service.notify()
+    service.notify()
+    assert service.pending_alerts == 2
+    
+    with qtbot.waitSignal(service.audio_ready, timeout=5000) as blocker:
+        pass
+    assert blocker.args == [True]
+    assert service.is_audio_ready
+    assert service.pending_alerts == 0
+    assert service.sound_bank.is_loaded("alert")
+    
+    service.notify()
+    assert service.pending_alerts == 0
+    service.shutdown()
@@ -0,0 +1,68 @@
+"""
+Tests for the custom-painted overlay.
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import pytest
+from PyQt6.QtCore import Qt
+
+from src.ui.overlay_widget import OverlayWidget
+from src.ui.painted_overlay import PaintedOverlayWidget
+
+
+@pytest.fixture
+def overlay(qtbot, config):
+    overlay = PaintedOverlayWidget()
+    qtbot.addWidget(overlay)
+    overlay.show()
+    qtbot.waitExposed(overlay)
+    qtbot.waitUntil(lambda: overlay.paint_count > 0)
+    return overlay
+
+
+def test_has_overlay_api():
+    for name in ("update_timer", "set_status", "set_running", "set_paused", "flash_alert", "retranslate_ui",
+                 "closed", "start_clicked", "stop_clicked"):
+        assert hasattr(PaintedOverlayWidget, name), name
+    assert issubclass(PaintedOverlayWidget, OverlayWidget)
+
+
+def test_tick_repaints_only_digits(qtbot, overlay):
+    full_area = overlay.width() * overlay.height()
+    
+    painted = overlay.paint_count
+    overlay.update_timer(24)
+    qtbot.waitUntil(lambda: overlay.paint_count > painted)
+    
+    rect = overlay.last_paint_rect
+    assert rect.width() * rect.height() < full_area / 4
+    assert rect.contains(overlay._digits_rect)
+
+
+def test_unchanged_value_does_not_repaint(qtbot, overlay):
+    overlay.update_timer(20)
+    qtbot.wait(20)
+    painted = overlay.paint_count
+    
+    overlay.update_timer(20)
+    overlay.set_status(overlay._status.text())
+    qtbot.wait(20)
+    assert overlay.paint_count == painted
+
+
+def test_painted_buttons_emit_signals(qtbot, overlay):
+    overlay.set_running(True)
+    with qtbot.waitSignal(overlay.stop_clicked, timeout=1000):
+        qtbot.mouseClick(overlay, Qt.MouseButton.LeftButton, pos=overlay._buttons["stop"].center())
+    
+    overlay.set_running(False)
+    with qtbot.waitSignal(overlay.start_clicked, timeout=1000):
+        qtbot.mouseClick(overlay, Qt.MouseButton.LeftButton, pos=overlay._buttons["start"].center())
+    
+    # Disabled while stopped
+    with qtbot.assertNotEmitted(overlay.stop_clicked):
+        qtbot.mouseClick(overlay, Qt.MouseButton.LeftButton, pos=overlay._buttons["stop"].center())
@@ -0,0 +1,102 @@
+"""
+Tests for the PID-cached game process watcher.
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import psutil
+
+from src.services.process_watcher import ProcessWatcher
+
+
+class FakeProc:
+    def __init__(self, pid, name, create_time):
+        self.pid = pid
+        self.info = {'name': name, 'create_time': create_time}
+    
+    def create_time(self):
+        return self.info['create_time']
+
+
+class FakeProcessTable:
+    """Synthetic process table with psutil-like accessors."""
+    
+    def __init__(self, count=300):
+        self.procs = {pid: FakeProc(pid, f"proc{pid}.exe", 1000.0 + pid) for pid in range(1, count + 1)}
+        self.iter_calls = 0
+    
+    def add(self, pid, name, create_time):
+        self.procs[pid] = FakeProc(pid, name, create_time)
+    
+    def remove(self, pid):
+        del self.procs[pid]
+    
+    def process_iter(self, attrs=None):
+        self.iter_calls += 1
+        return iter(list(self.procs.values()))
+    
+    def process(self, pid):
+        if pid not in self.procs:
+            raise psutil.NoSuchProcess(pid)
+        return self.procs[pid]
+
+
+def make_watcher(table, **kwargs):
+    return ProcessWatcher(
+        executable="RelicCardinal.exe",
+        process_iter=table.process_iter,
+        process_factory=table.process,
+        **kwargs
+    )
+
+
+def test_full_scan_only_until_found():
+    table = FakeProcessTable()
+    table.add(5000, "RelicCardinal.exe", 42.0)
+    watcher = make_watcher(table)
+    
+    assert watcher.check()
+    for _ in range(10):
+        assert watcher.check()
+    
+    assert watcher.pid == 5000
+    assert watcher.full_scan_count == 1
+    assert watcher.alive_check_count == 10
+
+
+def test_detects_exit_and_pid_reuse():
+    table = FakeProcessTable()
+    table.add(5000, "RelicCardinal.exe", 42.0)
+    watcher = make_watcher(table)
+    assert watcher.check()
+    
+    # Same PID reused by another process: create time differs
+    table.add(5000, "notepad.exe", 99.0)
+    assert not watcher.check()
+    assert watcher.pid is None
+    
+    table.remove(5000)
+    assert not watcher.check()
+
+
+def test_scan_interval_backs_off_while_absent():
+    table = FakeProcessTable()
+    watcher = make_watcher(table, scan_min_interval=1000, scan_max_interval=4000,
+                           scan_backoff=2, alive_interval=500)
+    
+    intervals = []
+    for _ in range(4):
+        watcher.check()
+        intervals.append(watcher.next_interval)
+    assert intervals == [2000, 4000, 4000, 4000]
+    
+    table.add(7000, "RelicCardinal.exe", 1.0)
+    assert watcher.check()
+    assert watcher.next_interval == 500
+    
+    table.remove(7000)
+    watcher.check()
+    assert watcher.next_interval == 2000
@@ -0,0 +1,114 @@
+"""
+Tests for the vectorised session analytics.
+"""
+
+import sys
+import os
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import numpy as np
+import pytest
+
+from src.services.stats_tracker import StatsTracker
+from src.services.session_analytics import (
+    SessionAnalytics,
+    SessionColumns,
+    COLUMN_ALERTS,
+    COLUMN_ALERTS_PER_MINUTE,
+    HEATMAP_ALERTS,
+)
+from src.utils.clock import VirtualClock
+
+
+@pytest.fixture
+def clock():
+    # A Monday
+    return VirtualClock(datetime(2024, 1, 1, 20, 0, 0))
+
+
+@pytest.fixture
+def tracker(qapp, clock, tmp_path):
+    tracker = StatsTracker(stats_path=str(tmp_path / "statistics.json"), clock=clock, backend="sqlite")
+    yield tracker
+    tracker.close()
+
+
+def play(tracker, clock, alerts, minutes=20, gap_days=1):
+    tracker.start_session()
+    for _ in range(alerts):
+        clock.advance(minutes * 60 / max(alerts, 1))
+        tracker.record_alert()
+    if not alerts:
+        clock.advance(minutes * 60)
+    tracker.end_session()
+    clock.advance(gap_days * 86400 - minutes * 60)
+
+
+def test_columns_match_history(tracker, clock):
+    for alerts in (10, 20, 40):
+        play(tracker, clock, alerts)
+    
+    cols = SessionAnalytics(tracker).columns()
+    assert len(cols) == 3
+    assert cols.alerts.tolist() == [10, 20, 40]
+    assert cols.alerts_per_minute == pytest.approx([0.5, 1.0, 2.0])
+    assert str(cols.start[0]) == "2024-01-01T20:00:00"
+
+
+def test_zero_duration_sessions_have_zero_rate():
+    cols = SessionColumns.from_history([{"date": "2024-01-01T10:00:00", "duration_seconds": 0, "alerts": 3}])
+    assert cols.alerts_per_minute.tolist() == [0.0]
+    assert len(SessionColumns.from_history([])) == 0
+
+
+def test_statistics_match_reference(tracker, clock):
+    counts = [5, 12, 8, 20, 16, 3, 25]
+    for alerts in counts:
+        play(tracker, clock, alerts)
+    analytics = SessionAnalytics(tracker)
+    
+    assert analytics.percentiles(COLUMN_ALERTS, (50,)) == {50: 12.0}
+    rolling = analytics.rolling_average(COLUMN_ALERTS, window=3)
+    expected = [np.mean(counts[max(0, i - 2):i + 1]) for i in range(len(counts))]
+    assert rolling == pytest.approx(expected)
+    
+    # One session per day from Monday 20:00
+    heatmap = analytics.heatmap(HEATMAP_ALERTS)
+    assert heatmap.shape == (7, 24)
+    assert heatmap[:, 20].tolist() == counts
+    assert heatmap.sum() == sum(counts)
+    
+    slope = analytics.trend(COLUMN_ALERTS)
+    assert slope == pytest.approx(np.polyfit(np.arange(len(counts)), counts, 1)[0])
+
+
+def test_streaks(tracker, clock):
+    for _ in range(3):
+        play(tracker, clock, 5)
+    clock.advance(2 * 86400)  # Skip two days
+    for _ in range(2):
+        play(tracker, clock, 5)
+    analytics = SessionAnalytics(tracker)
+    
+    # The clock is now the day after the last session
+    assert analytics.streaks() == {"longest": 3, "current": 2}
+    assert analytics.streaks(today=np.datetime64("2024-02-01")) == {"longest": 3, "current": 0}
+
+
+def test_results_cached_until_stats_updated(tracker, clock):
+    for alerts in (10, 20):
+        play(tracker, clock, alerts)
+    analytics = SessionAnalytics(tracker)
+    
+    first = analytics.summary()
+    computed = analytics.compute_count
+    assert analytics.summary() is first
+    analytics.heatmap()
+    analytics.heatmap()
+    assert analytics.compute_count == computed + 1
+    
+    play(tracker, clock, 30)
+    assert analytics.summary()["sessions"] == 3
+    assert analytics.percentiles(COLUMN_ALERTS_PER_MINUTE, (50,))[50] == pytest.approx(1.0)
@@ -0,0 +1,48 @@
+"""
+Tests for the packed per-session timeline.
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.services.session_timeline import (
+    SessionTimeline, TimelineEvent,
+    TIMELINE_ALERT, TIMELINE_PAUSE, TIMELINE_RESUME, TIMELINE_INTERVAL
+)
+
+
+def test_round_trip_is_four_bytes_per_event():
+    timeline = SessionTimeline()
+    timeline.append(TIMELINE_INTERVAL, 0, 25)
+    for i in range(1, 145):
+        timeline.append(TIMELINE_ALERT, i * 25)
+    timeline.append(TIMELINE_PAUSE, 3605.3)
+    timeline.append(TIMELINE_RESUME, 3700)
+    
+    assert timeline.nbytes == 4 * 147
+    decoded = SessionTimeline.decode(timeline.encode())
+    assert decoded.events() == timeline.events()
+    assert decoded.alert_offsets()[-1] == 3600.0
+    assert decoded.events()[-2] == TimelineEvent(TIMELINE_PAUSE, 3605.3)
+
+
+def test_interval_drag_is_coalesced():
+    timeline = SessionTimeline()
+    for value, offset in ((26, 10.0), (27, 10.2), (28, 10.5), (35, 30.0)):
+        timeline.append(TIMELINE_INTERVAL, offset, value)
+    assert timeline.events() == [
+        TimelineEvent(TIMELINE_INTERVAL, 10.5, 28),
+        TimelineEvent(TIMELINE_INTERVAL, 30.0, 35),
+    ]
+
+
+def test_paused_seconds_with_open_pause():
+    timeline = SessionTimeline()
+    timeline.append(TIMELINE_PAUSE, 10)
+    timeline.append(TIMELINE_RESUME, 20)
+    timeline.append(TIMELINE_PAUSE, 100)
+    assert timeline.paused_seconds() == 10
+    assert timeline.paused_seconds(session_end=130) == 40
+    assert len(SessionTimeline.decode(None)) == 0
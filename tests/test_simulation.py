@@ -0,0 +1,85 @@
+"""
+Tests for the virtual-clock simulation of the timer/detector/stats pipeline.
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import pytest
+
+from src.services.simulation import (
+    SimulationDriver,
+    SimulationEvent,
+    generate_match_script,
+    SIM_MATCH_START,
+    SIM_MATCH_END,
+    SIM_PAUSE,
+    SIM_RESUME,
+    SIM_INTERVAL,
+)
+from src.services.stats_tracker import StatsTracker
+from src.utils.clock import Clock, VirtualClock
+
+
+@pytest.fixture
+def stats(qapp, tmp_path):
+    clock = VirtualClock()
+    return clock, StatsTracker(stats_path=str(tmp_path / "statistics.json"), clock=clock)
+
+
+def test_forty_minute_match_runs_in_simulated_time(stats):
+    clock, tracker = stats
+    driver = SimulationDriver(clock, stats_tracker=tracker)
+    driver.timer_service.interval = 25
+    
+    report = driver.run([
+        SimulationEvent(0, SIM_MATCH_START),
+        SimulationEvent(2410, SIM_MATCH_END),
+    ])
+    
+    assert report.alerts == 96
+    assert report.alert_times[0] == 25
+    assert report.alert_times[-1] == 2400
+    assert report.speedup > 1000
+    assert tracker.total_alerts == 96
+    assert tracker.get_today_stats()["time_seconds"] == 2410
+
+
+def test_pause_and_interval_change(stats):
+    clock, tracker = stats
+    driver = SimulationDriver(clock)
+    driver.timer_service.interval = 20
+    
+    report = driver.run([
+        SimulationEvent(0, SIM_MATCH_START),
+        SimulationEvent(30, SIM_PAUSE),
+        SimulationEvent(90, SIM_RESUME),
+        SimulationEvent(95, SIM_INTERVAL, 30),
+        SimulationEvent(200, SIM_MATCH_END),
+    ])
+    
+    # 20, 40 (+60 paused -> 100), then 30 s cycles: 130, 160, 190
+    assert report.alert_times == [20, 100, 130, 160, 190]
+
+
+def test_simulation_is_deterministic(qapp):
+    script = generate_match_script(5, seed=7)
+    
+    runs = []
+    for _ in range(2):
+        driver = SimulationDriver(VirtualClock())
+        runs.append(driver.run(script).alert_times)
+    
+    assert runs[0] == runs[1]
+    assert len(runs[0]) > 100
+
+
+def test_incomplete_clock_fails_on_creation():
+    class MonotonicOnly(Clock):
+        def monotonic(self) -> float:
+            return 0.0
+    
+    with pytest.raises(TypeError):
+        MonotonicOnly()
@@ -0,0 +1,86 @@
+"""
+Tests for the single-instance guard and command hand-off.
+"""
+
+import sys
+import os
+import socket
+import subprocess
+import tempfile
+import uuid
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import pytest
+from PyQt6.QtNetwork import QLocalServer
+
+from src.utils.single_instance import (
+    SingleInstance, command_from_args, COMMAND_SHOW, COMMAND_START, COMMAND_STOP
+)
+
+
+ROOT = os.path.join(os.path.dirname(__file__), '..')
+
+
+@pytest.fixture
+def server_name():
+    name = f"aoe4vr-test-{uuid.uuid4().hex[:12]}"
+    yield name
+    QLocalServer.removeServer(name)
+
+
+@pytest.fixture
+def running(qapp, server_name):
+    instance = SingleInstance(server_name)
+    assert instance.listen()
+    yield instance
+    instance.close()
+
+
+def test_command_from_args():
+    assert command_from_args(["main.py"]) == COMMAND_SHOW
+    assert command_from_args(["main.py", "--start"]) == COMMAND_START
+    assert command_from_args(["main.py", "--start", "--stop"]) == COMMAND_STOP
+    assert command_from_args(["main.py", "--unknown"]) == COMMAND_SHOW
+
+
+def test_send_without_running_instance_fails(qapp, server_name):
+    assert not SingleInstance(server_name).send_to_running(COMMAND_SHOW)
+
+
+def test_second_instance_forwards_command(qtbot, running, server_name):
+    second = SingleInstance(server_name)
+    
+    with qtbot.waitSignal(running.command_received, timeout=2000) as blocker:
+        assert second.send_to_running(COMMAND_START)
+    assert blocker.args == [COMMAND_START]
+    assert not second.listen()
+
+
+def test_second_process_hands_off_and_exits(qtbot, running, server_name):
+    script = (
+        "import sys; sys.path.insert(0, '.');"
+        "from src.utils.single_instance import SingleInstance;"
+        f"sys.exit(0 if SingleInstance({server_name!r}).send_to_running('stop') else 1)"
+    )
+    process = subprocess.Popen([sys.executable, "-c", script], cwd=ROOT)
+    
+    with qtbot.waitSignal(running.command_received, timeout=10000) as blocker:
+        pass
+    assert blocker.args == [COMMAND_STOP]
+    assert process.wait(timeout=10) == 0
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="named pipes do not outlive their process")
+def test_stale_socket_is_taken_over(qapp, server_name):
+    # A crashed instance leaves its socket file behind with nobody accepting on it
+    path = os.path.join(tempfile.gettempdir(), server_name)
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(path)
+    stale.close()
+    assert os.path.exists(path)
+    
+    fresh = SingleInstance(server_name)
+    assert fresh.listen()
+    assert fresh.is_listening
+    fresh.close()
@@ -0,0 +1,81 @@
+"""
+Tests for the in-memory alert sound bank.
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import pytest
+import pygame
+
+from src.services.sound_bank import SoundBank
+
+SOUND_FILE = os.path.join(os.path.dirname(__file__), '..', 'assets', 'sounds', 'villager.wav')
+
+
+@pytest.fixture(autouse=True)
+def mixer():
+    if not pygame.mixer.get_init():
+        pygame.mixer.init()
+    yield
+
+
+def test_decodes_once_and_plays_from_memory(monkeypatch):
+    bank = SoundBank()
+    bank.register("alert", SOUND_FILE)
+    bank.preload()
+    assert bank.is_loaded("alert")
+    
+    # No disk access once decoded
+    monkeypatch.setattr(os.path, "exists", lambda path: False)
+    for _ in range(5):
+        assert bank.play("alert", 0.5)
+    assert bank.decode_count == 1
+
+
+def test_invalidated_only_when_path_changes(tmp_path):
+    other = tmp_path / "other.wav"
+    other.write_bytes(open(SOUND_FILE, 'rb').read())
+    bank = SoundBank()
+    bank.register("alert", SOUND_FILE)
+    bank.play("alert")
+    
+    bank.register("alert", SOUND_FILE)
+    assert bank.is_loaded("alert")
+    
+    bank.register("alert", str(other))
+    assert not bank.is_loaded("alert")
+    bank.play("alert")
+    assert bank.decode_count == 2
+
+
+def test_missing_sound_reports_failure():
+    bank = SoundBank()
+    assert not bank.play("alert")
+    bank.register("alert", "does/not/exist.wav")
+    assert not bank.play("alert")
+
+
+def test_file_replaced_during_decode_is_not_cached(tmp_path, monkeypatch):
+    other = tmp_path / "other.wav"
+    other.write_bytes(open(SOUND_FILE, 'rb').read())
+    bank = SoundBank()
+    bank.register("alert", SOUND_FILE)
+    
+    # The GUI thread picks another file while the worker is still decoding
+    decode = pygame.mixer.Sound
+    
+    def slow_decode(path):
+        bank.register("alert", str(other))
+        return decode(path)
+    
+    monkeypatch.setattr(pygame.mixer, "Sound", slow_decode)
+    bank.preload()
+    monkeypatch.setattr(pygame.mixer, "Sound", decode)
+    
+    assert not bank.is_loaded("alert")
+    bank.preload()
+    assert bank.is_loaded("alert")
+    assert bank.decode_count == 2
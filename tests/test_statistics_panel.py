@@ -0,0 +1,108 @@
+"""
+Tests for the statistics panel's visibility-aware refresh.
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import pytest
+
+from src.services.stats_tracker import StatsTracker
+from src.ui.statistics_panel import StatisticsPanel, StatCard
+from src.utils.clock import VirtualClock
+
+
+@pytest.fixture
+def clock():
+    return VirtualClock()
+
+
+@pytest.fixture
+def tracker(qapp, clock, tmp_path):
+    tracker = StatsTracker(stats_path=str(tmp_path / "statistics.json"), clock=clock)
+    yield tracker
+    tracker.close()
+
+
+@pytest.fixture
+def panel(qtbot, tracker):
+    panel = StatisticsPanel(tracker)
+    qtbot.addWidget(panel)
+    return panel
+
+
+def test_stat_card_skips_unchanged_text(qapp):
+    card = StatCard("Alerts")
+    assert card.set_value("3")
+    assert not card.set_value("3")
+    assert card.value_label.text() == "3"
+
+
+def test_hidden_panel_does_no_refresh_work(panel, tracker, clock):
+    tracker.start_session()
+    for _ in range(20):
+        clock.advance(25)
+        tracker.record_alert()
+    
+    assert panel.refresh_count == 0
+    assert panel.skipped_refreshes == 20
+    assert not panel._refresh_timer.isActive()
+
+
+def test_panel_catches_up_when_shown(panel, tracker, clock):
+    tracker.start_session()
+    for _ in range(3):
+        clock.advance(25)
+        tracker.record_alert()
+    
+    panel.show()
+    assert panel.total_alerts_card.value_label.text() == "3"
+    assert panel.session_alerts_card.value_label.text() == "3"
+    assert panel.session_duration_card.value_label.text() == "1:15"
+    assert panel._refresh_timer.isActive()
+    
+    panel.hide()
+    assert not panel._refresh_timer.isActive()
+
+
+def test_refresh_timer_runs_only_during_sessions(panel, tracker, clock):
+    panel.show()
+    assert not panel._refresh_timer.isActive()
+    
+    tracker.start_session()
+    assert panel._refresh_timer.isActive()
+    
+    clock.advance(60)
+    tracker.end_session()
+    assert not panel._refresh_timer.isActive()
+    assert panel.today_sessions_card.value_label.text() == "1"
+
+
+def test_trends_are_computed_when_shown_and_cached(panel, tracker, clock):
+    tracker.start_session()
+    for _ in range(4):
+        clock.advance(15)
+        tracker.record_alert()
+    tracker.end_session()
+    assert panel.analytics is None
+    
+    panel.show()
+    assert panel.median_rate_card.value_label.text() == "4.0"
+    assert panel.streak_card.value_label.text() == "1"
+    assert panel.best_streak_card.value_label.text() == "1"
+    computed = panel.analytics.compute_count
+    
+    # Tab switches reuse the cached results
+    panel.hide()
+    panel._stale = True
+    panel.show()
+    assert panel.analytics.compute_count == computed
+    
+    tracker.start_session()
+    clock.advance(60)
+    tracker.record_alert()
+    tracker.end_session()
+    assert panel.median_rate_card.value_label.text() == "2.5"
+    assert panel.analytics.compute_count > computed
@@ -0,0 +1,62 @@
+"""
+Tests for the prefix-sum daily statistics rollup.
+"""
+
+import sys
+import os
+import random
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import pytest
+
+from src.services.stats_rollup import DailyRollup
+
+
+def brute_force(daily, start, end):
+    result = {"alerts": 0, "time_seconds": 0, "sessions": 0}
+    for day, stats in daily.items():
+        if start.isoformat() <= day <= end.isoformat():
+            for key in result:
+                result[key] += stats[key]
+    return result
+
+
+def random_daily(rng, days=400):
+    origin = date(2023, 1, 1)
+    daily = {}
+    for _ in range(days // 2):
+        day = (origin + timedelta(days=rng.randrange(days))).isoformat()
+        daily[day] = {"alerts": rng.randrange(200), "time_seconds": rng.randrange(20000), "sessions": rng.randrange(8)}
+    return origin, daily
+
+
+def test_ranges_match_brute_force():
+    rng = random.Random(3)
+    origin, daily = random_daily(rng)
+    rollup = DailyRollup(daily.items())
+    
+    for _ in range(300):
+        start = origin + timedelta(days=rng.randrange(-30, 430))
+        end = start + timedelta(days=rng.randrange(-5, 200))
+        assert rollup.range(start, end) == brute_force(daily, start, end)
+
+
+@pytest.mark.parametrize("offset", [0, 1, -1, -100, 500])
+def test_incremental_adds_match_rebuild(offset):
+    rng = random.Random(offset)
+    origin, daily = random_daily(rng)
+    rollup = DailyRollup(daily.items())
+    
+    day = origin + timedelta(days=200 + offset)
+    rollup.add(day, 7, 300, 1)
+    stats = daily.setdefault(day.isoformat(), {"alerts": 0, "time_seconds": 0, "sessions": 0})
+    stats["alerts"] += 7
+    stats["time_seconds"] += 300
+    stats["sessions"] += 1
+    
+    rebuilt = DailyRollup(daily.items())
+    everything = (origin - timedelta(days=1000), origin + timedelta(days=2000))
+    assert rollup.range(*everything) == rebuilt.range(*everything)
+    assert rollup.range(day, day) == daily[day.isoformat()]
@@ -0,0 +1,220 @@
+"""
+Tests for journaled statistics persistence and crash recovery.
+"""
+
+import sys
+import os
+import json
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import pytest
+
+from src.services.stats_tracker import StatsTracker
+from src.utils.clock import VirtualClock
+
+
+@pytest.fixture
+def clock():
+    return VirtualClock()
+
+
+@pytest.fixture
+def stats_path(tmp_path):
+    return str(tmp_path / "statistics.json")
+
+
+def journal_lines(stats_path):
+    with open(stats_path + ".journal", encoding='utf-8') as f:
+        return f.read().splitlines()
+
+
+def test_alerts_append_to_journal_without_rewriting_snapshot(qapp, clock, stats_path):
+    tracker = StatsTracker(stats_path=stats_path, clock=clock)
+    tracker.start_session()
+    for _ in range(20):
+        clock.advance(25)
+        tracker.record_alert()
+    
+    assert tracker.snapshot_count == 0
+    assert len(journal_lines(stats_path)) == 21
+    
+    clock.advance(10)
+    tracker.end_session()
+    assert tracker.snapshot_count == 1
+    assert journal_lines(stats_path) == []
+    
+    with open(stats_path, encoding='utf-8') as f:
+        snapshot = json.load(f)
+    assert snapshot["total_alerts"] == 20
+    assert snapshot["session_history"][-1]["duration_seconds"] == 510
+    tracker.close()
+
+
+def test_crashed_session_is_recovered_on_load(qapp, clock, stats_path):
+    tracker = StatsTracker(stats_path=stats_path, clock=clock)
+    tracker.start_session()
+    for _ in range(3):
+        clock.advance(25)
+        tracker.record_alert()
+    # Crash: no end_session, plus a torn half-written record
+    tracker._journal.close()
+    with open(stats_path + ".journal", 'a', encoding='utf-8') as f:
+        f.write('{"seq":5,"kind":"al')
+    
+    recovered = StatsTracker(stats_path=stats_path, clock=clock)
+    assert recovered.total_sessions == 1
+    assert recovered.total_alerts == 3
+    assert recovered.total_game_time == 75
+    session = recovered._stats["session_history"][0]
+    assert recovered.get_session_timeline(session).alert_offsets() == [25, 50, 75]
+    del session["timeline"]
+    assert recovered._stats["session_history"] == [
+        {"date": "2024-01-01T12:00:00", "duration_seconds": 75.0, "alerts": 3}
+    ]
+    assert recovered.get_today_stats()["sessions"] == 1
+    assert journal_lines(stats_path) == []
+    recovered.close()
+
+
+def test_torn_line_does_not_swallow_next_record(qapp, clock, stats_path):
+    with open(stats_path + ".journal", 'w', encoding='utf-8') as f:
+        f.write('{"seq":1,"kind":"sta')
+    
+    tracker = StatsTracker(stats_path=stats_path, clock=clock)
+    tracker.start_session()
+    for _ in range(2):
+        clock.advance(25)
+        tracker.record_alert()
+    tracker._journal.close()
+    
+    recovered = StatsTracker(stats_path=stats_path, clock=clock)
+    assert recovered.total_sessions == 1
+    assert recovered.total_alerts == 2
+    recovered.close()
+
+
+def test_idle_compaction_keeps_open_session(qapp, clock, stats_path):
+    tracker = StatsTracker(stats_path=stats_path, clock=clock)
+    tracker.start_session()
+    clock.advance(25)
+    tracker.record_alert()
+    tracker.compact()
+    clock.advance(25)
+    tracker.record_alert()
+    tracker._journal.close()
+    
+    # Records after the snapshot are replayed on top of the open session
+    recovered = StatsTracker(stats_path=stats_path, clock=clock)
+    assert recovered.total_alerts == 2
+    assert recovered._stats["session_history"][-1]["alerts"] == 2
+    assert recovered.total_game_time == 50
+    
+    # Sequence numbers continue across compactions
+    recovered.start_session()
+    recovered.record_alert()
+    recovered._journal.close()
+    again = StatsTracker(stats_path=stats_path, clock=clock)
+    assert again.total_sessions == 2
+    assert again.total_alerts == 3
+    again.close()
+
+
+def play_sessions(tracker, clock, count, alerts=2, gap_hours=12):
+    for _ in range(count):
+        tracker.start_session()
+        for _ in range(alerts):
+            clock.advance(25)
+            tracker.record_alert()
+        clock.advance(gap_hours * 3600 - alerts * 25)
+        tracker.end_session()
+
+
+def test_json_stats_migrate_to_sqlite(qapp, clock, stats_path):
+    tracker = StatsTracker(stats_path=stats_path, clock=clock)
+    play_sessions(tracker, clock, 4)
+    tracker.close()
+    
+    migrated = StatsTracker(stats_path=stats_path, clock=clock, backend="sqlite")
+    assert migrated.total_sessions == 4
+    assert migrated.total_alerts == 8
+    assert migrated.total_game_time == tracker.total_game_time
+    assert migrated.get_weekly_stats() == tracker.get_weekly_stats()
+    assert migrated.get_session_history() == tracker.get_session_history()
+    
+    # Import happens only once
+    play_sessions(migrated, clock, 1)
+    migrated.close()
+    reopened = StatsTracker(stats_path=stats_path, clock=clock, backend="sqlite")
+    assert reopened.total_sessions == 5
+    reopened.close()
+
+
+def test_sqlite_keeps_full_history_and_range_queries(qapp, clock, stats_path):
+    from datetime import date, datetime
+    
+    tracker = StatsTracker(stats_path=stats_path, clock=clock, backend="sqlite")
+    play_sessions(tracker, clock, 120)
+    
+    assert len(tracker.get_session_history()) == 120
+    assert len(tracker.get_session_history(limit=10)) == 10
+    # Two sessions per day from 2024-01-01 12:00, each ending on the next half-day
+    assert tracker.get_range_stats(date(2024, 1, 5), date(2024, 1, 6)) == {
+        "alerts": 8, "time_seconds": 4 * 12 * 3600.0, "sessions": 4
+    }
+    assert len(tracker.get_session_history(datetime(2024, 1, 5), datetime(2024, 1, 7))) == 4
+    tracker.close()
+
+
+def test_sqlite_recovers_crashed_session(qapp, clock, stats_path):
+    tracker = StatsTracker(stats_path=stats_path, clock=clock, backend="sqlite")
+    tracker.start_session()
+    for _ in range(3):
+        clock.advance(25)
+        tracker.record_alert()
+    tracker.store.close()
+    
+    recovered = StatsTracker(stats_path=stats_path, clock=clock, backend="sqlite")
+    history = recovered.get_session_history()
+    assert recovered.get_session_timeline(history[0]).alert_offsets() == [25, 50, 75]
+    del history[0]["timeline"]
+    assert history == [
+        {"date": "2024-01-01T12:00:00", "duration_seconds": 75.0, "alerts": 3}
+    ]
+    assert recovered.get_today_stats() == {"alerts": 3, "time_seconds": 75.0, "sessions": 1}
+    recovered.close()
+
+
+@pytest.mark.parametrize("backend", ["json", "sqlite"])
+def test_session_timeline_survives_restart(qapp, clock, stats_path, backend):
+    from src.services.session_timeline import (
+        TimelineEvent, TIMELINE_ALERT, TIMELINE_PAUSE, TIMELINE_RESUME, TIMELINE_INTERVAL
+    )
+    
+    tracker = StatsTracker(stats_path=stats_path, clock=clock, backend=backend)
+    tracker.start_session(25)
+    clock.advance(25)
+    tracker.record_alert()
+    clock.advance(5)
+    tracker.record_pause()
+    clock.advance(40.5)
+    tracker.record_resume()
+    tracker.record_interval_change(30)
+    clock.advance(30)
+    tracker.record_alert()
+    clock.advance(10)
+    tracker.end_session()
+    tracker.close()
+    
+    reopened = StatsTracker(stats_path=stats_path, clock=clock, backend=backend)
+    timeline = reopened.get_session_timeline(reopened.get_session_history()[-1])
+    assert timeline.events() == [
+        TimelineEvent(TIMELINE_INTERVAL, 0.0, 25),
+        TimelineEvent(TIMELINE_ALERT, 25.0),
+        TimelineEvent(TIMELINE_PAUSE, 30.0),
+        TimelineEvent(TIMELINE_RESUME, 70.5),
+        TimelineEvent(TIMELINE_INTERVAL, 70.5, 30),
+        TimelineEvent(TIMELINE_ALERT, 100.5),
+    ]
+    assert timeline.paused_seconds() == 40.5
+    reopened.close()
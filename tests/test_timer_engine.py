@@ -0,0 +1,148 @@
+"""
+Tests for the multi-reminder TimerEngine.
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import pytest
+
+from src.services.timer_engine import TimerEngine
+from src.utils.clock import VirtualClock
+
+
+@pytest.fixture
+def clock():
+    return VirtualClock()
+
+
+@pytest.fixture
+def engine(qapp, clock):
+    service = TimerEngine(clock=clock)
+    yield service
+    service.clear()
+
+
+def run_until(engine, clock, end):
+    """Jump the clock from wakeup to wakeup until `end`."""
+    while engine.next_wake_time is not None and engine.next_wake_time <= end:
+        clock.advance_to(engine.next_wake_time)
+        engine.process_wakeup()
+    clock.advance_to(end)
+
+
+def test_alerts_in_deadline_order_with_payloads(engine, clock):
+    alerts = []
+    engine.alert.connect(lambda timer_id, payload: alerts.append((clock.monotonic(), timer_id, payload)))
+    engine.add_timer("villager", 25, payload={"sound": "villager"})
+    engine.add_timer("scout", 60, payload="scout")
+    
+    run_until(engine, clock, 120)
+    
+    assert alerts == [
+        (25, "villager", {"sound": "villager"}),
+        (50, "villager", {"sound": "villager"}),
+        (60, "scout", "scout"),
+        (75, "villager", {"sound": "villager"}),
+        (100, "villager", {"sound": "villager"}),
+        (120, "scout", "scout"),
+    ]
+
+
+def test_one_wakeup_per_distinct_deadline(engine, clock):
+    # Ten reminders sharing the same deadline cost one wakeup, not ten
+    for i in range(10):
+        engine.add_timer(f"r{i}", 30)
+    
+    run_until(engine, clock, 90)
+    
+    assert engine.wakeup_count == 3
+    assert all(engine.alert_count(f"r{i}") == 3 for i in range(10))
+
+
+def test_pause_resume_and_remove(engine, clock):
+    alerts = []
+    engine.alert.connect(lambda timer_id, payload: alerts.append((clock.monotonic(), timer_id)))
+    engine.add_timer("a", 10)
+    engine.add_timer("b", 10)
+    
+    run_until(engine, clock, 4)
+    engine.pause("a")
+    run_until(engine, clock, 14)
+    engine.resume("a")
+    engine.remove_timer("b")
+    run_until(engine, clock, 30)
+    
+    assert engine.remaining("a") == 10
+    assert alerts == [(10, "b"), (20, "a"), (30, "a")]
+    assert not engine.has_timer("b")
+
+
+def test_subscribers_get_ticks_for_their_timer_only(engine, clock):
+    villager_ticks, scout_alerts = [], []
+    engine.add_timer("villager", 3)
+    engine.add_timer("scout", 5, payload="scout")
+    unsubscribe = engine.subscribe("villager", on_tick=villager_ticks.append)
+    engine.subscribe("scout", on_alert=scout_alerts.append)
+    
+    run_until(engine, clock, 6)
+    
+    assert villager_ticks == [2, 1, 0, 3, 2, 1, 0, 3]
+    assert scout_alerts == ["scout"]
+    
+    unsubscribe()
+    run_until(engine, clock, 9)
+    assert villager_ticks == [2, 1, 0, 3, 2, 1, 0, 3]
+
+
+def test_unsubscribed_timers_wake_only_on_alerts(engine, clock):
+    engine.add_timer("villager", 25)
+    run_until(engine, clock, 250)
+    assert engine.wakeup_count == 10
+
+
+def test_stall_alerts_once_and_keeps_phase(engine, clock):
+    engine.add_timer("villager", 10)
+    clock.advance(35)
+    engine.process_wakeup()
+    assert engine.alert_count("villager") == 1
+    assert engine.next_wake_time == 40
+
+
+def test_last_unsubscribe_drops_per_second_wakeups(engine, clock):
+    engine.add_timer("villager", 25)
+    unsubscribe = engine.subscribe("villager", on_tick=lambda seconds: None)
+    assert engine.next_wake_time == 1
+    
+    unsubscribe()
+    assert engine.next_wake_time == 25
+    run_until(engine, clock, 50)
+    assert engine.wakeup_count == 2
+
+
+def test_remove_timer_drops_its_subscribers(engine, clock):
+    ticks = []
+    engine.add_timer("scout", 5)
+    engine.subscribe("scout", on_tick=ticks.append, on_alert=ticks.append)
+    engine.remove_timer("scout")
+    assert "scout" not in engine._tick_subscribers
+    assert "scout" not in engine._alert_subscribers
+    
+    # A new reminder under the same id starts without the old views
+    engine.add_timer("scout", 5)
+    run_until(engine, clock, 10)
+    assert ticks == []
+
+
+def test_restart_keeps_counters(engine, clock):
+    engine.add_timer("villager", 10)
+    clock.advance(35)
+    engine.process_wakeup()
+    clock.advance(3)
+    engine.restart("villager")
+    
+    assert engine.remaining("villager") == 10
+    assert engine.alert_count("villager") == 1
+    assert engine.missed_alerts("villager") == 2
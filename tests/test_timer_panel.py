@@ -0,0 +1,66 @@
+"""
+Tests for TimerPanel's state-change-only styling and progress animation.
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import pytest
+from PyQt6.QtCore import QAbstractAnimation
+
+from src.ui.timer_panel import TimerPanel, PROGRESS_SCALE
+
+
+@pytest.fixture
+def panel(qtbot):
+    panel = TimerPanel()
+    qtbot.addWidget(panel)
+    panel.show()
+    qtbot.waitExposed(panel)
+    return panel
+
+
+def test_low_colour_restyles_only_on_threshold_crossing(panel):
+    panel.update_button_states(True)
+    for _ in range(3):
+        for seconds in range(25, -1, -1):
+            panel.update_timer(seconds, 25)
+    
+    # Into and out of the red range once per countdown (the last one stays red)
+    assert panel.restyle_count == 5
+    assert panel.timer_label.property("low") is True
+    assert panel.timer_label.text() == "0"
+
+
+def test_progress_animates_within_the_current_second(panel):
+    panel.update_button_states(True)
+    panel.update_timer(20, 25)
+    
+    animation = panel._progress_animation
+    assert animation.state() == QAbstractAnimation.State.Running
+    assert animation.startValue() == 20 * PROGRESS_SCALE
+    assert animation.endValue() == 19 * PROGRESS_SCALE
+    assert panel.progress_bar.maximum() == 25 * PROGRESS_SCALE
+
+
+def test_pause_and_stop_hold_the_bar(qtbot, panel):
+    panel.update_button_states(True)
+    panel.update_timer(20, 25)
+    qtbot.wait(100)
+    
+    panel.set_paused(True)
+    held = panel.progress_bar.value()
+    assert 19 * PROGRESS_SCALE < held < 20 * PROGRESS_SCALE
+    qtbot.wait(50)
+    assert panel.progress_bar.value() == held
+    
+    # Resuming finishes the rest of the second, not a whole one
+    panel.set_paused(False)
+    assert panel._progress_animation.duration() < 1000
+    
+    panel.update_button_states(False)
+    panel.update_timer(25, 25)
+    assert panel._progress_animation.state() == QAbstractAnimation.State.Stopped
+    assert panel.progress_bar.value() == panel.progress_bar.maximum()
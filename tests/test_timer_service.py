@@ -0,0 +1,107 @@
+"""
+Tests for TimerService deadline scheduling, including injected event-loop stalls.
+"""
+
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import pytest
+from PyQt6.QtCore import QTimer
+
+from src.services.timer_service import TimerService
+from src.utils.clock import VirtualClock
+
+
+@pytest.fixture
+def clock():
+    return VirtualClock()
+
+
+@pytest.fixture
+def timer(qapp, clock):
+    service = TimerService(clock=clock)
+    service.interval = 5
+    yield service
+    service.stop()
+
+
+def test_remaining_derived_from_clock(timer, clock):
+    ticks = []
+    timer.tick.connect(ticks.append)
+    timer.start()
+    
+    for _ in range(5):
+        clock.advance(1)
+        timer.process_wakeup()
+    
+    assert ticks == [5, 4, 3, 2, 1, 0, 5]
+    assert timer.alert_count == 1
+
+
+def test_stall_is_compensated_not_lost(timer, clock):
+    alerts = []
+    timer.alert.connect(lambda: alerts.append(clock.monotonic()))
+    timer.start()
+    start = clock.monotonic()
+    
+    # Event loop blocked for 3.6 s: the countdown must still reflect real time
+    clock.advance(3.6)
+    timer.process_wakeup()
+    assert timer.remaining == 2
+    assert timer.missed_ticks >= 2
+    
+    clock.advance_to(start + 5)
+    timer.process_wakeup()
+    assert alerts == [start + 5]
+
+
+def test_long_sleep_alerts_once_and_keeps_phase(timer, clock):
+    timer.start()
+    start = clock.monotonic()
+    
+    # System sleep spanning several intervals
+    clock.advance(23)
+    timer.process_wakeup()
+    
+    assert timer.alert_count == 1
+    assert timer.missed_alerts == 3
+    assert timer.remaining == 2  # next deadline at start + 25
+
+
+def test_pause_freezes_remaining(timer, clock):
+    timer.start()
+    clock.advance(2.5)
+    timer.pause()
+    clock.advance(100)
+    assert timer.remaining == 3
+    timer.resume()
+    clock.advance(2.5)
+    timer.process_wakeup()
+    assert timer.alert_count == 1
+
+
+def test_alert_timing_error_bounded_under_stalls(qtbot, qapp):
+    """Real event loop with injected stalls: alerts stay on their deadlines."""
+    service = TimerService()
+    service.interval = 2
+    alert_times = []
+    service.alert.connect(lambda: alert_times.append(time.monotonic()))
+    
+    def stall():
+        time.sleep(1.3)
+    
+    start = time.monotonic()
+    service.start()
+    # Stall from 0.3 s to 1.6 s, then a short one across the second deadline
+    QTimer.singleShot(300, stall)
+    QTimer.singleShot(3800, lambda: time.sleep(0.15))
+    
+    qtbot.waitUntil(lambda: len(alert_times) >= 2, timeout=6000)
+    service.stop()
+    
+    errors = [abs((t - start) - 2 * (i + 1)) for i, t in enumerate(alert_times[:2])]
+    assert max(errors) < 0.25
+    assert service.missed_ticks >= 1